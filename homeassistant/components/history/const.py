@@ -1,7 +1,19 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The historical part of a history stream is fetched and sent in partitions
+# so memory use does not grow with the number of entities or the time range.
+# The time window of a partition is resized after each fetch so the next
+# one holds about HISTORY_STREAM_PARTITION_STATES states.
+HISTORY_STREAM_ENTITY_CHUNK_SIZE = 64
+HISTORY_STREAM_PARTITION_STATES = 5000
+HISTORY_STREAM_TIME_WINDOW = timedelta(days=1)
+HISTORY_STREAM_MIN_TIME_WINDOW = timedelta(minutes=1)
+HISTORY_STREAM_MAX_TIME_WINDOW_GROWTH = 16
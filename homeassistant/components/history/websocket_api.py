@@ -36,9 +36,18 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_ENTITY_CHUNK_SIZE,
+    HISTORY_STREAM_MAX_TIME_WINDOW_GROWTH,
+    HISTORY_STREAM_MIN_TIME_WINDOW,
+    HISTORY_STREAM_PARTITION_STATES,
+    HISTORY_STREAM_TIME_WINDOW,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,6 +62,8 @@ class HistoryLiveStream:
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
+    # The queue is not limited while the client paces the historical states
+    max_pending_states: int | None = None
 
 
 @callback
@@ -72,6 +83,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    sampling: timedelta | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -88,6 +100,7 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                sampling,
             ),
         )
     )
@@ -103,6 +116,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("sampling"): vol.All(vol.Coerce(int), vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -154,6 +168,9 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    sampling: timedelta | None = None
+    if sampling_seconds := msg.get("sampling"):
+        sampling = timedelta(seconds=sampling_seconds)
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,6 +184,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            sampling,
         )
     )
 
@@ -221,8 +239,12 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
-    """Generate a historical response."""
+) -> tuple[float, dt | None, bytes | None, int]:
+    """Generate a historical response.
+
+    Returns the time of the last state, the time the response ends, the
+    response and the number of states in it.
+    """
     states = cast(
         dict[str, list[dict[str, Any]]],
         history.get_significant_states(
@@ -239,7 +261,9 @@ def _generate_historical_response(
         ),
     )
     last_time_ts = 0.0
+    state_count = 0
     for state_list in states.values():
+        state_count += len(state_list)
         if (
             state_list
             and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
@@ -252,7 +276,7 @@ def _generate_historical_response(
         # so the websocket client knows it should render/process/consume the
         # data.
         if not send_empty:
-            return last_time_ts, None, None
+            return last_time_ts, None, None, 0
         last_time_dt = end_time
     else:
         last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
@@ -261,6 +285,7 @@ def _generate_historical_response(
         last_time_ts,
         last_time_dt,
         _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        state_count,
     )
 
 
@@ -270,31 +295,88 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The history is fetched in partitions of entities and time windows and
+    each partition is sent as soon as it is ready so only one partition is
+    held in memory at a time. The next partition is only fetched once the
+    client has received the previous one.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_time_ts = 0.0
+    last_time_dt: dt | None = None
+    for chunk_entity_ids in chunked_or_all(
+        entity_ids, HISTORY_STREAM_ENTITY_CHUNK_SIZE
+    ):
+        window_start = start_time
+        window = HISTORY_STREAM_TIME_WINDOW
+        window_include_start_time_state = include_start_time_state
+        while True:
+            await connection.async_wait_for_drain()
+            if msg_id not in connection.subscriptions:
+                # Unsubscribe happened while waiting for the client
+                return None
+            window_end = min(window_start + window, end_time)
+            (
+                window_last_time_ts,
+                window_last_time_dt,
+                payload,
+                state_count,
+            ) = await instance.async_add_executor_job(
+                _generate_historical_response,
+                hass,
+                msg_id,
+                window_start,
+                window_end,
+                chunk_entity_ids,
+                window_include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                False,
+            )
+            if payload:
+                if msg_id not in connection.subscriptions:
+                    # Unsubscribe happened while fetching the partition
+                    return None
+                connection.send_message(payload)
+            if window_last_time_ts > last_time_ts:
+                last_time_ts = window_last_time_ts
+                last_time_dt = window_last_time_dt
+            if window_end == end_time:
+                break
+            # The queries exclude both ends of the window so step back
+            # one microsecond to include states exactly on the boundary
+            window_start = window_end - timedelta(microseconds=1)
+            window_include_start_time_state = False
+            # Sparse ranges are covered with few fetches and dense ones
+            # do not build partitions much larger than the target
+            window = max(
+                window
+                * min(
+                    HISTORY_STREAM_MAX_TIME_WINDOW_GROWTH,
+                    HISTORY_STREAM_PARTITION_STATES / max(state_count, 1),
+                ),
+                HISTORY_STREAM_MIN_TIME_WINDOW,
+            )
+
+    if last_time_ts == 0:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        if send_empty:
+            connection.send_message(
+                _generate_websocket_response(msg_id, start_time, end_time, {})
+            )
+        return None
+    return last_time_dt
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -473,7 +555,7 @@ async def ws_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
+    stream_queue: asyncio.Queue[Event] = asyncio.Queue()
     live_stream = HistoryLiveStream(
         subscriptions=subscriptions, stream_queue=stream_queue
     )
@@ -500,14 +582,15 @@ async def ws_stream(
     @callback
     def _queue_or_cancel(event: Event) -> None:
         """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
+        if (
+            max_pending_states := live_stream.max_pending_states
+        ) is not None and stream_queue.qsize() >= max_pending_states:
             _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_HISTORY_STATES,
+                "Client exceeded max pending messages of %s", max_pending_states
             )
             _unsub()
+            return
+        stream_queue.put_nowait(event)
 
     _async_subscribe_events(
         hass,
@@ -539,6 +622,9 @@ async def ws_stream(
         # Unsubscribe happened while sending historical states
         return
 
+    # The events queued while the historical states were sent
+    # are consumed first
+    live_stream.max_pending_states = stream_queue.qsize() + MAX_PENDING_HISTORY_STATES
     live_stream.task = create_eager_task(
         _async_events_consumer(
             subscriptions_setup_complete_time,
@@ -33,6 +33,7 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, Unauthorized, UnknownUser
 from homeassistant.helpers import config_validation as cv, recorder, restore_state
 from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.loop_monitor import async_get_loop_monitor
 from homeassistant.helpers.service import (
     async_extract_config_entry_ids,
     async_extract_referenced_entity_ids,
@@ -386,6 +387,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
     hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
     async_set_stop_handler(hass, _async_stop)
 
+    # The lag of the event loop heartbeat is reported in system health
+    async_get_loop_monitor(hass).async_start()
+
     return True
 
 
@@ -7,6 +7,10 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.loop_monitor import (
+    LAG_HISTOGRAM_BOUNDS,
+    async_get_loop_monitor,
+)
 
 
 @callback
@@ -21,7 +25,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
-    return {
+    health_info: dict[str, Any] = {
         "version": f"core-{info.get('version')}",
         "installation_type": info.get("installation_type"),
         "dev": info.get("dev"),
@@ -36,3 +40,23 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
     }
+
+    # The heartbeat of the event loop is monitored once the
+    # homeassistant integration is set up
+    if any((stats := async_get_loop_monitor(hass).stats).lag_histogram):
+        buckets = [f"<={bound * 1000:g} ms" for bound in LAG_HISTOGRAM_BOUNDS]
+        buckets.append(f">{LAG_HISTOGRAM_BOUNDS[-1] * 1000:g} ms")
+        health_info["event_loop_lag"] = ", ".join(
+            f"{bucket}: {count}"
+            for bucket, count in zip(buckets, stats.lag_histogram, strict=True)
+        )
+        health_info["event_loop_stalls"] = stats.stalls
+        if stats.owners:
+            (integration, job), _ = max(
+                stats.owners.items(), key=lambda item: item[1].samples
+            )
+            health_info["event_loop_slowest_job"] = (
+                f"{job} ({integration or 'core'})"
+            )
+
+    return health_info
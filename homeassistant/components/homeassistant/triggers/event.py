@@ -7,10 +7,16 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
+from homeassistant.helpers.event import async_track_event_data
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
@@ -165,9 +171,28 @@ async def async_attach_trigger(
             event.context,
         )
 
+    @callback
+    def handle_keyed_event(event: Event) -> None:
+        """Handle an event with the keyed value and check the rest of the data."""
+        if filter_event(event.data):
+            handle_event(event)
+
     event_filter = filter_event if event_data_items or event_data_schema else None
+    # Index the listener by a string in the event data, so firing an event
+    # does not have to run the filter of every trigger for the event type
+    keyed_item = next(
+        (
+            (key, value)
+            for key, value in (event_data_items or ())
+            if isinstance(value, str)
+        ),
+        None,
+    )
     removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
+        async_track_event_data(hass, event_type, *keyed_item, handle_keyed_event)
+        # Events cannot be tracked by data for all event types
+        if keyed_item and event_type != MATCH_ALL
+        else hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
         for event_type in event_types
     ]
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections import deque
 import functools
 from itertools import chain
@@ -190,7 +189,8 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
-    platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # Discovery payloads waiting for the set up of their component
+    platform_setup_payloads: dict[str, list[MQTTDiscoveryPayload]] = {}
     integration_discovery_messages: dict[str, int] = {}
 
     @callback
@@ -205,16 +205,23 @@ async def async_start(  # noqa: C901
             hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
         )
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
-            if component not in mqtt_data.platforms_loaded:
-                await async_forward_entry_setup_and_setup_discovery(
-                    hass, config_entry, {component}
+    async def _async_component_setup(component: str) -> None:
+        """Perform component set up and add the components discovered meanwhile."""
+        try:
+            await async_forward_entry_setup_and_setup_discovery(
+                hass, config_entry, {component}
+            )
+        except BaseException:
+            # Finish the discovery of the waiting payloads so the updates
+            # queued for them are not held back forever
+            for discovery_payload in platform_setup_payloads.pop(component):
+                discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None
                 )
-        _async_add_component(discovery_payload)
+            raise
+        for discovery_payload in platform_setup_payloads.pop(component):
+            _async_add_component(discovery_payload)
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
@@ -321,10 +328,13 @@ async def async_start(  # noqa: C901
             }
 
         if component not in mqtt_data.platforms_loaded and payload:
-            # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            # Load component first, the component is set up once and the
+            # payloads received while it loads are added together
+            if (setup_payloads := platform_setup_payloads.get(component)) is None:
+                platform_setup_payloads[component] = [payload]
+                config_entry.async_create_task(hass, _async_component_setup(component))
+            else:
+                setup_payloads.append(payload)
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
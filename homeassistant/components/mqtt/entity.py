@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from collections.abc import Callable, Coroutine
 from functools import partial
 import logging
@@ -242,38 +243,82 @@ def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    # Discovery payloads received since the last batch of entities was added
+    discovery_payloads: list[MQTTDiscoveryPayload] = []
+    discovery_batch_handle: asyncio.Handle | None = None
+
+    @callback
+    def _async_setup_entities_from_discovery() -> None:
+        """Set up the MQTT entities discovered since the last batch."""
+        nonlocal discovery_batch_handle
+        discovery_batch_handle = None
+        batch = discovery_payloads.copy()
+        discovery_payloads.clear()
+        entities: list[Entity] = []
+        for discovery_payload in batch:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                discovered_class = entity_class
+                if schema_class_mapping is not None:
+                    discovered_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert discovered_class is not None
+                entities.append(
+                    discovered_class(
+                        hass, config, entry, discovery_payload.discovery_data
+                    )
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                _handle_discovery_failure(hass, discovery_payload)
+                _LOGGER.exception(
+                    "Error setting up MQTT %s from discovery payload %s",
+                    domain,
+                    discovery_payload,
+                )
+        if entities:
+            async_add_entities(entities)
 
     @callback
     def _async_setup_entity_entry_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
     ) -> None:
-        """Set up an MQTT entity from discovery."""
-        nonlocal entity_class
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            if schema_class_mapping is not None:
-                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-            if TYPE_CHECKING:
-                assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+        """Queue an MQTT entity discovered for set up.
+
+        Retained discovery messages arrive in bursts when connecting to the
+        broker, the entities discovered in the same event loop iteration are
+        validated and added together.
+        """
+        nonlocal discovery_batch_handle
+        discovery_payloads.append(discovery_payload)
+        if discovery_batch_handle is None:
+            discovery_batch_handle = hass.loop.call_soon(
+                _async_setup_entities_from_discovery
             )
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
 
-    mqtt_data.reload_dispatchers.append(
-        async_dispatcher_connect(
-            hass,
-            MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_entity_entry_from_discovery,
+    @callback
+    def _async_cancel_discovery_batch() -> None:
+        """Drop the discovered entities which are not set up yet."""
+        nonlocal discovery_batch_handle
+        if discovery_batch_handle is not None:
+            discovery_batch_handle.cancel()
+            discovery_batch_handle = None
+        discovery_payloads.clear()
+
+    mqtt_data.reload_dispatchers.extend(
+        (
+            async_dispatcher_connect(
+                hass,
+                MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
+                _async_setup_entity_entry_from_discovery,
+            ),
+            _async_cancel_discovery_batch,
         )
     )
 
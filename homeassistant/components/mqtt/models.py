@@ -47,6 +47,8 @@ class PayloadSentinel(StrEnum):
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
+# Variables exposing the received payload to value templates
+PAYLOAD_VARIABLES = ("value", "value_json")
 
 type PublishPayloadType = str | bytes | int | float | None
 
@@ -269,6 +271,17 @@ class MqttValueTemplate:
         self._value_template = value_template
         self._config_attributes = config_attributes
         self._entity = entity
+        # The last rendered payload is reused while the payload is unchanged
+        # if the template only depends on the payload
+        self._payload_only: bool | None = None
+        self._last_render: (
+            tuple[
+                ReceivePayloadType,
+                ReceivePayloadType | PayloadSentinel,
+                ReceivePayloadType,
+            ]
+            | None
+        ) = None
 
     @callback
     def async_render_with_possible_json_value(
@@ -283,6 +296,19 @@ class MqttValueTemplate:
         if self._value_template is None:
             return payload
 
+        if self._payload_only is None:
+            self._payload_only = self._value_template.depends_only_on(
+                PAYLOAD_VARIABLES
+            )
+        if (
+            self._payload_only
+            and (last_render := self._last_render) is not None
+            and type(last_render[0]) is type(payload)
+            and last_render[0] == payload
+            and last_render[1] == default
+        ):
+            return last_render[2]
+
         values: dict[str, Any] = {}
 
         if variables is not None:
@@ -321,6 +347,8 @@ class MqttValueTemplate:
                     payload=payload,
                     entity_id=self._entity.entity_id if self._entity else None,
                 ) from exc
+            if self._payload_only:
+                self._last_render = (payload, default, rendered_payload)
             return rendered_payload
 
         _LOGGER.debug(
@@ -347,6 +375,8 @@ class MqttValueTemplate:
                 payload=payload,
                 entity_id=self._entity.entity_id if self._entity else None,
             ) from exc
+        if self._payload_only:
+            self._last_render = (payload, default, rendered_payload)
         return rendered_payload
 
 
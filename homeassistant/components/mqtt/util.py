@@ -145,6 +145,101 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A level of a topic trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicTrie[_T]:
+    """Match topics against MQTT topic filters.
+
+    The topic filters are split in levels and stored in a trie, so matching
+    a topic only visits the levels of the topic instead of every topic filter.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.add(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        node = self._root
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        # Prune the levels which are no longer used by any topic filter
+        for parent, level in reversed(path):
+            node = parent.children[level]
+            if node.values or node.children:
+                break
+            del parent.children[level]
+
+    def contains(self, topic_filter: str) -> bool:
+        """Return if any value was added for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the topic filters matching a topic.
+
+        Wildcards at the first level do not match topics starting with $.
+        """
+        matches: list[_T] = []
+        nodes = [self._root]
+        for index, level in enumerate(topic.split("/")):
+            wildcards = index > 0 or not level.startswith("$")
+            next_nodes: list[_TopicTrieNode[_T]] = []
+            for node in nodes:
+                children = node.children
+                if wildcards and (multi_level := children.get("#")) is not None:
+                    matches.extend(multi_level.values)
+                # A "#" topic level is only matched by the "#" child above
+                child = None if level == "#" else children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+                if (
+                    wildcards
+                    and (single_level := children.get("+")) is not None
+                    and single_level is not child
+                ):
+                    next_nodes.append(single_level)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+        for node in nodes:
+            matches.extend(node.values)
+            # A multi-level wildcard also matches its parent level
+            if (multi_level := node.children.get("#")) is not None:
+                matches.extend(multi_level.values)
+        return matches
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
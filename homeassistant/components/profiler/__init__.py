@@ -23,7 +23,11 @@ from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_get_template_render_stats,
+    async_set_template_profiling,
+    async_track_time_interval,
+)
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
@@ -40,6 +44,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_SET_TEMPLATE_PROFILING = "set_template_profiling"
+SERVICE_LOG_TEMPLATE_RENDER_STATS = "log_template_render_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +69,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_SET_TEMPLATE_PROFILING,
+    SERVICE_LOG_TEMPLATE_RENDER_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -273,6 +281,17 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_template_profiling(call: ServiceCall) -> None:
+        """Enable or disable profiling tracked templates."""
+        enabled = call.data[CONF_ENABLED]
+        _LOGGER.critical("Setting template profiling to %s", enabled)
+        async_set_template_profiling(hass, enabled)
+
+    async def _async_dump_template_render_stats(call: ServiceCall) -> None:
+        """Log the render stats of the tracked templates."""
+        for template_stats in async_get_template_render_stats(hass):
+            _LOGGER.critical("Template render stats: %s", template_stats)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +401,21 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_SET_TEMPLATE_PROFILING,
+        _async_template_profiling,
+        schema=vol.Schema({vol.Optional(CONF_ENABLED, default=True): cv.boolean}),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_TEMPLATE_RENDER_STATS,
+        _async_dump_template_render_stats,
+    )
+
     return True
 
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -77,7 +77,7 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBExecutorJobTimings, DBInterruptibleThreadPoolExecutor
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -88,6 +88,7 @@ from .migration import (
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .spool import SPOOL_DIR, RecorderSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -103,6 +104,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DrainSpoolTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
@@ -149,6 +151,18 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# While events are spooled to disk, the buffered events are written out every
+# SPOOL_CHECK_INTERVAL and the spool is drained once the queue has fewer than
+# SPOOL_DRAIN_MAX_BACKLOG items left.
+SPOOL_CHECK_INTERVAL = timedelta(seconds=10)
+SPOOL_DRAIN_MAX_BACKLOG = 1000
+
+# When the queue backs up past BULK_PROCESS_MIN_BACKLOG, the recorder drains
+# up to BULK_PROCESS_MAX_ITEMS tasks and events at a time and resolves the
+# ids for the whole batch with bulk queries instead of one query per event.
+BULK_PROCESS_MIN_BACKLOG = 100
+BULK_PROCESS_MAX_ITEMS = 1000
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -173,6 +187,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        spool_events: bool,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -186,10 +201,14 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
-        self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        # State changes fired together are queued as one list of events
+        self._queue: queue.SimpleQueue[RecorderTask | Event | list[Event]] = (
+            queue.SimpleQueue()
+        )
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.spool_events = spool_events
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -220,6 +239,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_during_period_cache = statistics.StatisticsDuringPeriodCache()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -229,9 +249,23 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.executor_job_timings = DBExecutorJobTimings()
 
         self._event_listener: CALLBACK_TYPE | None = None
+        self._state_changed_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
+        self._put_event: Callable[[RecorderTask | Event], None] = (
+            self._queue.put_nowait
+        )
+        self._put_events: Callable[[list[Event]], None] = self._queue.put_nowait
+        self._spool = RecorderSpool(self, hass.config.path(SPOOL_DIR))
+        # Events waiting to be written to the spool, None when not spooling
+        self._spool_buffer: list[Event] | None = None
+        self._spool_watcher: CALLBACK_TYPE | None = None
+        self._spool_write: asyncio.Future[None] | None = None
+        self._spool_writes = 0
+        self._spool_writes_before_drain = 0
+        self._spool_drain_queued = False
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
@@ -302,39 +336,58 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
             """Listen for new events and put them in the process queue."""
-            if event.event_type in exclude_event_types:
+            event_type = event.event_type
+            # State changes are queued by _state_changed_listener
+            if event_type == EVENT_STATE_CHANGED or event_type in exclude_event_types:
                 return
 
             if entity_filter is None or not (
                 entity_id := event.data.get(ATTR_ENTITY_ID)
             ):
-                queue_put(event)
+                self._put_event(event)
                 return
 
             if isinstance(entity_id, str):
                 if entity_filter(entity_id):
-                    queue_put(event)
+                    self._put_event(event)
                 return
 
             if isinstance(entity_id, list):
                 for eid in entity_id:
                     if entity_filter(eid):
-                        queue_put(event)
+                        self._put_event(event)
                         return
                 return
 
             # Unknown what it is.
-            queue_put(event)
+            self._put_event(event)
+
+        @callback
+        def _state_changed_listener(
+            events: list[Event[EventStateChangedData]],
+        ) -> None:
+            """Put the state changes fired together in the process queue at once."""
+            if entity_filter is not None:
+                events = [
+                    event for event in events if entity_filter(event.data["entity_id"])
+                ]
+            if len(events) > 1:
+                self._put_events(cast(list[Event], events))
+            elif events:
+                self._put_event(events[0])
 
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL,
             _event_listener,
         )
+        if EVENT_STATE_CHANGED not in exclude_event_types:
+            self._state_changed_listener = self.hass.bus.async_listen_batch(
+                EVENT_STATE_CHANGED, _state_changed_listener
+            )
         self._queue_watcher = async_track_time_interval(
             self.hass,
             self._async_check_queue,
@@ -363,7 +416,13 @@ class Recorder(threading.Thread):
         self, target: Callable[..., _T], *args: Any
     ) -> asyncio.Future[_T]:
         """Add an executor job from within the event loop."""
-        return self.hass.loop.run_in_executor(self._db_executor, target, *args)
+        return self.hass.loop.run_in_executor(
+            self._db_executor,
+            self.executor_job_timings.run_timed,
+            time.monotonic(),
+            target,
+            *args,
+        )
 
     @callback
     def _async_check_queue(self, *_: Any) -> None:
@@ -374,6 +433,9 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
         if not self._reached_max_backlog():
             return
+        if self.spool_events:
+            self._async_start_spooling()
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -385,6 +447,90 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_start_spooling(self) -> None:
+        """Spool new events to disk until the backlog has been recorded."""
+        if self._spool_buffer is not None:
+            return
+        _LOGGER.warning(
+            "The recorder backlog queue reached the maximum size of %s events; "
+            "new events will be spooled to %s until the recorder catches up",
+            self.backlog,
+            self._spool.path,
+        )
+        self._spool_buffer = []
+        self._put_event = self._spool_buffer.append
+        self._put_events = self._spool_buffer.extend
+        self._spool_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_spool,
+            SPOOL_CHECK_INTERVAL,
+            name="Recorder spool watcher",
+        )
+
+    @callback
+    def _async_stop_spooling(self) -> None:
+        """Put new events in the queue again."""
+        self._spool_buffer = None
+        self._put_event = self._queue.put_nowait
+        self._put_events = self._queue.put_nowait
+        if self._spool_watcher:
+            self._spool_watcher()
+            self._spool_watcher = None
+
+    @callback
+    def _async_check_spool(self, *_: Any) -> None:
+        """Write the buffered events to the spool and drain it when possible."""
+        if self._spool_buffer and not self._spool_write:
+            events = self._spool_buffer.copy()
+            # The buffer is cleared in place since new events are appended to it
+            self._spool_buffer.clear()
+            self._spool_write = self.hass.async_add_executor_job(
+                self._spool.write, events
+            )
+            self._spool_write.add_done_callback(self._async_spool_written)
+        if not self._spool_drain_queued and self.backlog < SPOOL_DRAIN_MAX_BACKLOG:
+            self._spool_drain_queued = True
+            self._spool_writes_before_drain = self._spool_writes
+            self.queue_task(DrainSpoolTask())
+
+    @callback
+    def _async_spool_written(self, future: asyncio.Future[None]) -> None:
+        """Handle a finished write to the spool."""
+        self._spool_write = None
+        self._spool_writes += 1
+        if not future.cancelled() and (err := future.exception()):
+            _LOGGER.error("Error writing events to the recorder spool: %s", err)
+
+    @callback
+    def _async_spool_drained(self, drained: bool) -> None:
+        """Stop spooling once every spooled event has been recorded."""
+        self._spool_drain_queued = False
+        if (
+            not drained
+            or self._spool_buffer is None
+            or self._spool_write
+            or self._spool_writes != self._spool_writes_before_drain
+        ):
+            # Segments written while draining will be drained next time
+            return
+        # Nothing is left in the spool so the buffered events are the
+        # oldest events which are not recorded yet
+        for event in self._spool_buffer:
+            self._queue.put_nowait(event)
+        self._async_stop_spooling()
+        _LOGGER.info("The recorder caught up and stopped spooling events")
+
+    async def _async_write_spool_at_shutdown(self) -> None:
+        """Write the buffered events to the spool to record them at the next start."""
+        if self._spool_write:
+            with contextlib.suppress(Exception):
+                await self._spool_write
+        events = self._spool_buffer
+        self._async_stop_spooling()
+        if events:
+            await self.hass.async_add_executor_job(self._spool.write, events)
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -410,6 +556,9 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._state_changed_listener:
+            self._state_changed_listener()
+            self._state_changed_listener = None
 
     @callback
     def _async_stop_listeners(self) -> None:
@@ -450,6 +599,8 @@ class Recorder(threading.Thread):
         """Shut down the Recorder at final write."""
         if not self._hass_started.done():
             self._hass_started.set_result(SHUTDOWN_TASK)
+        if self._spool_buffer is not None:
+            await self._async_write_spool_at_shutdown()
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
@@ -829,9 +980,15 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        # Events spooled before the last shutdown are older than anything
+        # in the queue
+        self._drain_spool()
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
-            startup_task_or_events.append(task_or_event)
+            if type(task_or_event) is list:
+                startup_task_or_events.extend(task_or_event)
+            else:
+                startup_task_or_events.append(task_or_event)
         self._pre_process_startup_events(startup_task_or_events)
         for task in startup_task_or_events:
             self._guarded_process_one_task_or_event_or_recover(task)
@@ -842,18 +999,85 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            task_or_event = queue_.get()
+            if (
+                type(task_or_event) is not list
+                and queue_.qsize() < BULK_PROCESS_MIN_BACKLOG
+            ):
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                continue
+            self._process_backlog_batch(task_or_event)
+
+    def _process_backlog_batch(
+        self, task_or_event: RecorderTask | Event | list[Event]
+    ) -> None:
+        """Drain a batch from the queue and process it with bulk id resolution."""
+        queue_ = self._queue
+        task_or_events: list[RecorderTask | Event] = []
+        while True:
+            if type(task_or_event) is list:
+                task_or_events.extend(task_or_event)
+            else:
+                task_or_events.append(task_or_event)
+            if len(task_or_events) >= BULK_PROCESS_MAX_ITEMS or queue_.empty():
+                break
+            task_or_event = queue_.get_nowait()
+        try:
+            self._pre_process_events(task_or_events)
+        except SQLAlchemyError:
+            # The ids will be resolved one event at a time instead
+            _LOGGER.exception("Error while pre processing a batch of events")
+        for task_or_event in task_or_events:
+            self._guarded_process_one_task_or_event_or_recover(task_or_event)
+            if self.stop_requested:
+                return
+
+    def _drain_spool(self) -> bool:
+        """Record the events spooled to disk, oldest segment first.
+
+        Returns False if a segment could not be recorded. That segment is
+        set aside so it is not drained again.
+        """
+        spool = self._spool
+        for segment in spool.segments():
+            try:
+                self._record_spool_segment(segment)
+            except Exception:
+                _LOGGER.exception("Error recording spooled events from %s", segment)
+                spool.quarantine(segment)
+                return False
+            spool.remove(segment)
+        return True
+
+    def _record_spool_segment(self, segment: str) -> None:
+        """Record the events of a spool segment and commit them."""
+        events = self._spool.read(segment)
+        try:
+            self._pre_process_events(events)
+        except SQLAlchemyError:
+            # The ids will be resolved one event at a time instead
+            _LOGGER.exception("Error while pre processing spooled events")
+        for event in events:
+            self._guarded_process_one_task_or_event_or_recover(event)
+        # The segment is only removed once its events are committed
+        self._commit_event_session_or_retry()
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
     ) -> None:
         """Pre process startup events."""
+        self._pre_process_events(startup_task_or_events)
+
+    def _pre_process_events(
+        self, task_or_events: Sequence[RecorderTask | Event[Any]]
+    ) -> None:
+        """Pre process a batch of events."""
         # Prime all the state_attributes and event_data caches
         # before we start processing events
         state_change_events: list[Event[EventStateChangedData]] = []
         non_state_change_events: list[Event] = []
 
-        for task_or_event in startup_task_or_events:
+        for task_or_event in task_or_events:
             # Event is never subclassed so we can
             # use a fast type check
             if type(task_or_event) is Event:
@@ -897,6 +1121,8 @@ class Recorder(threading.Thread):
             if task.commit_before:
                 self._commit_event_session_or_retry()
             task.run(self)
+            # Statistics modified by the task have been committed
+            self.statistics_during_period_cache.invalidate_modified()
         except exc.DatabaseError as err:
             if self._handle_database_error(err, setup_run=True):
                 return
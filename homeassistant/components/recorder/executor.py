@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from concurrent.futures.thread import _threads_queues, _worker
+from dataclasses import dataclass
+from functools import partial
 import threading
+import time
 from typing import Any
 import weakref
 
@@ -71,3 +74,58 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+@dataclass(slots=True)
+class DBExecutorJobStats:
+    """Timing statistics for one kind of database executor job."""
+
+    count: int = 0
+    run_time: float = 0.0
+    max_run_time: float = 0.0
+    wait_time: float = 0.0
+
+
+class DBExecutorJobTimings:
+    """Track the time jobs spend waiting for and running in the database executor."""
+
+    def __init__(self) -> None:
+        """Init the job timings."""
+        self._lock = threading.Lock()
+        self.jobs: dict[str, DBExecutorJobStats] = {}
+
+    def run_timed[_T](
+        self, queued_at: float, target: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run a job in the executor and record how long it waited and ran."""
+        started_at = time.monotonic()
+        try:
+            return target(*args)
+        finally:
+            self._record(target, started_at - queued_at, time.monotonic() - started_at)
+
+    def _record(
+        self, target: Callable[..., Any], wait_time: float, run_time: float
+    ) -> None:
+        """Record the timing of a finished job."""
+        while isinstance(target, partial):
+            target = target.func
+        name = getattr(target, "__qualname__", None) or type(target).__name__
+        with self._lock:
+            if (stats := self.jobs.get(name)) is None:
+                stats = self.jobs[name] = DBExecutorJobStats()
+            stats.count += 1
+            stats.run_time += run_time
+            stats.wait_time += wait_time
+            if run_time > stats.max_run_time:
+                stats.max_run_time = run_time
+
+    def snapshot(self) -> dict[str, DBExecutorJobStats]:
+        """Return a copy of the timings of all jobs."""
+        with self._lock:
+            return {
+                name: DBExecutorJobStats(
+                    stats.count, stats.run_time, stats.max_run_time, stats.wait_time
+                )
+                for name, stats in self.jobs.items()
+            }
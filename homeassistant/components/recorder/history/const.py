@@ -19,3 +19,7 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# Bucket sizes (in seconds) available to sample numeric states in long-range
+# history queries, ordered from the coarsest to the finest.
+SAMPLING_BUCKET_SECONDS = (3600, 300)
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import groupby
 from operator import itemgetter
 from typing import Any, cast
 
 from sqlalchemy import (
     CompoundSelect,
+    Integer,
+    Numeric,
     Select,
     Subquery,
     and_,
+    cast as sql_cast,
     func,
     lambda_stmt,
     literal,
@@ -22,12 +25,19 @@ from sqlalchemy import (
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.components.sensor import ATTR_STATE_CLASS
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION
+from ..const import LAST_REPORTED_SCHEMA_VERSION, SupportedDialect
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
@@ -41,6 +51,7 @@ from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
+    SAMPLING_BUCKET_SECONDS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
 )
@@ -51,6 +62,9 @@ _FIELD_MAP = {
     "last_updated_ts": 2,
 }
 
+# States of sampled entities which are always kept
+_UNSAMPLED_STATES = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
 
 def _stmt_and_join_attributes(
     no_attributes: bool,
@@ -117,6 +131,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    sampling: timedelta | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -132,7 +147,109 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            sampling,
+        )
+
+
+def _sampling_bucket_seconds(sampling: timedelta | None) -> int | None:
+    """Return the coarsest bucket size that still satisfies the sampling interval."""
+    if sampling is None:
+        return None
+    sampling_seconds = sampling.total_seconds()
+    for bucket_seconds in SAMPLING_BUCKET_SECONDS:
+        if bucket_seconds <= sampling_seconds:
+            return bucket_seconds
+    return None
+
+
+def _sampled_metadata_ids(
+    hass: HomeAssistant, entity_id_to_metadata_id: dict[str, int | None]
+) -> list[int]:
+    """Return the metadata_ids of the entities with numeric states.
+
+    Only entities with a state class or a unit are sampled, the states
+    of other entities are not numeric and every change is kept.
+    """
+    return [
+        metadata_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+        and (state := hass.states.get(entity_id)) is not None
+        and (
+            ATTR_STATE_CLASS in state.attributes
+            or ATTR_UNIT_OF_MEASUREMENT in state.attributes
+        )
+    ]
+
+
+def _significant_changes_filter(
+    stmt: Select, metadata_ids_in_significant_domains: list[int]
+) -> Select:
+    """Filter the statement down to significant state changes."""
+    # Since we are filtering on entity_id (metadata_id) we can avoid
+    # the join of the states_meta table since we already know which
+    # metadata_ids are in the significant domains.
+    if metadata_ids_in_significant_domains:
+        return stmt.filter(
+            States.metadata_id.in_(metadata_ids_in_significant_domains)
+            | (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
         )
+    return stmt.filter(
+        (States.last_changed_ts == States.last_updated_ts)
+        | States.last_changed_ts.is_(None)
+    )
+
+
+def _sampled_state_ids_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    sampled_metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    bucket_seconds: int,
+    floor_by_cast: bool,
+) -> Select:
+    """Select the minimum, maximum and last state of every entity and bucket."""
+    if floor_by_cast:
+        # SQLite may be built without FLOOR, casting truncates which
+        # is the same as flooring the positive timestamps
+        bucket = sql_cast(States.last_updated_ts / bucket_seconds, Integer)
+    else:
+        # Casting rounds on the other databases
+        bucket = func.floor(States.last_updated_ts / bucket_seconds)
+    # MariaDB before 10.4.5 cannot cast to a float, all databases
+    # can cast to a decimal
+    value = sql_cast(States.state, Numeric(38, 10))
+    partition_by = (States.metadata_id, bucket)
+    stmt = select(
+        States.state_id,
+        func.row_number()
+        .over(partition_by=partition_by, order_by=(value, States.state_id))
+        .label("min_rank"),
+        func.row_number()
+        .over(partition_by=partition_by, order_by=(value.desc(), States.state_id))
+        .label("max_rank"),
+        func.row_number()
+        .over(
+            partition_by=partition_by,
+            order_by=(States.last_updated_ts.desc(), States.state_id.desc()),
+        )
+        .label("last_rank"),
+    )
+    if significant_changes_only:
+        stmt = _significant_changes_filter(stmt, metadata_ids_in_significant_domains)
+    stmt = (
+        stmt.filter(States.metadata_id.in_(sampled_metadata_ids))
+        .filter(States.state.not_in(_UNSAMPLED_STATES))
+        .filter(States.last_updated_ts > start_time_ts)
+    )
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    ranked = stmt.subquery()
+    return select(ranked.c.state_id).where(
+        (ranked.c.min_rank == 1) | (ranked.c.max_rank == 1) | (ranked.c.last_rank == 1)
+    )
 
 
 def _significant_states_stmt(
@@ -145,30 +262,39 @@ def _significant_states_stmt(
     no_attributes: bool,
     include_start_time_state: bool,
     run_start_ts: float | None,
+    sampled_metadata_ids: list[int],
+    bucket_seconds: int | None,
+    floor_by_cast: bool,
 ) -> Select | CompoundSelect:
     """Query the database for significant state changes."""
     include_last_changed = not significant_changes_only
     stmt = _stmt_and_join_attributes(no_attributes, include_last_changed, False)
     if significant_changes_only:
-        # Since we are filtering on entity_id (metadata_id) we can avoid
-        # the join of the states_meta table since we already know which
-        # metadata_ids are in the significant domains.
-        if metadata_ids_in_significant_domains:
-            stmt = stmt.filter(
-                States.metadata_id.in_(metadata_ids_in_significant_domains)
-                | (States.last_changed_ts == States.last_updated_ts)
-                | States.last_changed_ts.is_(None)
-            )
-        else:
-            stmt = stmt.filter(
-                (States.last_changed_ts == States.last_updated_ts)
-                | States.last_changed_ts.is_(None)
-            )
+        stmt = _significant_changes_filter(stmt, metadata_ids_in_significant_domains)
     stmt = stmt.filter(States.metadata_id.in_(metadata_ids)).filter(
         States.last_updated_ts > start_time_ts
     )
     if end_time_ts:
         stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if bucket_seconds:
+        # The database does the reduction instead of shipping every row
+        # to Python. States which are not numeric are always kept so
+        # unavailable periods remain visible.
+        stmt = stmt.filter(
+            States.metadata_id.not_in(sampled_metadata_ids)
+            | States.state.in_(_UNSAMPLED_STATES)
+            | States.state_id.in_(
+                _sampled_state_ids_stmt(
+                    start_time_ts,
+                    end_time_ts,
+                    sampled_metadata_ids,
+                    metadata_ids_in_significant_domains,
+                    significant_changes_only,
+                    bucket_seconds,
+                    floor_by_cast,
+                )
+            )
+        )
     if not no_attributes:
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
@@ -213,6 +339,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    sampling: timedelta | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -224,6 +351,12 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    sampling is an optional interval between the data points the caller
+    needs. When it is at least as large as one of the sampling buckets, only
+    the minimum, maximum and last state of each entity with numeric states
+    in every bucket are returned. Every change of the other entities and
+    every unavailable or unknown state is still returned.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
@@ -254,6 +387,12 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    sampled_metadata_ids: list[int] = []
+    if bucket_seconds := _sampling_bucket_seconds(sampling):
+        sampled_metadata_ids = _sampled_metadata_ids(hass, entity_id_to_metadata_id)
+        if not sampled_metadata_ids:
+            bucket_seconds = None
+    floor_by_cast = instance.dialect_name == SupportedDialect.SQLITE
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -265,6 +404,9 @@ def get_significant_states_with_session(
             no_attributes,
             include_start_time_state,
             run_start_ts,
+            sampled_metadata_ids,
+            bucket_seconds,
+            floor_by_cast,
         ),
         track_on=[
             bool(single_metadata_id),
@@ -273,6 +415,8 @@ def get_significant_states_with_session(
             significant_changes_only,
             no_attributes,
             include_start_time_state,
+            bool(bucket_seconds),
+            floor_by_cast,
         ],
     )
     return _sorted_states_to_dict(
@@ -22,13 +22,15 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_before,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
-    delete_statistics_short_term_rows,
+    delete_statistics_short_term_rows_before,
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
@@ -37,7 +39,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
-    find_short_term_statistics_to_purge,
+    find_oldest_short_term_statistics_start_ts,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -52,6 +54,10 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Short term statistics are deleted by start_ts range one window at a time
+# until a purge cycle has deleted about SHORT_TERM_STATISTICS_ROWS_PER_PURGE rows
+SHORT_TERM_STATISTICS_PURGE_WINDOW = 3600
+SHORT_TERM_STATISTICS_ROWS_PER_PURGE = 100000
 
 
 @retryable_database_job("purge")
@@ -96,16 +102,14 @@ def purge_old_data(
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
+        has_more_to_purge |= _purge_short_term_statistics(
+            instance, session, purge_before
+        )
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        if has_more_to_purge or statistics_runs:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -193,13 +197,13 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+        state_ids, attributes_ids, range_end_ts = (
+            _select_state_attributes_ids_to_purge(session, purge_before, max_bind_vars)
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
-        _purge_state_ids(instance, session, state_ids)
+        _purge_state_ids(instance, session, state_ids, range_end_ts)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -228,13 +232,13 @@ def _purge_events_and_data_ids(
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(
+        event_ids, data_ids, range_end_ts = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(session, event_ids, range_end_ts)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -245,15 +249,41 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _batch_range_end_ts(
+    timestamps: list[float], purge_before_ts: float, max_bind_vars: int
+) -> float | None:
+    """Return the end of the time range covered by a batch of rows.
+
+    The rows must be ordered by time. Every row before the returned end is
+    in the batch, rows at the end itself may have been cut off by the limit
+    and are left for the next batch. None is returned if all rows in the
+    batch have the same time.
+    """
+    if len(timestamps) < max_bind_vars:
+        return purge_before_ts
+    if (range_end_ts := timestamps[-1]) == timestamps[0]:
+        return None
+    return range_end_ts
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of state and attribute ids to purge."""
+) -> tuple[set[int], set[int], float | None]:
+    """Return sets of state and attribute ids to purge.
+
+    Also returns the end of the last_updated_ts range the state ids cover,
+    or None if they must be deleted by id.
+    """
     state_ids = set()
     attributes_ids = set()
-    for state_id, attributes_id in session.execute(
-        find_states_to_purge(purge_before.timestamp(), max_bind_vars)
-    ).all():
+    purge_before_ts = purge_before.timestamp()
+    rows = session.execute(find_states_to_purge(purge_before_ts, max_bind_vars)).all()
+    range_end_ts = _batch_range_end_ts(
+        [row[2] for row in rows], purge_before_ts, max_bind_vars
+    )
+    for state_id, attributes_id, last_updated_ts in rows:
+        if range_end_ts is not None and last_updated_ts >= range_end_ts:
+            break
         state_ids.add(state_id)
         if attributes_id:
             attributes_ids.add(attributes_id)
@@ -262,25 +292,34 @@ def _select_state_attributes_ids_to_purge(
         len(state_ids),
         len(attributes_ids),
     )
-    return state_ids, attributes_ids
+    return state_ids, attributes_ids, range_end_ts
 
 
 def _select_event_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of event and data ids to purge."""
+) -> tuple[set[int], set[int], float | None]:
+    """Return sets of event and data ids to purge.
+
+    Also returns the end of the time_fired_ts range the event ids cover,
+    or None if they must be deleted by id.
+    """
     event_ids = set()
     data_ids = set()
-    for event_id, data_id in session.execute(
-        find_events_to_purge(purge_before.timestamp(), max_bind_vars)
-    ).all():
+    purge_before_ts = purge_before.timestamp()
+    rows = session.execute(find_events_to_purge(purge_before_ts, max_bind_vars)).all()
+    range_end_ts = _batch_range_end_ts(
+        [row[2] for row in rows], purge_before_ts, max_bind_vars
+    )
+    for event_id, data_id, time_fired_ts in rows:
+        if range_end_ts is not None and time_fired_ts >= range_end_ts:
+            break
         event_ids.add(event_id)
         if data_id:
             data_ids.add(data_id)
     _LOGGER.debug(
         "Selected %s event ids and %s data_ids to remove", len(event_ids), len(data_ids)
     )
-    return event_ids, data_ids
+    return event_ids, data_ids, range_end_ts
 
 
 def _select_unused_attributes_ids(
@@ -443,17 +482,6 @@ def _select_statistics_runs_to_purge(
     return statistic_runs_list
 
 
-def _select_short_term_statistics_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
-) -> list[int]:
-    """Return a list of short term statistics to purge."""
-    statistics = session.execute(
-        find_short_term_statistics_to_purge(purge_before, max_bind_vars)
-    ).all()
-    _LOGGER.debug("Selected %s short term statistics to remove", len(statistics))
-    return [statistic_id for (statistic_id,) in statistics]
-
-
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -509,8 +537,17 @@ def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     return event_ids, state_ids, attributes_ids, data_ids
 
 
-def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
-    """Disconnect states and delete by state id."""
+def _purge_state_ids(
+    instance: Recorder,
+    session: Session,
+    state_ids: set[int],
+    range_end_ts: float | None = None,
+) -> None:
+    """Disconnect states and delete by state id.
+
+    If range_end_ts is given the state ids are all the states last updated
+    before it and they are deleted by range instead.
+    """
     if not state_ids:
         return
 
@@ -521,7 +558,10 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     disconnected_rows = session.execute(disconnect_states_rows(state_ids))
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
-    deleted_rows = session.execute(delete_states_rows(state_ids))
+    if range_end_ts is None:
+        deleted_rows = session.execute(delete_states_rows(state_ids))
+    else:
+        deleted_rows = session.execute(delete_states_rows_before(range_end_ts))
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
     # Evict eny entries in the old_states cache referring to a purged state
@@ -561,20 +601,54 @@ def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None
 
 
 def _purge_short_term_statistics(
-    session: Session, short_term_statistics: list[int]
-) -> None:
-    """Delete by id."""
-    deleted_rows = session.execute(
-        delete_statistics_short_term_rows(short_term_statistics)
-    )
-    _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Delete by start_ts range, starting from the oldest row.
+
+    Rows are deleted directly in the database one window at a time so the
+    work done per purge cycle is proportional to the number of rows deleted.
+    Windows are deleted until about SHORT_TERM_STATISTICS_ROWS_PER_PURGE
+    rows have been deleted, gaps between rows are skipped.
 
+    Return true if there are more rows to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    total_deleted_rows = 0
+    try:
+        while total_deleted_rows < SHORT_TERM_STATISTICS_ROWS_PER_PURGE:
+            oldest_start_ts: float | None = session.execute(
+                find_oldest_short_term_statistics_start_ts()
+            ).scalar()
+            if oldest_start_ts is None or oldest_start_ts >= purge_before_ts:
+                return False
+            window_end_ts = min(
+                oldest_start_ts + SHORT_TERM_STATISTICS_PURGE_WINDOW, purge_before_ts
+            )
+            deleted_rows = session.execute(
+                delete_statistics_short_term_rows_before(window_end_ts)
+            ).rowcount
+            _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+            total_deleted_rows += deleted_rows
+        return True
+    finally:
+        if total_deleted_rows:
+            instance.statistics_during_period_cache.mark_all_modified()
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
-    """Delete by event id."""
+
+def _purge_event_ids(
+    session: Session, event_ids: set[int], range_end_ts: float | None = None
+) -> None:
+    """Delete by event id.
+
+    If range_end_ts is given the event ids are all the events fired before
+    it and they are deleted by range instead.
+    """
     if not event_ids:
         return
-    deleted_rows = session.execute(delete_event_rows(event_ids))
+    if range_end_ts is None:
+        deleted_rows = session.execute(delete_event_rows(event_ids))
+    else:
+        deleted_rows = session.execute(delete_event_rows_before(range_end_ts))
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
@@ -549,6 +549,15 @@ def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete states rows last updated before purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_data_rows(data_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete event_data rows."""
     return lambda_stmt(
@@ -580,13 +589,13 @@ def delete_statistics_runs_rows(
     )
 
 
-def delete_statistics_short_term_rows(
-    short_term_statistics: Iterable[int],
+def delete_statistics_short_term_rows_before(
+    purge_before: float,
 ) -> StatementLambdaElement:
-    """Delete statistics_short_term rows."""
+    """Delete statistics_short_term rows that start before purge_before."""
     return lambda_stmt(
         lambda: delete(StatisticsShortTerm)
-        .where(StatisticsShortTerm.id.in_(short_term_statistics))
+        .where(StatisticsShortTerm.start_ts < purge_before)
         .execution_options(synchronize_session=False)
     )
 
@@ -602,6 +611,15 @@ def delete_event_rows(
     )
 
 
+def delete_event_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete event rows fired before purge_before."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_recorder_runs_rows(
     purge_before: datetime, current_run_id: int
 ) -> StatementLambdaElement:
@@ -617,10 +635,11 @@ def delete_recorder_runs_rows(
 def find_events_to_purge(
     purge_before: float, max_bind_vars: int
 ) -> StatementLambdaElement:
-    """Find events to purge."""
+    """Find events to purge, oldest first."""
     return lambda_stmt(
-        lambda: select(Events.event_id, Events.data_id)
+        lambda: select(Events.event_id, Events.data_id, Events.time_fired_ts)
         .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts)
         .limit(max_bind_vars)
     )
 
@@ -628,24 +647,18 @@ def find_events_to_purge(
 def find_states_to_purge(
     purge_before: float, max_bind_vars: int
 ) -> StatementLambdaElement:
-    """Find states to purge."""
+    """Find states to purge, oldest first."""
     return lambda_stmt(
-        lambda: select(States.state_id, States.attributes_id)
+        lambda: select(States.state_id, States.attributes_id, States.last_updated_ts)
         .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts)
         .limit(max_bind_vars)
     )
 
 
-def find_short_term_statistics_to_purge(
-    purge_before: datetime, max_bind_vars: int
-) -> StatementLambdaElement:
-    """Find short term statistics to purge."""
-    purge_before_ts = purge_before.timestamp()
-    return lambda_stmt(
-        lambda: select(StatisticsShortTerm.id)
-        .filter(StatisticsShortTerm.start_ts < purge_before_ts)
-        .limit(max_bind_vars)
-    )
+def find_oldest_short_term_statistics_start_ts() -> StatementLambdaElement:
+    """Find the start of the oldest short term statistics row."""
+    return lambda_stmt(lambda: select(func.min(StatisticsShortTerm.start_ts)))
 
 
 def find_statistics_runs_to_purge(
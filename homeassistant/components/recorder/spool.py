@@ -0,0 +1,220 @@
+"""Spool events to disk while the recorder backlog is exhausted."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventStateChangedData, State
+from homeassistant.helpers.json import json_bytes, json_fragment
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import (
+    JSON_DECODE_EXCEPTIONS,
+    JSON_ENCODE_EXCEPTIONS,
+    json_loads_object,
+)
+
+from .db_schema import EVENT_ORIGIN_ORDER, EventData, StateAttributes
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_DIR = ".recorder_spool"
+SEGMENT_SUFFIX = ".spool"
+TEMP_SEGMENT_SUFFIX = ".tmp"
+FAILED_SEGMENT_SUFFIX = ".failed"
+
+
+def _state_to_spool(state: State, shared_attrs_bytes: bytes) -> list[Any]:
+    """Convert a new state to its spooled form."""
+    return [
+        state.state,
+        json_fragment(shared_attrs_bytes),
+        state.last_updated_timestamp,
+        state.last_changed_timestamp,
+        state.last_reported_timestamp,
+    ]
+
+
+def _state_from_spool(entity_id: str, spooled: list[Any], context: Context) -> State:
+    """Convert a spooled new state back to a native state."""
+    state, attributes, last_updated_ts, last_changed_ts, last_reported_ts = spooled
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+        last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+        context=context,
+        validate_entity_id=False,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+class RecorderSpool:
+    """Append-only segment files holding events which are not recorded yet.
+
+    Each write creates a new segment, segments are named by an increasing
+    sequence number so they are drained in the order they were written.
+
+    The attributes of spooled states are stored the way the recorder
+    would store them, so excluded and unrecorded attributes never reach
+    the disk.
+    """
+
+    def __init__(self, recorder: Recorder, path: str) -> None:
+        """Initialize the spool."""
+        self.recorder = recorder
+        self.path = path
+        self._next_sequence: int | None = None
+
+    def segments(self) -> list[str]:
+        """Return the paths of the spooled segments, oldest first."""
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+        return [
+            os.path.join(self.path, name)
+            for name in sorted(names)
+            if name.endswith(SEGMENT_SUFFIX)
+        ]
+
+    def write(self, events: list[Event]) -> None:
+        """Write events to a new segment.
+
+        Writes must not run concurrently.
+        """
+        lines: list[bytes] = []
+        for event in events:
+            try:
+                lines.append(self._serialize_event(event))
+            except JSON_ENCODE_EXCEPTIONS as ex:
+                _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+        if not lines:
+            return
+        if self._next_sequence is None:
+            os.makedirs(self.path, exist_ok=True)
+            # Segments which were set aside keep their sequence number
+            self._next_sequence = (
+                max(
+                    (
+                        int(name.partition(".")[0])
+                        for name in os.listdir(self.path)
+                        if name.endswith(
+                            (SEGMENT_SUFFIX, SEGMENT_SUFFIX + FAILED_SEGMENT_SUFFIX)
+                        )
+                    ),
+                    default=0,
+                )
+                + 1
+            )
+        segment = os.path.join(
+            self.path, f"{self._next_sequence:012d}{SEGMENT_SUFFIX}"
+        )
+        temp_segment = segment + TEMP_SEGMENT_SUFFIX
+        with open(temp_segment, "wb") as file:
+            file.write(b"\n".join(lines))
+            file.flush()
+            os.fsync(file.fileno())
+        # The segment only becomes visible once it is complete
+        os.replace(temp_segment, segment)
+        self._next_sequence += 1
+
+    def read(self, segment: str) -> list[Event]:
+        """Read the events of a segment."""
+        with open(segment, "rb") as file:
+            lines = file.read().splitlines()
+        events: list[Event] = []
+        for line in lines:
+            try:
+                events.append(self._deserialize_event(line))
+            except (*JSON_DECODE_EXCEPTIONS, KeyError, ValueError):
+                _LOGGER.exception("Error reading spooled event from %s", segment)
+        return events
+
+    def remove(self, segment: str) -> None:
+        """Remove a segment once its events have been recorded."""
+        with suppress(FileNotFoundError):
+            os.unlink(segment)
+
+    def quarantine(self, segment: str) -> None:
+        """Set aside a segment which could not be recorded."""
+        try:
+            os.replace(segment, segment + FAILED_SEGMENT_SUFFIX)
+        except OSError as err:
+            _LOGGER.error("Error setting aside spool segment %s: %s", segment, err)
+
+    def _serialize_event(self, event: Event) -> bytes:
+        """Serialize an event to a spool line."""
+        dialect = self.recorder.dialect_name
+        context = event.context
+        data: Any
+        if event.event_type == EVENT_STATE_CHANGED:
+            state_event: Event[EventStateChangedData] = event
+            old_state = state_event.data["old_state"]
+            new_state = state_event.data["new_state"]
+            data = {
+                "entity_id": state_event.data["entity_id"],
+                "old_state": old_state
+                and [old_state.state, old_state.last_reported_timestamp],
+                "new_state": new_state
+                and _state_to_spool(
+                    new_state,
+                    StateAttributes.shared_attrs_bytes_from_event(state_event, dialect),
+                ),
+            }
+        elif event.data:
+            data = json_fragment(
+                EventData.shared_data_bytes_from_event(event, dialect)
+            )
+        else:
+            data = None
+        return json_bytes(
+            {
+                "e": event.event_type,
+                "d": data,
+                "o": event.origin.idx,
+                "t": event.time_fired_timestamp,
+                "c": [context.id, context.user_id, context.parent_id],
+            }
+        )
+
+    def _deserialize_event(self, line: bytes) -> Event:
+        """Deserialize a spool line to an event."""
+        spooled: dict[str, Any] = json_loads_object(line)
+        context_id, user_id, parent_id = spooled["c"]
+        context = Context(id=context_id, user_id=user_id, parent_id=parent_id)
+        event_type = spooled["e"]
+        data: dict[str, Any] = spooled["d"] or {}
+        if event_type == EVENT_STATE_CHANGED:
+            entity_id = data["entity_id"]
+            old_state = new_state = None
+            if spooled_old_state := data["old_state"]:
+                state, last_reported_ts = spooled_old_state
+                old_state = State(
+                    entity_id,
+                    state,
+                    last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+                    validate_entity_id=False,
+                )
+            if spooled_new_state := data["new_state"]:
+                new_state = _state_from_spool(entity_id, spooled_new_state, context)
+            data = {
+                "entity_id": entity_id,
+                "old_state": old_state,
+                "new_state": new_state,
+            }
+        return Event(
+            event_type,
+            data,
+            EVENT_ORIGIN_ORDER[spooled["o"]],
+            spooled["t"],
+            context=context,
+        )
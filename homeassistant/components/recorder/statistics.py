@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
@@ -171,6 +174,9 @@ def mean(values: list[float]) -> float | None:
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of statistics_during_period results to cache
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 64
+
 
 @dataclasses.dataclass(slots=True)
 class ShortTermStatisticsRunCache:
@@ -218,6 +224,104 @@ class StatisticsRow(BaseStatisticsRow, total=False):
     change: float | None
 
 
+class StatisticsDuringPeriodCache:
+    """Cache for statistics_during_period results.
+
+    Cached results are evicted per metadata_id when the recorder thread
+    modifies the statistics of a metadata_id.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._results: LRU[
+            tuple[Any, ...], tuple[frozenset[int], dict[str, list[StatisticsRow]]]
+        ] = LRU(STATISTICS_DURING_PERIOD_CACHE_SIZE)
+        # Bumped on every invalidation so results of queries which were
+        # running while statistics were modified are not cached
+        self._generation = 0
+        self._modified_metadata_ids: set[int] = set()
+        self._all_modified = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: tuple[Any, ...]
+    ) -> tuple[int, dict[str, list[StatisticsRow]] | None]:
+        """Return the current generation and a copy of the cached result."""
+        with self._lock:
+            generation = self._generation
+            if (cached := self._results.get(key)) is None:
+                self.misses += 1
+                return generation, None
+            self.hits += 1
+        return generation, _copy_statistics_result(cached[1])
+
+    def set(
+        self,
+        key: tuple[Any, ...],
+        generation: int,
+        metadata_ids: frozenset[int],
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a copy of the result if no statistics changed since generation."""
+        result = _copy_statistics_result(result)
+        with self._lock:
+            if generation == self._generation:
+                self._results[key] = (metadata_ids, result)
+
+    def mark_modified(self, metadata_ids: Iterable[int]) -> None:
+        """Mark the statistics of metadata_ids as modified.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._modified_metadata_ids.update(metadata_ids)
+
+    def mark_all_modified(self) -> None:
+        """Mark all statistics as modified.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._all_modified = True
+
+    def invalidate_modified(self) -> None:
+        """Evict cached results for the modified statistics.
+
+        This must be called after the modifications have been committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._all_modified and not self._modified_metadata_ids:
+            return
+        modified_metadata_ids = self._modified_metadata_ids
+        with self._lock:
+            self._generation += 1
+            if self._all_modified:
+                self._results.clear()
+            else:
+                for key in [
+                    key
+                    for key, (metadata_ids, _) in self._results.items()
+                    if not modified_metadata_ids.isdisjoint(metadata_ids)
+                ]:
+                    del self._results[key]
+        self._modified_metadata_ids = set()
+        self._all_modified = False
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return a copy of a statistics result which can be modified by the caller."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 def get_display_unit(
     hass: HomeAssistant,
     statistic_id: str,
@@ -388,12 +492,14 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(session: Session, start: datetime) -> set[int]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    returns the metadata_ids of the compiled statistics.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -443,6 +549,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return set(summary)
 
 
 @retryable_database_job("compile missing statistics")
@@ -538,6 +645,7 @@ def _compile_statistics(
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
     end = start + StatisticsShortTerm.duration
     statistics_meta_manager = instance.statistics_meta_manager
+    statistics_during_period_cache = instance.statistics_during_period_cache
     modified_statistic_ids: set[str] = set()
 
     # Return if we already have 5-minute statistics for the requested period
@@ -586,6 +694,7 @@ def _compile_statistics(
             stats["stat"],
         ):
             new_short_term_stats.append(new_stat)
+    statistics_during_period_cache.mark_modified(updated_metadata_ids)
 
     if start.minute == 50:
         # Once every hour, update issues
@@ -600,7 +709,9 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        statistics_during_period_cache.mark_modified(
+            _compile_hourly_statistics(session, start)
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -747,6 +858,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+        instance.statistics_during_period_cache.mark_all_modified()
 
 
 def update_statistics_metadata(
@@ -757,6 +869,7 @@ def update_statistics_metadata(
 ) -> None:
     """Update statistics metadata for a statistic_id."""
     statistics_meta_manager = instance.statistics_meta_manager
+    instance.statistics_during_period_cache.mark_all_modified()
     if new_unit_of_measurement is not UNDEFINED:
         with session_scope(session=instance.get_session()) as session:
             statistics_meta_manager.update_unit_of_measurement(
@@ -902,14 +1015,15 @@ def list_statistic_ids(
 
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    The hourly rows are sorted by start, so the rows of each period are found
+    with a bisect on the period end and reduced as a single slice.
+    """
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -917,44 +1031,49 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts = [statistic["start"] for statistic in stat_list]
+        period_rows = result[statistic_id]
+        num_rows = len(stat_list)
+        idx = 0
+        while idx < num_rows:
+            start, end = period_start_end(starts[idx])
+            next_idx = bisect_left(starts, end, idx + 1)
+            period_stats = stat_list[idx:next_idx]
+            # The last statistic is the last entry of the period
+            last_stat = period_stats[-1]
+            row: StatisticsRow = {
+                "start": start,
+                "end": end,
+            }
+            if _want_mean:
+                mean_values = [
+                    _mean
+                    for statistic in period_stats
+                    if (_mean := statistic.get("mean")) is not None
+                ]
+                row["mean"] = mean(mean_values) if mean_values else None
+            if _want_min:
+                min_values = [
+                    _min
+                    for statistic in period_stats
+                    if (_min := statistic.get("min")) is not None
+                ]
+                row["min"] = min(min_values) if min_values else None
+            if _want_max:
+                max_values = [
+                    _max
+                    for statistic in period_stats
+                    if (_max := statistic.get("max")) is not None
+                ]
+                row["max"] = max(max_values) if max_values else None
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            period_rows.append(row)
+            idx = next_idx
 
     return result
 
@@ -1002,10 +1121,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1052,10 +1169,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1107,10 +1222,8 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -1821,8 +1934,30 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
+    if statistic_ids is None:
+        with session_scope(hass=hass, read_only=True) as session:
+            return _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                types,
+            )
+
+    instance = get_instance(hass)
+    cache = instance.statistics_during_period_cache
+    cache_key = _statistics_during_period_cache_key(
+        hass, start_time, end_time, statistic_ids, period, units, types
+    )
+    generation, result = cache.get(cache_key)
+    if result is not None:
+        return result
+
     with session_scope(hass=hass, read_only=True) as session:
-        return _statistics_during_period_with_session(
+        result = _statistics_during_period_with_session(
             hass,
             session,
             start_time,
@@ -1833,6 +1968,50 @@ def statistics_during_period(
             types,
         )
 
+    # Only cache the result if all statistic_ids exist, a statistic which
+    # is created later would otherwise be missing from the cached result
+    metadata = instance.statistics_meta_manager.get_from_cache_threadsafe(
+        set(statistic_ids)
+    )
+    if len(metadata) == len(statistic_ids):
+        metadata_ids = frozenset(metadata_id for metadata_id, _ in metadata.values())
+        cache.set(cache_key, generation, metadata_ids, result)
+    return result
+
+
+def _statistics_during_period_cache_key(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[Any, ...]:
+    """Return the statistics_during_period cache key for the arguments.
+
+    Statistics are displayed in the unit of the state unless a unit is
+    requested, so the units of the states are part of the key.
+    """
+    state_units = frozenset(
+        (
+            statistic_id,
+            state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            if (state := hass.states.get(statistic_id))
+            else None,
+        )
+        for statistic_id in statistic_ids
+    )
+    return (
+        start_time,
+        end_time,
+        period,
+        frozenset(units.items()) if units else None,
+        frozenset(types),
+        state_units,
+        dt_util.get_default_time_zone(),
+    )
+
 
 def _get_last_statistics_stmt(
     metadata_id: int,
@@ -2340,6 +2519,7 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    instance.statistics_during_period_cache.mark_modified((metadata_id,))
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
@@ -2460,6 +2640,9 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        instance.statistics_during_period_cache.mark_modified(
+            (metadata[statistic_id][0],)
+        )
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2533,6 +2716,7 @@ def change_statistics_unit(
             )
             return
 
+        instance.statistics_during_period_cache.mark_modified((metadata_id,))
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
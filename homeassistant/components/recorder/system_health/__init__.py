@@ -44,6 +44,39 @@ def _get_db_stats(instance: Recorder, database_name: str) -> dict[str, Any]:
     return db_stats
 
 
+@callback
+def _async_get_executor_job_timings(instance: Recorder) -> dict[str, Any]:
+    """Get the time spent by jobs in the database executor."""
+    if not (jobs := instance.executor_job_timings.snapshot()):
+        return {}
+    count = sum(stats.count for stats in jobs.values())
+    run_time = sum(stats.run_time for stats in jobs.values())
+    wait_time = sum(stats.wait_time for stats in jobs.values())
+    slowest_name, slowest_stats = max(
+        jobs.items(), key=lambda item: item[1].max_run_time
+    )
+    return {
+        "database_executor_jobs": count,
+        "database_executor_job_time": f"{run_time / count * 1000:.2f} ms",
+        "database_executor_job_wait_time": f"{wait_time / count * 1000:.2f} ms",
+        "slowest_database_executor_job": (
+            f"{slowest_name} ({slowest_stats.max_run_time * 1000:.2f} ms)"
+        ),
+    }
+
+
+@callback
+def _async_get_statistics_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get the statistics_during_period cache hits and misses."""
+    cache = instance.statistics_during_period_cache
+    if not cache.hits and not cache.misses:
+        return {}
+    return {
+        "statistics_cache_hits": cache.hits,
+        "statistics_cache_misses": cache.misses,
+    }
+
+
 @callback
 def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     """Get database engine info."""
@@ -72,4 +105,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_executor_job_timings(instance)
+        | _async_get_statistics_cache_info(instance)
+    )
@@ -49,10 +49,12 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        id_map = self._id_map
         if hashes := {
             EventData.hash_shared_data_bytes(shared_event_bytes)
             for event in events
             if (shared_event_bytes := self.serialize_from_event(event))
+            and shared_event_bytes.decode("utf-8") not in id_map
         }:
             self._load_from_hashes(hashes, session)
 
@@ -60,10 +60,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        id_map = self._id_map
         if hashes := {
             StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
             for event in events
             if (shared_attrs_bytes := self.serialize_from_event(event))
+            and shared_attrs_bytes.decode("utf-8") not in id_map
         }:
             self._load_from_hashes(hashes, session)
 
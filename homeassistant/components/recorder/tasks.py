@@ -297,6 +297,22 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class DrainSpoolTask(RecorderTask):
+    """Record the events spooled to disk."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        drained = False
+        try:
+            drained = instance._drain_spool()  # noqa: SLF001
+        finally:
+            instance.hass.add_job(
+                instance._async_spool_drained,  # noqa: SLF001
+                drained,
+            )
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
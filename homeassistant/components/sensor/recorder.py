@@ -413,9 +413,20 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    # Sensors which have not been updated since the start of the period
+    # can't have any recorded states during it, and their current state
+    # is the one they had during the whole period. Only query the history
+    # of the sensors which changed so the cost of compiling scales with the
+    # number of changes rather than the number of sensors.
+    start_ts = start.timestamp()
+    changed_sensor_states = [
+        state for state in sensor_states if state.last_updated_timestamp >= start_ts
+    ]
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in changed_sensor_states
+        if "sum" in wanted_statistics[i.entity_id]
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
@@ -429,7 +440,7 @@ def compile_statistics(  # noqa: C901
         )
     entities_significant_history = [
         i.entity_id
-        for i in sensor_states
+        for i in changed_sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
@@ -446,7 +457,8 @@ def compile_statistics(  # noqa: C901
     for _state in sensor_states:
         entity_id = _state.entity_id
         # If there are no recent state changes, the sensor's state may already be pruned
-        # from the recorder. Get the state from the state machine instead.
+        # from the recorder or was not queried. Get the state from the state machine
+        # instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
             continue
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
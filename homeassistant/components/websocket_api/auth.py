@@ -57,11 +57,13 @@ class AuthPhase:
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        async_wait_for_drain: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize the authenticated connection."""
         self._hass = hass
         # send_message will send a message to the client via the queue.
         self._send_message = send_message
+        self._async_wait_for_drain = async_wait_for_drain
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
@@ -89,6 +91,7 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._async_wait_for_drain,
             )
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import lru_cache, partial
 import json
 import logging
+from operator import attrgetter
 from typing import Any, cast
 
 import voluptuous as vol
@@ -43,6 +44,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_get_template_render_stats,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -52,6 +54,7 @@ from homeassistant.helpers.json import (
     json_bytes,
     json_fragment,
 )
+from homeassistant.helpers.loop_monitor import LoopStall, async_get_loop_monitor
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
@@ -89,7 +92,9 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_render_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_loop_monitor)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -200,6 +205,40 @@ def handle_subscribe_bootstrap_integrations(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_loop_monitor",
+    }
+)
+@decorators.require_admin
+def handle_subscribe_loop_monitor(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe loop monitor command.
+
+    The event loop is monitored while there are subscribers.
+    """
+    monitor = async_get_loop_monitor(hass)
+
+    @callback
+    def forward_loop_stall(stall: LoopStall) -> None:
+        """Forward event loop stalls to websocket."""
+        connection.send_message(
+            messages.event_message(
+                msg["id"], {"stall": stall.as_dict(), "stats": monitor.stats.as_dict()}
+            )
+        )
+
+    connection.subscriptions[msg["id"]] = monitor.async_subscribe(forward_loop_stall)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        messages.event_message(
+            msg["id"], {"stall": None, "stats": monitor.stats.as_dict()}
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -312,14 +351,14 @@ async def handle_call_service(
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
-) -> list[State]:
+) -> Sequence[State]:
     user = connection.user
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
+        return hass.states.async_all_snapshot()
     entity_perm = connection.user.permissions.check_entity
     return [
         state
-        for state in hass.states.async_all()
+        for state in hass.states.async_all_snapshot()
         if entity_perm(state.entity_id, POLICY_READ)
     ]
 
@@ -372,26 +411,78 @@ def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
     entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
+    attributes: frozenset[str] | None,
+    skipped_old_states: dict[str, State],
     user: User,
     message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
+    events: list[Event[EventStateChangedData]],
 ) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
+    """Forward entity state changed events to websocket.
+
+    With a projection the changes outside of it are skipped and the next
+    forwarded change is diffed against the last state the client received,
+    so the context and timestamps of the skipped changes are included.
+    The diff is cached by its states, so connections with the same
+    projection which skipped the same changes share it.
+    """
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
+    check_permissions = not user.is_admin and not permissions.access_all_entities(
+        POLICY_READ
+    )
+    forward_changes: list[messages.StateChange] = []
+    forward_entity_ids: set[str] = set()
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if (entity_ids and entity_id not in entity_ids) or (
+            entity_filter and not entity_filter(entity_id)
+        ):
+            continue
+        if check_permissions and not permissions.check_entity(entity_id, POLICY_READ):
+            continue
+        change = messages.state_change(event)
+        if attributes is not None:
+            if not messages.state_changed_in_projection(event, attributes):
+                # Only changes with an old state can be skipped
+                skipped_old_states.setdefault(entity_id, cast(State, change[1]))
+                continue
+            if (old_state := skipped_old_states.pop(entity_id, None)) is not None:
+                change = (entity_id, old_state, change[2])
+        if entity_id in forward_entity_ids:
+            # An entity is only sent once per message so the diffs
+            # never have to be merged
+            _send_entity_changes(
+                send_message, message_id_as_bytes, forward_changes, attributes
+            )
+            forward_changes = []
+            forward_entity_ids.clear()
+        forward_changes.append(change)
+        forward_entity_ids.add(entity_id)
+    if forward_changes:
+        _send_entity_changes(
+            send_message, message_id_as_bytes, forward_changes, attributes
+        )
+
+
+def _send_entity_changes(
+    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    message_id_as_bytes: bytes,
+    changes: list[messages.StateChange],
+    attributes: frozenset[str] | None,
+) -> None:
+    """Send the changes of different entities in as few messages as possible."""
+    if len(changes) > 1 and (
+        message := messages.cached_state_diff_batch_message(
+            message_id_as_bytes, tuple(changes), attributes
+        )
     ):
+        send_message(message)
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    for change in changes:
+        send_message(
+            messages.cached_state_diff_message(message_id_as_bytes, change, attributes)
+        )
 
 
 @callback
@@ -399,29 +490,42 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("attributes"): vol.All(cv.ensure_list, [cv.string]),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    When attributes are given only those attributes are sent, and changes
+    which do not change the state or one of them are not sent at all.
+    """
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    attributes = frozenset(msg["attributes"]) if "attributes" in msg else None
+    serialize_state: Callable[[State], bytes] = (
+        attrgetter("as_compressed_state_json")
+        if attributes is None
+        else partial(messages.compressed_state_json, attributes=attributes)
+    )
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
+    connection.subscriptions[msg_id] = hass.bus.async_listen_batch(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
             connection.send_message,
             entity_ids,
             entity_filter,
+            attributes,
+            {},
             connection.user,
             message_id_as_bytes,
         ),
@@ -432,9 +536,9 @@ def handle_subscribe_entities(
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
-        if entity_ids or entity_filter:
+        if entity_ids or entity_filter or attributes is not None:
             serialized_states = [
-                state.as_compressed_state_json
+                serialize_state(state)
                 for state in states
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
@@ -453,7 +557,7 @@ def handle_subscribe_entities(
     serialized_states = []
     for state in states:
         try:
-            serialized_states.append(state.as_compressed_state_json)
+            serialized_states.append(serialize_state(state))
         except (ValueError, TypeError):
             connection.logger.error(
                 "Unable to serialize to JSON. Bad data found at %s",
@@ -683,6 +787,16 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "template/render_stats"})
+@decorators.require_admin
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command."""
+    connection.send_result(msg["id"], async_get_template_render_stats(hass))
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
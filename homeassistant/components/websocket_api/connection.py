@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -30,6 +30,10 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+async def _async_drained() -> None:
+    """Return at once for connections which do not queue messages."""
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -37,6 +41,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "async_wait_for_drain",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -54,11 +59,14 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        async_wait_for_drain: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Waits until the queued messages have been written to the client
+        self.async_wait_for_drain = async_wait_for_drain or _async_drained
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
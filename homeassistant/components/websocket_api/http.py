@@ -81,6 +81,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drained_future",
         "_release_ready_queue_size",
     )
 
@@ -104,6 +105,7 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
+        self._drained_future: asyncio.Future[None] | None = None
         self._release_ready_queue_size: int = 0
 
     def __repr__(self) -> str:
@@ -143,6 +145,8 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    if self._drained_future:
+                        self._release_drained_future()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -234,6 +238,23 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    async def _async_wait_for_drain(self) -> None:
+        """Wait until the queued messages have been written to the client."""
+        if self._closing or not self._message_queue:
+            return
+        if not (drained_future := self._drained_future):
+            drained_future = self._drained_future = self._loop.create_future()
+        # Shielded since several waiters can share the future
+        await asyncio.shield(drained_future)
+
+    @callback
+    def _release_drained_future(self) -> None:
+        """Release the waiters for the queue to drain."""
+        if drained_future := self._drained_future:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -336,7 +357,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_for_drain,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -368,6 +395,7 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            self._release_drained_future()
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -28,6 +29,8 @@ from . import const
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_MISSING: Final = object()
+
 # Minimal requirements of a message
 MINIMAL_MESSAGE_SCHEMA: Final = vol.Schema(
     {vol.Required("id"): cv.positive_int, vol.Required("type"): cv.string},
@@ -44,6 +47,9 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# The entity_id, old_state and new_state of a state change
+type StateChange = tuple[str, State | None, State | None]
+
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
     "success": False,
@@ -141,8 +147,16 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
+def state_change(event: Event[EventStateChangedData]) -> StateChange:
+    """Return the state change of a state_changed event."""
+    data = event.data
+    return (data["entity_id"], data["old_state"], data["new_state"])
+
+
 def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    message_id_as_bytes: bytes,
+    change: StateChange,
+    attributes: frozenset[str] | None = None,
 ) -> bytes:
     """Return an event message.
 
@@ -151,10 +165,13 @@ def cached_state_diff_message(
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+    The message is cached by the states it is diffed from and to, so
+    connections projecting the same attributes share the message even
+    when they skipped different changes before it.
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            _partial_cached_state_diff_message(change, attributes)[:-1],
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -163,22 +180,107 @@ def cached_state_diff_message(
 
 
 @lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
-    """Cache and serialize the event to json.
+def _partial_cached_state_diff_message(
+    change: StateChange, attributes: frozenset[str] | None
+) -> bytes:
+    """Cache and serialize the state change to json.
 
     The message is constructed without the id which
     will be appended in cached_state_diff_message
     """
     return (
         _message_to_json_bytes_or_none(
-            {"type": "event", "event": _state_diff_event(event)}
+            {"type": "event", "event": _state_diff(*change, attributes)}
         )
         or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
+def cached_state_diff_batch_message(
+    message_id_as_bytes: bytes,
+    changes: tuple[StateChange, ...],
+    attributes: frozenset[str] | None = None,
+) -> bytes | None:
+    """Return an event message for state changes fired together.
+
+    The changes must be for different entities. Returns None if the
+    changes cannot be serialized together.
+    """
+    if (
+        partial_message := _partial_cached_state_diff_batch_message(changes, attributes)
+    ) is None:
+        return None
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_diff_batch_message(
+    changes: tuple[StateChange, ...],
+    attributes: frozenset[str] | None,
+) -> bytes | None:
+    """Cache and serialize the combined state changes to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_diff_batch_message
+    """
+    combined: dict[str, Any] = {}
+    for change in changes:
+        for key, value in _state_diff(*change, attributes).items():
+            if key == ENTITY_EVENT_REMOVE:
+                combined.setdefault(key, []).extend(value)
+            else:
+                combined.setdefault(key, {}).update(value)
+    return _message_to_json_bytes_or_none({"type": "event", "event": combined})
+
+
+def state_changed_in_projection(
+    event: Event[EventStateChangedData], attributes: frozenset[str]
+) -> bool:
+    """Return if a state_changed event changes the state or projected attributes.
+
+    Changes of the context and timestamps alone are not part of a projection.
+    """
+    if (new_state := event.data["new_state"]) is None or (
+        old_state := event.data["old_state"]
+    ) is None:
+        return True
+    if old_state.state != new_state.state:
+        return True
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    return any(
+        old_attributes.get(key, _MISSING) != new_attributes.get(key, _MISSING)
+        for key in attributes
+    )
+
+
+def _project_attributes(
+    attributes: Mapping[str, Any], projection: frozenset[str]
+) -> dict[str, Any]:
+    """Return the attributes included in a projection."""
+    return {key: attributes[key] for key in projection if key in attributes}
+
+
+def compressed_state_json(state: State, attributes: frozenset[str]) -> bytes:
+    """Build a compressed JSON key value pair of a state for adds.
+
+    Only the projected attributes are included.
+    """
+    return json_bytes(
+        {
+            state.entity_id: {
+                **state.as_compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: _project_attributes(
+                    state.attributes, attributes
+                ),
+            }
+        }
+    )[1:-1]
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
+    attributes: frozenset[str] | None = None,
 ) -> dict[
     str,
     list[str]
@@ -195,10 +297,33 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
-        return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return _state_diff(*state_change(event), attributes)
+
+
+def _state_diff(
+    entity_id: str,
+    old_state: State | None,
+    new_state: State | None,
+    attributes: frozenset[str] | None = None,
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Convert a state change to the minimal version."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
+        compressed_state = new_state.as_compressed_state
+        if attributes is not None:
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: _project_attributes(
+                    new_state.attributes, attributes
+                ),
+            }
+        return {ENTITY_EVENT_ADD: {new_state.entity_id: compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -221,9 +346,12 @@ def _state_diff_event(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
-        new_attributes := new_state.attributes
-    ):
+    old_attributes: Mapping[str, Any] = old_state.attributes
+    new_attributes: Mapping[str, Any] = new_state.attributes
+    if attributes is not None:
+        old_attributes = _project_attributes(old_attributes, attributes)
+        new_attributes = _project_attributes(new_attributes, attributes)
+    if old_attributes != new_attributes:
         if added := {
             key: value
             for key, value in new_attributes.items()
@@ -12,13 +12,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -1460,7 +1461,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_batched_events",
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1469,6 +1477,14 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._batch_listeners: dict[
+            EventType[Any] | str, list[HassJob[[list[Event[Any]]], None]]
+        ] = {}
+        # Events for batch listeners held back until the batch ends,
+        # None when not batching
+        self._batched_events: dict[EventType[Any] | str, list[Event[Any]]] | None = (
+            None
+        )
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1484,7 +1500,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, batch_jobs in self._batch_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(batch_jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1579,6 +1598,90 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if not self._batch_listeners or event_type not in self._batch_listeners:
+            return
+        if not event:
+            event = Event(event_type, event_data, origin, time_fired, context)
+        if (batched_events := self._batched_events) is not None:
+            if event_type in batched_events:
+                batched_events[event_type].append(event)
+            else:
+                batched_events[event_type] = [event]
+            return
+        self._async_run_batch_jobs(event_type, [event])
+
+    @callback
+    def _async_run_batch_jobs(
+        self, event_type: EventType[Any] | str, events: list[Event[Any]]
+    ) -> None:
+        """Run the batch listeners for events of a specific type."""
+        for job in self._batch_listeners.get(event_type, EMPTY_LIST).copy():
+            try:
+                self._hass.async_run_hass_job(job, events)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
+    @contextmanager
+    def async_batch(self) -> Generator[None]:
+        """Deliver the events fired in the context together to batch listeners.
+
+        Other listeners still receive each event as it is fired.
+
+        This method must be run in the event loop.
+        """
+        if self._batched_events is not None:
+            # Already batching
+            yield
+            return
+        self._batched_events = batched_events = {}
+        try:
+            yield
+        finally:
+            self._batched_events = None
+            for event_type, events in batched_events.items():
+                self._async_run_batch_jobs(event_type, events)
+
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type, delivered in batches.
+
+        The listener, which must be a callback, receives the list of the
+        events fired in an async_batch context at its end, or a list with
+        a single event for events fired outside of it.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(f"Batch listeners cannot listen to {MATCH_ALL}")
+        job: HassJob[[list[Event[Any]]], None] = HassJob(
+            listener, f"listen batch {event_type}", job_type=HassJobType.Callback
+        )
+        self._batch_listeners.setdefault(event_type, []).append(job)
+        return functools.partial(self._async_remove_batch_listener, event_type, job)
+
+    @callback
+    def _async_remove_batch_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[list[Event[Any]]], None],
+    ) -> None:
+        """Remove a batch listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            batch_jobs = self._batch_listeners[event_type]
+            batch_jobs.remove(job)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown job listener %s", job)
+            return
+        if not batch_jobs:
+            del self._batch_listeners[event_type]
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1910,10 +2013,22 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @under_cached_property
+    def attributes_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes.
+
+        States which keep the attributes of the previous state share
+        the fragment with it, so unchanged attributes are only
+        serialized once.
+        """
+        return json_fragment(json_bytes(self.attributes))
+
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": self.attributes_json_fragment}
+        )
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1956,7 +2071,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: self.attributes_json_fragment,
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2027,12 +2149,18 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    Immutable snapshots of the states and entity ids of all entities or of
+    a domain are cached until they change. Entity id snapshots only change
+    when an entity is added or removed, state snapshots when a state is set.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._states_snapshots: dict[str | None, tuple[State, ...]] = {}
+        self._entity_ids_snapshots: dict[str | None, tuple[str, ...]] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2040,12 +2168,18 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if self._entity_ids_snapshots and key not in self.data:
+            _discard_snapshots(self._entity_ids_snapshots, entry.domain)
+        if self._states_snapshots:
+            _discard_snapshots(self._states_snapshots, entry.domain)
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
+        _discard_snapshots(self._entity_ids_snapshots, entry.domain)
+        _discard_snapshots(self._states_snapshots, entry.domain)
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
 
@@ -2063,6 +2197,38 @@ class States(UserDict[str, State]):
             return ()
         return self._domain_index[key].values()
 
+    def states_snapshot(self, domain: str | None = None) -> tuple[State, ...]:
+        """Return a snapshot of the states of a domain or of all entities."""
+        if (snapshot := self._states_snapshots.get(domain)) is not None:
+            return snapshot
+        if domain is None:
+            snapshot = tuple(self.data.values())
+        elif domain in self._domain_index:
+            snapshot = tuple(self._domain_index[domain].values())
+        else:
+            return ()
+        self._states_snapshots[domain] = snapshot
+        return snapshot
+
+    def entity_ids_snapshot(self, domain: str | None = None) -> tuple[str, ...]:
+        """Return a snapshot of the entity ids of a domain or of all entities."""
+        if (snapshot := self._entity_ids_snapshots.get(domain)) is not None:
+            return snapshot
+        if domain is None:
+            snapshot = tuple(self.data)
+        elif domain in self._domain_index:
+            snapshot = tuple(self._domain_index[domain])
+        else:
+            return ()
+        self._entity_ids_snapshots[domain] = snapshot
+        return snapshot
+
+
+def _discard_snapshots(snapshots: dict[str | None, Any], domain: str) -> None:
+    """Discard the snapshots of all entities and of a domain."""
+    snapshots.pop(None, None)
+    snapshots.pop(domain, None)
+
 
 class StateMachine:
     """Helper class that tracks the state of different entities."""
@@ -2123,6 +2289,23 @@ class StateMachine:
             len(self._states.domain_entity_ids(domain)) for domain in domain_filter
         )
 
+    @callback
+    def async_entity_ids_snapshot(
+        self, domain_filter: str | None = None
+    ) -> tuple[str, ...]:
+        """Return an immutable snapshot of the entity ids being tracked.
+
+        The snapshot is shared by all callers until an entity matching the
+        filter is added or removed, so unlike async_entity_ids it is not
+        copied on every call. Setting the state of an existing entity does
+        not invalidate it.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is not None:
+            domain_filter = domain_filter.lower()
+        return self._states.entity_ids_snapshot(domain_filter)
+
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
         """Create a list of all states."""
         return run_callback_threadsafe(
@@ -2148,6 +2331,21 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_snapshot(self, domain_filter: str | None = None) -> tuple[State, ...]:
+        """Return an immutable snapshot of all states matching the filter.
+
+        The snapshot is shared by all callers until a state matching the
+        filter is set or removed, so unlike async_all it is not copied on
+        every call. Domains whose states change more often than they are
+        read get no benefit from it.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is not None:
+            domain_filter = domain_filter.lower()
+        return self._states.states_snapshot(domain_filter)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2283,6 +2481,48 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the states of many entities at once.
+
+        Each update holds the entity_id, new_state and attributes arguments
+        of async_set. Every update is validated before any state is set and
+        the state changes are delivered to batch listeners together.
+
+        This method must be run in the event loop.
+        """
+        validated: list[tuple[str, str, Mapping[str, Any]]] = []
+        for entity_id, new_state, attributes in updates:
+            entity_id = entity_id.lower()
+            if not valid_entity_id(entity_id):
+                raise InvalidEntityFormatError(
+                    f"Invalid entity id encountered: {entity_id}. "
+                    "Format should be <domain>.<object_id>"
+                )
+            validated.append(
+                (entity_id, validate_state(str(new_state)), attributes or {})
+            )
+        if timestamp is None:
+            timestamp = time.time()
+        set_internal = self.async_set_internal
+        with self._bus.async_batch():
+            for entity_id, new_state, attributes in validated:
+                set_internal(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+
     @callback
     def async_set_internal(
         self,
@@ -2358,6 +2598,11 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+            attributes_json_fragment = old_state._cache.get(  # noqa: SLF001
+                "attributes_json_fragment"
+            )
+        else:
+            attributes_json_fragment = None
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2373,6 +2618,8 @@ class StateMachine:
             state_info,
             timestamp,
         )
+        if attributes_json_fragment is not None:
+            state._cache["attributes_json_fragment"] = attributes_json_fragment  # noqa: SLF001
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
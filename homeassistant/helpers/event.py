@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
+from heapq import heappop, heappush
 import logging
+from operator import attrgetter
 from random import randint
+import statistics
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
 
@@ -36,7 +39,7 @@ from homeassistant.core import (
     callback,
     split_entity_id,
 )
-from homeassistant.exceptions import TemplateError
+from homeassistant.exceptions import HomeAssistantError, TemplateError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
@@ -57,6 +60,12 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
+_POINT_IN_TIME_TIMER_WHEEL: HassKey[_PointInTimeTimerWheel] = HassKey(
+    "track_point_in_time_timer_wheel"
+)
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "track_template_render_scheduler"
+)
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
     "track_state_change_data"
 )
@@ -89,6 +98,13 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Point in time timers due within the same slot of this many seconds
+# fire together in a single wakeup of the event loop
+TIMER_WHEEL_RESOLUTION = 0.05
+
+# Number of recent render times kept per template while profiling
+TEMPLATE_PROFILE_RENDER_TIMES = 100
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -153,6 +169,43 @@ class TrackTemplate:
     rate_limit: float | None = None
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for the render cost of a tracked template, recorded while profiling.
+
+    renders
+        The number of times the template was rendered.
+    total_time
+        The total time spent rendering the template in seconds.
+    rate_limited
+        The number of times a re-render was postponed by the rate limit.
+    render_times
+        The most recent render times in seconds.
+    triggers
+        The number of re-renders triggered by each entity.
+    """
+
+    renders: int = 0
+    total_time: float = 0
+    rate_limited: int = 0
+    render_times: deque[float] = field(
+        default_factory=partial(deque, maxlen=TEMPLATE_PROFILE_RENDER_TIMES)
+    )
+    triggers: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "renders": self.renders,
+            "total_time": self.total_time,
+            "median_time": (
+                statistics.median(self.render_times) if self.render_times else None
+            ),
+            "rate_limited": self.rate_limited,
+            "triggers": dict(self.triggers.most_common()),
+        }
+
+
 @dataclass(slots=True)
 class TrackTemplateResult:
     """Class for result of template tracking.
@@ -328,11 +381,152 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
+class _TemplateRenderScheduler:
+    """Coalesce template renders for state changes fired together.
+
+    State changes fired in the same event loop iteration are dispatched
+    to their listeners in the next iteration. Tracked templates triggered
+    by them are refreshed once after they have all been dispatched instead
+    of once per state change. Other state change listeners are not
+    affected.
+
+    Results written to the state machine by a refresh are dispatched in
+    a later iteration, so templates depending on other templates are
+    refreshed once per level of the chain.
+
+    State changes fired in an async_batch context are delivered to the
+    scheduler as one batch while it has trackers. The refresh for them is
+    then queued behind their dispatch and runs in the same iteration.
+    """
+
+    __slots__ = (
+        "hass",
+        "profiling",
+        "trackers",
+        "_refreshes",
+        "_refresh_scheduled",
+        "_unsub_batch",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # Record the render cost of each template
+        self.profiling = False
+        self.trackers: set[TrackTemplateResultInfo] = set()
+        self._refreshes: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._refresh_scheduled = False
+        self._unsub_batch: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_tracker(self, tracker: TrackTemplateResultInfo) -> None:
+        """Add a tracker and listen for state change batches."""
+        self.trackers.add(tracker)
+        if self._unsub_batch is None:
+            self._unsub_batch = self.hass.bus.async_listen_batch(
+                EVENT_STATE_CHANGED, self._async_state_changed_batch
+            )
+
+    @callback
+    def async_remove_tracker(self, tracker: TrackTemplateResultInfo) -> None:
+        """Remove a tracker and stop listening once none are left."""
+        self.trackers.discard(tracker)
+        if not self.trackers and self._unsub_batch is not None:
+            self._unsub_batch()
+            self._unsub_batch = None
+
+    @callback
+    def _async_state_changed_batch(
+        self, events: list[Event[EventStateChangedData]]
+    ) -> None:
+        """Refresh once the state changes fired together are dispatched."""
+        if len(events) > 1 and not self._refresh_scheduled:
+            # Their dispatch is already queued, so the refresh runs
+            # right after it
+            self._refresh_scheduled = True
+            self.hass.loop.call_soon(self._async_refresh)
+
+    @callback
+    def async_schedule_refresh(
+        self,
+        tracker: TrackTemplateResultInfo,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Refresh a tracker once the pending state changes are dispatched."""
+        if not self._refresh_scheduled:
+            # State changes fired together are all dispatched in this
+            # iteration, the refresh runs in the next one
+            self._refresh_scheduled = True
+            self.hass.loop.call_soon(self._async_refresh)
+        refreshes = self._refreshes
+        if tracker in refreshes:
+            refreshes[tracker].append(event)
+        else:
+            refreshes[tracker] = [event]
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Refresh the trackers triggered since the last refresh."""
+        self._refresh_scheduled = False
+        refreshes = self._refreshes
+        self._refreshes = {}
+        trackers = self.trackers
+        for tracker, tracker_events in refreshes.items():
+            if tracker not in trackers:
+                # Removed after it was scheduled, possibly by the action
+                # of a tracker refreshed earlier
+                continue
+            try:
+                tracker.async_refresh_from_events(tracker_events)
+            except Exception:
+                _LOGGER.exception("Error while refreshing %s", tracker)
+        _LOGGER.debug("Refreshed %s template groups", len(refreshes))
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
+@callback
+def async_set_template_profiling(hass: HomeAssistant, enabled: bool) -> None:
+    """Enable or disable profiling tracked templates.
+
+    The render cost of the tracked templates is only recorded while
+    profiling, nothing is timed or counted otherwise.
+    """
+    _async_get_template_render_scheduler(hass).profiling = enabled
+
+
+@callback
+def async_get_template_render_stats(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the render stats of the tracked templates, most expensive first."""
+    trackers = _async_get_template_render_scheduler(hass).trackers
+    return sorted(
+        (
+            {"template": template.template, **stats.as_dict()}
+            for tracker in trackers
+            for template, stats in tracker.render_stats.items()
+        ),
+        key=lambda template_stats: template_stats["total_time"],
+        reverse=True,
+    )
+
+
 @callback
 def _async_dispatch_entity_id_event_soon(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event: Event[EventStateChangedData],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
     hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
@@ -595,6 +789,65 @@ def async_track_device_registry_updated_event(
     )
 
 
+@callback
+def _async_event_data_filter(
+    key_name: str,
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[Mapping[str, Any]]], Any]]],
+    event_data: Mapping[str, Any],
+) -> bool:
+    """Filter events by the value of a data field."""
+    return isinstance(key := event_data.get(key_name), str) and key in callbacks
+
+
+@callback
+def _async_dispatch_event_data_event(
+    key_name: str,
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[Mapping[str, Any]]], Any]]],
+    event: Event[Mapping[str, Any]],
+) -> None:
+    """Dispatch to listeners."""
+    if not (callbacks_list := callbacks.get(event.data[key_name])):
+        return
+    for job in callbacks_list.copy():
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception(
+                "Error while dispatching event for %s to %s",
+                event.data[key_name],
+                job,
+            )
+
+
+@callback
+def async_track_event_data(
+    hass: HomeAssistant,
+    event_type: EventType[Any] | str,
+    key_name: str,
+    keys: str | Iterable[str],
+    action: Callable[[Event[Any]], Any],
+    job_type: HassJobType | None = None,
+) -> CALLBACK_TYPE:
+    """Track events of a type where a data field has one of the given values.
+
+    The listeners for an event type and data field share a single bus
+    listener, which dispatches the events by the value of the field. They
+    run in the order they were added, at the position of the first one
+    among the other listeners of the event type.
+    """
+    if event_type == MATCH_ALL:
+        raise HomeAssistantError(f"Cannot track {MATCH_ALL} events by data")
+    tracker: _KeyedEventTracker[Mapping[str, Any]] = _KeyedEventTracker(
+        key=HassKey(f"track_event_data_{event_type}_{key_name}"),
+        event_type=event_type,
+        dispatcher_callable=partial(_async_dispatch_event_data_event, key_name),
+        filter_callable=partial(_async_event_data_filter, key_name),
+    )
+    return _async_track_event(tracker, hass, keys, action, job_type)
+
+
 @callback
 def _async_dispatch_domain_event(
     hass: HomeAssistant,
@@ -807,7 +1060,8 @@ class _TrackStateChangeFiltered:
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
         if domains:
             entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            for domain in domains:
+                entities.update(self.hass.states.async_entity_ids_snapshot(domain))
 
         # Entities has changed to none
         if not entities:
@@ -998,6 +1252,8 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_scheduler = _async_get_template_render_scheduler(hass)
+        self._render_stats: dict[Template, TemplateRenderStats] = {}
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1019,8 +1275,8 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -1040,8 +1296,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_to_info(
+                template, variables, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -1055,8 +1311,11 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._refresh_from_event,
         )
+        self._render_scheduler.async_add_tracker(self)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1113,14 +1372,87 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._render_scheduler.async_remove_tracker(self)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
+    @property
+    def render_stats(self) -> dict[Template, TemplateRenderStats]:
+        """Render cost of the tracked templates recorded while profiling."""
+        return self._render_stats
+
     @callback
     def async_refresh(self) -> None:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_from_events(
+        self, events: list[Event[EventStateChangedData]]
+    ) -> None:
+        """Refresh the templates once for state changes fired together."""
+        if len(events) == 1:
+            self._refresh(events[0])
+            return
+        self._refresh(events[-1], coalesced_events=events)
+
+    @callback
+    def _refresh_from_event(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh the templates, coalesced with other changes fired together."""
+        self._render_scheduler.async_schedule_refresh(self, event)
+
+    def _triggering_event(
+        self,
+        track_template_: TrackTemplate,
+        event: Event[EventStateChangedData] | None,
+        coalesced_events: list[Event[EventStateChangedData]] | None,
+    ) -> Event[EventStateChangedData] | None:
+        """Return the event a template should be re-rendered for.
+
+        Of the coalesced events, the most recent one for an entity
+        referenced by the template is preferred since it is not rate
+        limited.
+        """
+        if event is None or not coalesced_events:
+            return event
+        info = self._info[track_template_.template]
+        triggering_event: Event[EventStateChangedData] | None = None
+        for coalesced_event in reversed(coalesced_events):
+            if coalesced_event.data["entity_id"] in info.entities:
+                return coalesced_event
+            if triggering_event is None and _event_triggers_rerender(
+                coalesced_event, info
+            ):
+                triggering_event = coalesced_event
+        return triggering_event or event
+
+    def _render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render a template to info and record the render cost while profiling."""
+        if not self._render_scheduler.profiling:
+            return template.async_render_to_info(
+                variables, strict=strict, log_fn=log_fn
+            )
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables, strict=strict, log_fn=log_fn)
+        render_time = time.perf_counter() - start
+        stats = self._get_render_stats(template)
+        stats.renders += 1
+        stats.total_time += render_time
+        stats.render_times.append(render_time)
+        return info
+
+    def _get_render_stats(self, template: Template) -> TemplateRenderStats:
+        """Return the render stats of a template."""
+        if (stats := self._render_stats.get(template)) is None:
+            stats = self._render_stats[template] = TemplateRenderStats()
+        return stats
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1156,8 +1488,13 @@ class TrackTemplateResultInfo:
                 (track_template_,),
                 True,
             ):
+                if self._render_scheduler.profiling:
+                    self._get_render_stats(template).rate_limited += 1
                 return not had_timer
 
+            if self._render_scheduler.profiling:
+                self._get_render_stats(template).triggers[event.data["entity_id"]] += 1
+
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
                 template.template,
@@ -1165,8 +1502,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -1217,6 +1554,7 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        coalesced_events: list[Event[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1229,8 +1567,14 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        coalesced_events is an optional list of state_changed events
+        fired together, ending with event. Each template is re-rendered
+        at most once for them and the action is passed the most recent
+        of them which triggered a changed template.
         """
         updates: list[TrackTemplateResult] = []
+        update_events: list[Event[EventStateChangedData]] = []
         info_changed = False
         now = event.time_fired_timestamp if not replayed and event else time.time()
 
@@ -1241,8 +1585,15 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            triggering_event = self._triggering_event(
+                super_template, event, coalesced_events
+            )
+            update = self._render_template_if_ready(
+                super_template, now, triggering_event
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
+            if isinstance(update, TrackTemplateResult) and triggering_event:
+                update_events.append(triggering_event)
 
             if isinstance(update, TrackTemplateResult):
                 super_result = update.result
@@ -1264,6 +1615,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                coalesced_events = None
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1272,10 +1624,17 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                triggering_event = self._triggering_event(
+                    track_template_, event, coalesced_events
+                )
+                update = self._render_template_if_ready(
+                    track_template_, now, triggering_event
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
+                if isinstance(update, TrackTemplateResult) and triggering_event:
+                    update_events.append(triggering_event)
 
         if info_changed:
             assert self._track_state_changes
@@ -1305,6 +1664,11 @@ class TrackTemplateResultInfo:
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
+        if coalesced_events and update_events:
+            # The last state change of the batch may not be one the
+            # changed templates depend on
+            event = max(update_events, key=coalesced_events.index)
+
         self.hass.async_run_hass_job(self._job, event, updates)
 
 
@@ -1481,49 +1845,173 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
-@dataclass(slots=True)
+class _PointInTimeTimerWheel:
+    """Group point in time timers into slots of TIMER_WHEEL_RESOLUTION seconds.
+
+    Only the earliest slot holding timers has a loop timer, armed for the
+    earliest timer of that slot. Each wakeup fires every timer which is due,
+    in order of their due time, and rearms for the earliest one left.
+    Cancelled timers are removed from their slot right away.
+    """
+
+    __slots__ = ("hass", "_slots", "_slot_heap", "_handle", "_handle_timestamp")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self._slots: dict[int, dict[_TrackPointUTCTime, None]] = {}
+        # May hold slots which have no timers left, they are skipped
+        self._slot_heap: list[int] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_timestamp = 0.0
+
+    @callback
+    def async_add(self, timer: _TrackPointUTCTime) -> None:
+        """Add a timer."""
+        timestamp = timer.expected_fire_timestamp
+        slot = int(timestamp // TIMER_WHEEL_RESOLUTION)
+        if (timers := self._slots.get(slot)) is None:
+            timers = self._slots[slot] = {}
+            heappush(self._slot_heap, slot)
+        timers[timer] = None
+        timer.scheduled = True
+        if self._handle is None or timestamp < self._handle_timestamp:
+            self._async_arm(timestamp)
+
+    @callback
+    def async_cancel(self, timer: _TrackPointUTCTime) -> None:
+        """Cancel a timer."""
+        if not timer.scheduled:
+            return
+        timer.scheduled = False
+        slot = int(timer.expected_fire_timestamp // TIMER_WHEEL_RESOLUTION)
+        timers = self._slots[slot]
+        del timers[timer]
+        if not timers:
+            del self._slots[slot]
+            if len(self._slot_heap) > 2 * len(self._slots) + 16:
+                # A sorted list is a valid heap
+                self._slot_heap = sorted(self._slots)
+        if timer.expected_fire_timestamp == self._handle_timestamp:
+            self._async_schedule()
+
+    @callback
+    def _async_arm(self, fire_timestamp: float) -> None:
+        """Arm the loop timer for a timestamp."""
+        if self._handle is not None:
+            self._handle.cancel()
+        loop = self.hass.loop
+        self._handle = loop.call_at(
+            loop.time() + fire_timestamp - time.time(), self._async_fire
+        )
+        self._handle_timestamp = fire_timestamp
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the loop timer for the earliest timer, or cancel it if none is left."""
+        slots = self._slots
+        slot_heap = self._slot_heap
+        while slot_heap and slot_heap[0] not in slots:
+            heappop(slot_heap)
+        if not slot_heap:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            return
+        fire_timestamp = min(
+            timer.expected_fire_timestamp for timer in slots[slot_heap[0]]
+        )
+        if self._handle is None or fire_timestamp != self._handle_timestamp:
+            self._async_arm(fire_timestamp)
+
+    @callback
+    def _async_fire(self) -> None:
+        """Fire the timers which are due."""
+        self._handle = None
+        now = time_tracker_timestamp()
+        slots = self._slots
+        slot_heap = self._slot_heap
+        due: list[_TrackPointUTCTime] = []
+        while slot_heap:
+            slot = slot_heap[0]
+            if (timers := slots.get(slot)) is None:
+                heappop(slot_heap)
+                continue
+            if slot * TIMER_WHEEL_RESOLUTION > now:
+                break
+            for timer in [
+                timer for timer in timers if timer.expected_fire_timestamp <= now
+            ]:
+                timer.scheduled = False
+                del timers[timer]
+                due.append(timer)
+            if timers:
+                break
+            heappop(slot_heap)
+            del slots[slot]
+
+        if not due:
+            # Depending on the available clock support (including timer
+            # hardware and the OS kernel) it can happen that we fire a little
+            # bit too early as measured by utcnow(). That is bad when callbacks
+            # have assumptions about the current time. Thus, we rearm the
+            # timer for the remaining time.
+            _LOGGER.debug(
+                "Called %f seconds too early, rearming", self._handle_timestamp - now
+            )
+        self._async_schedule()
+
+        # Timers added while firing wait for the next wakeup
+        due.sort(key=attrgetter("expected_fire_timestamp"))
+        loop = self.hass.loop
+        for timer in due:
+            try:
+                timer()
+            except Exception as err:  # noqa: BLE001
+                loop.call_exception_handler(
+                    {"message": f"Exception in callback {timer!r}", "exception": err}
+                )
+
+
+@callback
+def _async_get_point_in_time_timer_wheel(
+    hass: HomeAssistant,
+) -> _PointInTimeTimerWheel:
+    """Return the point in time timer wheel."""
+    if (wheel := hass.data.get(_POINT_IN_TIME_TIMER_WHEEL)) is None:
+        wheel = hass.data[_POINT_IN_TIME_TIMER_WHEEL] = _PointInTimeTimerWheel(hass)
+    return wheel
+
+
+@dataclass(slots=True, eq=False)
 class _TrackPointUTCTime:
     hass: HomeAssistant
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    scheduled: bool = False
+    _wheel: _PointInTimeTimerWheel | None = field(default=None, repr=False)
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
-        )
+        self._wheel = _async_get_point_in_time_timer_wheel(self.hass)
+        self._wheel.async_add(self)
 
     @callback
     def __call__(self) -> None:
         """Call the action.
 
         We implement this as __call__ so when debug logging logs the object
-        it shows the name of the job. This is especially helpful when asyncio
-        debug logging is enabled as we can see the name of the job that is
-        being called that is blocking the event loop.
+        it shows the name of the job.
         """
-        # Depending on the available clock support (including timer hardware
-        # and the OS kernel) it can happen that we fire a little bit too early
-        # as measured by utcnow(). That is bad when callbacks have assumptions
-        # about the current time. Thus, we rearm the timer for the remaining
-        # time.
-        if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
-            return
-
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback.cancel()
+            assert self._wheel is not None
+        self._wheel.async_cancel(self)
 
 
 @callback
@@ -0,0 +1,326 @@
+"""Monitor the event loop latency and attribute stalls to jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LOOP_MONITOR: HassKey[LoopMonitor] = HassKey("loop_monitor")
+
+# Seconds between two heartbeats of the event loop
+HEARTBEAT_INTERVAL = 0.05
+# Seconds between two checks of the heartbeat by the watchdog thread
+SAMPLE_INTERVAL = 0.025
+# A heartbeat late by at least this many seconds is a stall
+STALL_THRESHOLD = 0.1
+# Stack samples kept for a single stall
+MAX_STALL_SAMPLES = 400
+# Upper bounds in seconds of the loop lag histogram buckets,
+# lags above the last bound are counted in an extra bucket
+LAG_HISTOGRAM_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+_COMPONENT_PATHS = ("custom_components/", "homeassistant/components/")
+_RUN_HASS_JOB_CODE = HomeAssistant.async_run_hass_job.__code__
+_HANDLE_RUN_CODE = asyncio.Handle._run.__code__  # noqa: SLF001
+
+type LoopStallOwner = tuple[str | None, str | None]
+
+
+@dataclass(slots=True)
+class LoopStall:
+    """A stall of the event loop.
+
+    owners counts the stack samples taken during the stall by the
+    integration and job which was running.
+    """
+
+    time_fired: float
+    duration: float
+    owners: Counter[LoopStallOwner]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stall."""
+        return {
+            "time_fired": self.time_fired,
+            "duration": self.duration,
+            "owners": [
+                {"integration": integration, "job": job, "samples": samples}
+                for (integration, job), samples in self.owners.most_common()
+            ],
+        }
+
+
+@dataclass(slots=True)
+class LoopStallOwnerStats:
+    """Stalls attributed to an integration and job."""
+
+    stalls: int = 0
+    samples: int = 0
+    max_stall: float = 0
+
+
+@dataclass(slots=True)
+class LoopMonitorStats:
+    """Lag and stall statistics of the event loop."""
+
+    lag_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LAG_HISTOGRAM_BOUNDS) + 1)
+    )
+    max_lag: float = 0
+    stalls: int = 0
+    owners: dict[LoopStallOwner, LoopStallOwnerStats] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "lag_histogram": [
+                {"le": bound, "count": count}
+                for bound, count in zip(
+                    (*LAG_HISTOGRAM_BOUNDS, None), self.lag_histogram, strict=True
+                )
+            ],
+            "max_lag": self.max_lag,
+            "stalls": self.stalls,
+            "owners": [
+                {
+                    "integration": integration,
+                    "job": job,
+                    "stalls": owner_stats.stalls,
+                    "blocked_time": owner_stats.samples * SAMPLE_INTERVAL,
+                    "max_stall": owner_stats.max_stall,
+                }
+                for (integration, job), owner_stats in sorted(
+                    self.owners.items(),
+                    key=lambda item: item[1].samples,
+                    reverse=True,
+                )
+            ],
+        }
+
+
+def _stall_owner(frame: FrameType | None) -> LoopStallOwner:
+    """Return the integration and job of a stack sampled from the event loop.
+
+    The job is the function run by the innermost HassJob, or the callback
+    or task the event loop is running when no HassJob is. Only the code
+    objects of the frames are read, since the locals of the frames belong
+    to the event loop thread.
+    """
+    integration: str | None = None
+    job: str | None = None
+    loop_callback: str | None = None
+    inner_code: CodeType | None = None
+    while frame is not None:
+        code = frame.f_code
+        if integration is None:
+            filename = code.co_filename
+            for path in _COMPONENT_PATHS:
+                if (index := filename.find(path)) != -1:
+                    start = index + len(path)
+                    integration = filename[start : filename.find("/", start)]
+                    break
+        if inner_code is not None:
+            if code is _RUN_HASS_JOB_CODE:
+                if job is None:
+                    job = inner_code.co_qualname
+            elif code is _HANDLE_RUN_CODE:
+                loop_callback = inner_code.co_qualname
+        inner_code = code
+        frame = frame.f_back
+    return integration, job or loop_callback
+
+
+class LoopMonitor:
+    """Monitor the event loop latency.
+
+    Once started, a heartbeat is scheduled on the event loop every
+    HEARTBEAT_INTERVAL and the lag of each heartbeat is counted in a
+    histogram. While something is subscribed to the monitor, a watchdog
+    thread also samples the stack of the event loop thread while a heartbeat
+    is late by more than STALL_THRESHOLD, so stalls can be attributed to the
+    integration and job which was running without timing every callback.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self.stats = LoopMonitorStats()
+        # The heartbeat is due at _expected on the event loop clock and at
+        # _expected_monotonic on the clock of the watchdog thread
+        self._expected = 0.0
+        self._expected_monotonic = 0.0
+        self._heartbeat_handle: asyncio.TimerHandle | None = None
+        # The samples are appended by the watchdog thread
+        self._samples: list[LoopStallOwner] = []
+        self._samples_lock = threading.Lock()
+        self._stop: threading.Event | None = None
+        self._listeners: list[Callable[[LoopStall], None]] = []
+
+    @property
+    def running(self) -> bool:
+        """Return if the heartbeat of the event loop is monitored."""
+        return self._heartbeat_handle is not None
+
+    @property
+    def sampling(self) -> bool:
+        """Return if the stack of the event loop is sampled during stalls."""
+        return self._stop is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring the heartbeat of the event loop."""
+        if self._heartbeat_handle is None:
+            self._async_schedule_heartbeat(self.hass.loop.time())
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring the event loop."""
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+        self._async_stop_sampling()
+
+    @callback
+    def _async_start_sampling(self) -> None:
+        """Start the watchdog thread sampling the stack during stalls."""
+        if self._stop is not None:
+            return
+        self._stop = stop = threading.Event()
+        with self._samples_lock:
+            self._samples = []
+        threading.Thread(
+            target=self._watch, args=(stop,), name="LoopMonitor", daemon=True
+        ).start()
+
+    @callback
+    def _async_stop_sampling(self) -> None:
+        """Stop the watchdog thread.
+
+        The watchdog thread exits as soon as it is woken up, so it is not
+        joined.
+        """
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    @callback
+    def async_subscribe(self, listener: Callable[[LoopStall], None]) -> CALLBACK_TYPE:
+        """Subscribe to the stalls of the event loop.
+
+        The stack of the event loop is sampled while there are subscribers.
+        """
+        self._listeners.append(listener)
+        self.async_start()
+        self._async_start_sampling()
+
+        @callback
+        def _async_unsubscribe() -> None:
+            self._listeners.remove(listener)
+            if not self._listeners:
+                self._async_stop_sampling()
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_schedule_heartbeat(self, now: float) -> None:
+        """Schedule the next heartbeat."""
+        self._expected = now + HEARTBEAT_INTERVAL
+        self._expected_monotonic = time.monotonic() + HEARTBEAT_INTERVAL
+        self._heartbeat_handle = self.hass.loop.call_at(
+            self._expected, self._async_heartbeat
+        )
+
+    @callback
+    def _async_heartbeat(self) -> None:
+        """Record the lag of a heartbeat."""
+        now = self.hass.loop.time()
+        lag = now - self._expected
+        stats = self.stats
+        stats.lag_histogram[bisect_left(LAG_HISTOGRAM_BOUNDS, lag)] += 1
+        stats.max_lag = max(stats.max_lag, lag)
+        if lag >= STALL_THRESHOLD:
+            if self._stop is None:
+                # Stalls are only attributed to jobs while sampling
+                stats.stalls += 1
+            else:
+                self._async_record_stall(lag)
+        self._async_schedule_heartbeat(now)
+
+    @callback
+    def _async_record_stall(self, lag: float) -> None:
+        """Attribute a stall to the jobs sampled while it lasted."""
+        with self._samples_lock:
+            samples = self._samples
+            self._samples = []
+        owners = Counter(samples)
+        if not owners:
+            # The stall was too short to be sampled
+            owners[(None, None)] = 0
+        stall = LoopStall(time.time() - lag, lag, owners)
+        stats = self.stats
+        stats.stalls += 1
+        for owner, owner_samples in owners.items():
+            if (owner_stats := stats.owners.get(owner)) is None:
+                owner_stats = stats.owners[owner] = LoopStallOwnerStats()
+            owner_stats.stalls += 1
+            owner_stats.samples += owner_samples
+            owner_stats.max_stall = max(owner_stats.max_stall, lag)
+        integration, job = owners.most_common(1)[0][0]
+        _LOGGER.debug(
+            "Event loop stalled for %.3f seconds in %s (%s)", lag, job, integration
+        )
+        for listener in self._listeners.copy():
+            listener(stall)
+
+    def _watch(self, stop: threading.Event) -> None:
+        """Sample the stack of the event loop thread while it is stalled.
+
+        This runs in the watchdog thread.
+        """
+        loop_thread_id = self.hass.loop_thread_id
+        samples_lock = self._samples_lock
+        while not stop.wait(SAMPLE_INTERVAL):
+            if (
+                time.monotonic() - self._expected_monotonic < STALL_THRESHOLD
+                or len(self._samples) >= MAX_STALL_SAMPLES
+            ):
+                continue
+            frame = sys._current_frames().get(loop_thread_id)  # noqa: SLF001
+            owner = _stall_owner(frame)
+            # Do not keep the frames of the event loop alive
+            del frame
+            with samples_lock:
+                self._samples.append(owner)
+
+
+@callback
+def async_get_loop_monitor(hass: HomeAssistant) -> LoopMonitor:
+    """Return the event loop monitor.
+
+    The stack of the event loop is only sampled while the monitor has
+    subscribers.
+    """
+    if (monitor := hass.data.get(DATA_LOOP_MONITOR)) is None:
+        monitor = hass.data[DATA_LOOP_MONITOR] = LoopMonitor(hass)
+
+        @callback
+        def _async_stop_monitor(_: Event) -> None:
+            monitor.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_stop_monitor)
+    return monitor
@@ -5,16 +5,21 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Collection, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -22,6 +27,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -29,7 +35,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -49,6 +55,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -85,6 +92,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +110,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -153,6 +162,18 @@ CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+# The stored code is capped at 4 MiB, the keys and JSON add about 70 bytes
+# per entry so the file stays under 5 MiB. A typical template compiles to
+# 1-4 KiB of stored code, so this holds about a thousand templates.
+BYTECODE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+# Compiled code can only be reused by the same Home Assistant, Python
+# and Jinja versions
+BYTECODE_CACHE_STAMP = f"{__version__}-{MAGIC_NUMBER.hex()}-{jinja2.__version__}"
+FAST_PATH_CACHE_SIZE = 4096
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -500,6 +521,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_path",
         "_exc_info",
         "_limited",
         "_strict",
@@ -532,6 +554,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_path: _FastPath | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -630,7 +653,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            # Variables shadowing the names used by the fast path need Jinja
+            fast_path = self._fast_path
+            if fast_path is not None and fast_path.names.isdisjoint(kwargs):
+                render_result = _render_fast_path_with_context(self.template, fast_path)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -821,6 +849,21 @@ class Template:
 
         return self._parse_result(render_result)
 
+    def depends_only_on(self, variables: Collection[str]) -> bool:
+        """Return if rendering the template only depends on the given variables.
+
+        Templates which may read the state machine, the time or anything else
+        outside of the variables are reported as not depending only on them.
+        """
+        if self.is_static:
+            return True
+        env = self._env
+        try:
+            node = env.parse(self.template)
+        except jinja2.TemplateError:
+            return False
+        return _depends_only_on(node, variables, env.globals)
+
     def _ensure_compiled(
         self,
         limited: bool = False,
@@ -851,6 +894,10 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        # Limited templates can not call the state functions and a custom
+        # log function creates a new environment for every template
+        if not limited and log_fn is None:
+            self._fast_path = env.async_get_fast_path(self.template)
 
         return self._compiled
 
@@ -1211,11 +1258,13 @@ def _state_generator(
     # We do not want to expose this method in the public API though to
     # ensure it does not get misused.
     #
+    # The states of a domain are iterated from a snapshot which is shared
+    # by all renders until a state of the domain changes.
     container: Iterable[State]
     if domain is None:
         container = states._states.values()  # noqa: SLF001
     else:
-        container = states.async_all(domain)
+        container = states.async_all_snapshot(domain)
     for state in container:
         yield _template_state_no_collect(hass, state)
 
@@ -2735,6 +2784,376 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _render_fast_path_with_context(template_str: str, fast_path: _FastPath) -> str:
+    """Store template being rendered in a ContextVar and render its fast path."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return fast_path.render()
+
+
+# Filters and tests whose result only depends on their arguments
+_PURE_FILTERS = frozenset(
+    {
+        # Jinja
+        "abs",
+        "capitalize",
+        "center",
+        "count",
+        "d",
+        "default",
+        "dictsort",
+        "first",
+        "format",
+        "indent",
+        "items",
+        "join",
+        "last",
+        "length",
+        "list",
+        "lower",
+        "replace",
+        "reverse",
+        "sort",
+        "string",
+        "sum",
+        "title",
+        "trim",
+        "truncate",
+        "unique",
+        "upper",
+        "wordcount",
+        # Home Assistant
+        "acos",
+        "add",
+        "as_datetime",
+        "as_timedelta",
+        "as_timestamp",
+        "asin",
+        "atan",
+        "atan2",
+        "average",
+        "base64_decode",
+        "base64_encode",
+        "bitwise_and",
+        "bitwise_or",
+        "bitwise_xor",
+        "bool",
+        "contains",
+        "cos",
+        "float",
+        "from_json",
+        "iif",
+        "int",
+        "is_defined",
+        "is_number",
+        "log",
+        "max",
+        "median",
+        "min",
+        "multiply",
+        "ord",
+        "ordinal",
+        "pack",
+        "regex_findall",
+        "regex_findall_index",
+        "regex_match",
+        "regex_replace",
+        "regex_search",
+        "round",
+        "sin",
+        "slugify",
+        "sqrt",
+        "statistical_mode",
+        "tan",
+        "to_json",
+        "unpack",
+    }
+)
+_PURE_TESTS = frozenset(
+    {
+        # Jinja
+        "boolean",
+        "defined",
+        "divisibleby",
+        "eq",
+        "even",
+        "false",
+        "float",
+        "ge",
+        "gt",
+        "in",
+        "integer",
+        "iterable",
+        "le",
+        "lower",
+        "lt",
+        "mapping",
+        "ne",
+        "none",
+        "number",
+        "odd",
+        "sequence",
+        "string",
+        "true",
+        "undefined",
+        "upper",
+        # Home Assistant
+        "contains",
+        "datetime",
+        "is_number",
+        "list",
+        "match",
+        "search",
+        "set",
+        "string_like",
+        "tuple",
+    }
+)
+# Nodes which load other templates or access the render context
+_IMPURE_NODES = (
+    nodes.ContextReference,
+    nodes.DerivedContextReference,
+    nodes.Extends,
+    nodes.FromImport,
+    nodes.Import,
+    nodes.Include,
+)
+
+
+def _depends_only_on(
+    node: nodes.Template, variables: Collection[str], global_names: Collection[str]
+) -> bool:
+    """Return if a parsed template only depends on the given variables.
+
+    Names assigned in the template, loop and the filters and tests which only
+    depend on their arguments are allowed, anything else could read state.
+    Assigning a name shadowing a global is not allowed since the global could
+    be called before it is shadowed.
+    """
+    if any(True for _ in node.find_all(_IMPURE_NODES)):
+        return False
+    names = list(node.find_all(nodes.Name))
+    allowed = {"loop", *variables}
+    allowed.update(
+        name.name
+        for name in names
+        if name.ctx != "load" and name.name not in global_names
+    )
+    return (
+        all(name.name in allowed for name in names)
+        and all(
+            filter_.name in _PURE_FILTERS for filter_ in node.find_all(nodes.Filter)
+        )
+        and all(test.name in _PURE_TESTS for test in node.find_all(nodes.Test))
+    )
+
+
+class _FastPathUnsupported(Exception):
+    """Raised when a template can not be lowered to a fast path."""
+
+
+class _FastPath:
+    """A template lowered to a native Python closure."""
+
+    __slots__ = ("render", "names")
+
+    def __init__(self, render: Callable[[], str], names: frozenset[str]) -> None:
+        """Initialize the fast path."""
+        self.render = render
+        self.names = names
+
+
+# Functions and filters the fast path can call, they are looked up in the
+# environment so the fast path calls exactly what the Jinja render would.
+# The functions taking a Jinja context must ignore it.
+_FAST_PATH_GLOBALS = {
+    "float",
+    "has_value",
+    "int",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "states",
+}
+_FAST_PATH_FILTERS = {"float", "int", "round"}
+_FAST_PATH_BINARY_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+}
+_FAST_PATH_UNARY_OPERATORS: dict[str, Callable[[Any], Any]] = {
+    "+": operator.pos,
+    "-": operator.neg,
+    "not": operator.not_,
+}
+_FAST_PATH_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda value, container: value in container,
+    "notin": lambda value, container: value not in container,
+}
+
+
+class _FastPathCompiler:
+    """Lower simple state reading templates to native Python closures.
+
+    Only a single output of constants, calls to the state functions, the
+    float, int and round filters, arithmetic, comparisons and boolean logic
+    is lowered. Everything else is rendered by Jinja.
+    """
+
+    def __init__(self, env: TemplateEnvironment) -> None:
+        """Initialize the compiler."""
+        self._env = env
+        self._names: set[str] = set()
+
+    def compile(self, source: str) -> _FastPath | None:
+        """Return the fast path of a template source, if it has one."""
+        try:
+            tree = self._env.parse(source)
+        except jinja2.TemplateSyntaxError:
+            return None
+        if len(tree.body) != 1 or not isinstance(output := tree.body[0], nodes.Output):
+            return None
+        try:
+            parts = [self._lower_output(node) for node in output.nodes]
+        except _FastPathUnsupported:
+            return None
+        if len(parts) == 1:
+            render = parts[0]
+        else:
+
+            def render() -> str:
+                return "".join([part() for part in parts])
+
+        return _FastPath(render, frozenset(self._names))
+
+    def _lower_output(self, node: nodes.Node) -> Callable[[], str]:
+        """Lower a node of the output."""
+        if isinstance(node, nodes.TemplateData):
+            data: str = node.data
+            return lambda: data
+        expr = self._lower(node)
+        return lambda: str(expr())
+
+    def _lower(self, node: nodes.Node) -> Callable[[], Any]:
+        """Lower an expression."""
+        if isinstance(node, nodes.Const):
+            value = node.value
+            return lambda: value
+        if isinstance(node, nodes.List):
+            items = [self._lower(item) for item in node.items]
+            return lambda: [item() for item in items]
+        if isinstance(node, nodes.Tuple):
+            items = [self._lower(item) for item in node.items]
+            return lambda: tuple([item() for item in items])
+        if isinstance(node, nodes.Call):
+            return self._lower_call(node)
+        if isinstance(node, nodes.Filter):
+            return self._lower_filter(node)
+        if isinstance(node, nodes.And):
+            left, right = self._lower(node.left), self._lower(node.right)
+            return lambda: left() and right()
+        if isinstance(node, nodes.Or):
+            left, right = self._lower(node.left), self._lower(node.right)
+            return lambda: left() or right()
+        if isinstance(node, nodes.BinExpr) and (
+            binary_op := _FAST_PATH_BINARY_OPERATORS.get(node.operator)
+        ):
+            left, right = self._lower(node.left), self._lower(node.right)
+            return lambda: binary_op(left(), right())
+        if isinstance(node, nodes.UnaryExpr) and (
+            unary_op := _FAST_PATH_UNARY_OPERATORS.get(node.operator)
+        ):
+            operand = self._lower(node.node)
+            return lambda: unary_op(operand())
+        if isinstance(node, nodes.Compare):
+            return self._lower_compare(node)
+        if isinstance(node, nodes.CondExpr) and node.expr2 is not None:
+            test = self._lower(node.test)
+            expr1, expr2 = self._lower(node.expr1), self._lower(node.expr2)
+            return lambda: expr1() if test() else expr2()
+        raise _FastPathUnsupported
+
+    def _lower_arguments(
+        self, node: nodes.Call | nodes.Filter
+    ) -> tuple[list[Callable[[], Any]], dict[str, Callable[[], Any]]]:
+        """Lower the arguments of a call or filter."""
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise _FastPathUnsupported
+        return (
+            [self._lower(arg) for arg in node.args],
+            {keyword.key: self._lower(keyword.value) for keyword in node.kwargs},
+        )
+
+    def _lower_call(self, node: nodes.Call) -> Callable[[], Any]:
+        """Lower a call to a state function."""
+        if (
+            not isinstance(node.node, nodes.Name)
+            or (name := node.node.name) not in _FAST_PATH_GLOBALS
+        ):
+            raise _FastPathUnsupported
+        self._names.add(name)
+        func = self._env.globals[name]
+        args, kwargs = self._lower_arguments(node)
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            func = partial(func, None)
+        if not kwargs:
+            return lambda: func(*[arg() for arg in args])
+        return lambda: func(
+            *[arg() for arg in args], **{key: arg() for key, arg in kwargs.items()}
+        )
+
+    def _lower_filter(self, node: nodes.Filter) -> Callable[[], Any]:
+        """Lower a float, int or round filter."""
+        if node.node is None or node.name not in _FAST_PATH_FILTERS:
+            raise _FastPathUnsupported
+        func = self._env.filters[node.name]
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            raise _FastPathUnsupported
+        value = self._lower(node.node)
+        args, kwargs = self._lower_arguments(node)
+        if not kwargs:
+            return lambda: func(value(), *[arg() for arg in args])
+        return lambda: func(
+            value(),
+            *[arg() for arg in args],
+            **{key: arg() for key, arg in kwargs.items()},
+        )
+
+    def _lower_compare(self, node: nodes.Compare) -> Callable[[], Any]:
+        """Lower a comparison, chained comparisons short circuit like Python."""
+        expr = self._lower(node.expr)
+        try:
+            ops = [
+                (_FAST_PATH_COMPARE_OPERATORS[operand.op], self._lower(operand.expr))
+                for operand in node.ops
+            ]
+        except KeyError as err:
+            raise _FastPathUnsupported from err
+        if len(ops) == 1:
+            compare_op, right = ops[0]
+            return lambda: compare_op(expr(), right())
+
+        def compare() -> Any:
+            left = expr()
+            result: Any = True
+            for compare_op, right in ops:
+                right_value = right()
+                if not (result := compare_op(left, right_value)):
+                    return result
+                left = right_value
+            return result
+
+        return compare
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2787,6 +3206,135 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled code of the templates seen in previous runs."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+class TemplateBytecodeCache:
+    """Persist the compiled code of templates between restarts.
+
+    Entries are keyed by a hash of the template source and the flavor of
+    the environment compiling it. They stay marshaled until a template
+    asks for them, and the least recently used entries are dropped once
+    they take more than BYTECODE_CACHE_MAX_BYTES. The cache is only saved
+    when entries were added.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        # Ordered from least to most recently used
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+        # Templates may be compiled outside of the event loop
+        self._lock = threading.Lock()
+        # Keys of the sources which have no fast path
+        self._without_fast_path: set[str] = set()
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        data = await self._store.async_load()
+        if not data or data.get("stamp") != BYTECODE_CACHE_STAMP:
+            return
+        # Entries are stored from least to most recently used
+        with self._lock:
+            for key, marshaled in data["templates"].items():
+                self._add(key, marshaled)
+        self._without_fast_path.update(data.get("without_fast_path", ()))
+
+    @staticmethod
+    def key(flavor: str, source: str) -> str:
+        """Return the cache key of a template source."""
+        return hashlib.sha256(f"{flavor}\0{source}".encode()).hexdigest()
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code for a key."""
+        with self._lock:
+            if (marshaled := self._cache.get(key)) is None:
+                return None
+            self._cache.move_to_end(key)
+        try:
+            return cast(CodeType, marshal.loads(base64.b64decode(marshaled)))
+        except (EOFError, TypeError, ValueError):
+            with self._lock:
+                self._remove(key)
+            return None
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the compiled code for a key."""
+        marshaled = base64.b64encode(marshal.dumps(code)).decode()
+        with self._lock:
+            if key in self._cache:
+                return
+            self._add(key, marshaled)
+        self._schedule_save()
+
+    def _add(self, key: str, marshaled: str) -> None:
+        """Add an entry and drop the least recently used ones over the limit."""
+        cache = self._cache
+        self._remove(key)
+        cache[key] = marshaled
+        self._size += len(marshaled)
+        while self._size > BYTECODE_CACHE_MAX_BYTES:
+            _, dropped = cache.popitem(last=False)
+            self._size -= len(dropped)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry."""
+        if (marshaled := self._cache.pop(key, None)) is not None:
+            self._size -= len(marshaled)
+
+    def lacks_fast_path(self, key: str) -> bool:
+        """Return if the source of a key is known to have no fast path."""
+        return key in self._without_fast_path
+
+    def set_lacks_fast_path(self, key: str) -> None:
+        """Remember that the source of a key has no fast path."""
+        if key in self._without_fast_path:
+            return
+        self._without_fast_path.add(key)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the cache from any thread."""
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            # Templates may be compiled outside of the event loop
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._save_scheduled = False
+        with self._lock:
+            templates = dict(self._cache)
+        # Only keep the fast path decisions of the cached sources
+        self._without_fast_path = {
+            key for key in self._without_fast_path if key in templates
+        }
+        return {
+            "stamp": BYTECODE_CACHE_STAMP,
+            "templates": templates,
+            "without_fast_path": sorted(self._without_fast_path),
+        }
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2854,9 +3402,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.flavor = "limited" if limited else "strict" if strict else "normal"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.fast_path_cache: LRU[str, _FastPath | None] = LRU(FAST_PATH_CACHE_SIZE)
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3209,9 +3759,41 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE))
+        ):
+            key = bytecode_cache.key(self.flavor, source)
+            if (compiled := bytecode_cache.get(key)) is None:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
+    def async_get_fast_path(self, source: str) -> _FastPath | None:
+        """Return the fast path of a template source, if it has one.
+
+        Sources which the bytecode cache knows to have no fast path are not
+        parsed again.
+        """
+        if (cached := self.fast_path_cache.get(source, _SENTINEL)) is not _SENTINEL:
+            return cast(_FastPath | None, cached)
+        bytecode_cache = (
+            self.hass.data.get(_BYTECODE_CACHE) if self.hass is not None else None
+        )
+        key = bytecode_cache.key(self.flavor, source) if bytecode_cache else ""
+        fast_path: _FastPath | None
+        if bytecode_cache and bytecode_cache.lacks_fast_path(key):
+            fast_path = None
+        else:
+            fast_path = _FastPathCompiler(self).compile(source)
+            if fast_path is None and bytecode_cache:
+                bytecode_cache.set_lacks_fast_path(key)
+        self.fast_path_cache[source] = fast_path
+        return fast_path
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
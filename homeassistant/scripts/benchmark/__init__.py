@@ -4,12 +4,24 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from collections.abc import Callable
-from contextlib import suppress
+from collections import deque
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from itertools import count
 import logging
+import os
+import socket
+import statistics
+import tempfile
+import time
 from timeit import default_timer as timer
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 from homeassistant import core
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -24,6 +36,19 @@ from homeassistant.helpers.json import JSON_DUMP
 BENCHMARKS: dict[str, Callable] = {}
 
 
+@dataclass(slots=True)
+class MqttIngressOptions:
+    """Options of the MQTT ingress benchmark."""
+
+    devices: int = 1000
+    messages: int = 10**5
+    rate: int = 0
+    fan_out: int = 1
+
+
+MQTT_INGRESS_OPTIONS = MqttIngressOptions()
+
+
 def run(args):
     """Handle benchmark commandline script."""
     # Disable logging
@@ -32,8 +57,38 @@ def run(args):
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--mqtt-devices",
+        type=int,
+        default=MQTT_INGRESS_OPTIONS.devices,
+        help="Devices discovered by the MQTT ingress benchmark",
+    )
+    parser.add_argument(
+        "--mqtt-messages",
+        type=int,
+        default=MQTT_INGRESS_OPTIONS.messages,
+        help="State messages replayed by the MQTT ingress benchmark",
+    )
+    parser.add_argument(
+        "--mqtt-rate",
+        type=int,
+        default=MQTT_INGRESS_OPTIONS.rate,
+        help="Messages per second replayed by the MQTT ingress benchmark, "
+        "0 replays them as fast as possible",
+    )
+    parser.add_argument(
+        "--mqtt-fan-out",
+        type=int,
+        default=MQTT_INGRESS_OPTIONS.fan_out,
+        help="Wildcard subscriptions matching each state message "
+        "in the MQTT ingress benchmark",
+    )
 
     args = parser.parse_args()
+    MQTT_INGRESS_OPTIONS.devices = args.mqtt_devices
+    MQTT_INGRESS_OPTIONS.messages = args.mqtt_messages
+    MQTT_INGRESS_OPTIONS.rate = args.mqtt_rate
+    MQTT_INGRESS_OPTIONS.fan_out = args.mqtt_fan_out
 
     bench = BENCHMARKS[args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
@@ -308,3 +363,256 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _percentiles(values: list[float]) -> str:
+    """Format the 50th, 95th and 99th percentile and maximum in milliseconds."""
+    if len(values) < 2:
+        return "not enough samples"
+    cut_points = statistics.quantiles(values, n=100)
+    return ", ".join(
+        f"{name} {value * 1000:.3f}ms"
+        for name, value in (
+            ("p50", cut_points[49]),
+            ("p95", cut_points[94]),
+            ("p99", cut_points[98]),
+            ("max", max(values)),
+        )
+    )
+
+
+@contextmanager
+def _patch_paho_client(
+    hass: core.HomeAssistant, sock: socket.socket, pending: deque[Any]
+) -> Generator[MagicMock]:
+    """Patch the paho client to read the pending messages from a socket pair.
+
+    Every read passes up to max_packets pending messages to on_message like
+    paho does for the packets it reads from the broker connection.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessageInfo
+
+    mids = count(1)
+
+    with patch(
+        "homeassistant.components.mqtt.async_client.AsyncMQTTClient"
+    ) as client_class:
+        paho = client_class.return_value
+
+        def _connect(*args: Any) -> int:
+            hass.loop.call_soon_threadsafe(paho.on_connect, paho, None, 0, 0, 0)
+            paho.on_socket_open(paho, None, sock)
+            return 0
+
+        def _disconnect(*args: Any) -> int:
+            hass.loop.call_soon_threadsafe(paho.on_socket_close, paho, None, sock)
+            return 0
+
+        def _acknowledged(callback_name: str) -> int:
+            mid = next(mids)
+            hass.loop.call_soon(getattr(paho, callback_name), paho, None, mid)
+            return mid
+
+        def _subscribe(*args: Any) -> tuple[int, int]:
+            return (0, _acknowledged("on_subscribe"))
+
+        def _unsubscribe(*args: Any) -> tuple[int, int]:
+            return (0, _acknowledged("on_unsubscribe"))
+
+        def _publish(*args: Any) -> MQTTMessageInfo:
+            return MQTTMessageInfo(_acknowledged("on_publish"))
+
+        def _loop_read(max_packets: int) -> int:
+            for _ in range(min(max_packets, len(pending))):
+                paho.on_message(paho, None, pending.popleft())
+            if not pending:
+                with suppress(BlockingIOError):
+                    sock.recv(4096)
+            return 0
+
+        paho.connect.side_effect = _connect
+        paho.disconnect.side_effect = _disconnect
+        paho.subscribe.side_effect = _subscribe
+        paho.unsubscribe.side_effect = _unsubscribe
+        paho.publish.side_effect = _publish
+        paho.loop_read.side_effect = _loop_read
+        paho.loop_misc.return_value = 0
+        yield paho
+
+
+@benchmark
+async def mqtt_ingress(hass):
+    """Replay discovery and state messages through the MQTT integration.
+
+    Only the paho client is patched. The messages are read from a socket pair
+    in batches of up to MAX_PACKETS_TO_READ messages, MQTT discovery sets up
+    a sensor entity for every device and the entities write their states.
+    The write latency is measured from the moment a message is queued.
+    """
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant import bootstrap, config as conf_util, loader
+    from homeassistant.components import mqtt
+
+    options = MQTT_INGRESS_OPTIONS
+    loop = hass.loop
+    pending: deque[MQTTMessage] = deque()
+    write_latencies: list[float] = []
+    wildcard_matches = 0
+
+    def _message(topic: str, payload: bytes, retain: bool = False) -> MQTTMessage:
+        msg = MQTTMessage(topic=topic.encode())
+        msg.payload = payload
+        msg.retain = retain
+        return msg
+
+    def _queue(messages: list[MQTTMessage]) -> None:
+        now = time.monotonic()
+        for msg in messages:
+            msg.timestamp = now
+        pending.extend(messages)
+        writer.send(b"\0")
+
+    async def _async_wait_for_reads() -> None:
+        while pending:
+            await asyncio.sleep(0)
+
+    @core.callback
+    def _async_state_written(event: core.Event) -> None:
+        # Messages are read in order and every state message changes
+        # the state of its sensor, so the state belongs to the last
+        # message passed to the integration.
+        write_latencies.append(time.monotonic() - last_message.timestamp)
+
+    @core.callback
+    def _async_wildcard_received(msg) -> None:
+        nonlocal wildcard_matches
+        wildcard_matches += 1
+
+    discovery_messages = [
+        _message(
+            f"homeassistant/sensor/device_{device}/config",
+            (
+                f'{{"name": "Device {device}", "uniq_id": "device_{device}", '
+                f'"stat_t": "benchmark/device_{device}/state", '
+                '"val_tpl": "{{ value_json.temperature }}"}'
+            ).encode(),
+            retain=True,
+        )
+        for device in range(options.devices)
+    ]
+    # The temperature of a device changes with every round of messages,
+    # the sensors skip writing states that did not change
+    state_messages = [
+        _message(
+            f"benchmark/device_{message % options.devices}/state",
+            f'{{"temperature": {message // options.devices % 1000 / 10}}}'.encode(),
+        )
+        for message in range(options.messages)
+    ]
+
+    reader, writer = socket.socketpair()
+    reader.setblocking(False)
+    with (
+        reader,
+        writer,
+        tempfile.TemporaryDirectory() as config_dir,
+        _patch_paho_client(hass, reader, pending) as paho,
+    ):
+        with open(
+            os.path.join(config_dir, conf_util.YAML_CONFIG_FILE),
+            "w",
+            encoding="utf-8",
+        ) as config_file:
+            config_file.write("homeassistant:\n")
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        hass.config_entries = ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        await conf_util.async_process_ha_core_config(hass, {})
+
+        entry = ConfigEntry(
+            data={mqtt.CONF_BROKER: "benchmark", mqtt.CONF_BIRTH_MESSAGE: {}},
+            discovery_keys=MappingProxyType({}),
+            domain=mqtt.DOMAIN,
+            minor_version=1,
+            options=None,
+            source=SOURCE_USER,
+            title="benchmark",
+            unique_id=None,
+            version=1,
+        )
+        await hass.config_entries.async_add(entry)
+        assert await mqtt.async_wait_for_mqtt_client(hass)
+        for index in range(options.fan_out):
+            await mqtt.async_subscribe(
+                hass,
+                "benchmark/#" if index % 2 else "benchmark/+/state",
+                _async_wildcard_received,
+            )
+
+        # Keep track of the message passed to the integration
+        on_message = paho.on_message
+        last_message = MQTTMessage()
+
+        @core.callback
+        def _async_on_message(client, userdata, msg: MQTTMessage) -> None:
+            nonlocal last_message
+            last_message = msg
+            on_message(client, userdata, msg)
+
+        paho.on_message = _async_on_message
+
+        lags: list[float] = []
+        lag_handle: asyncio.Handle | None = None
+
+        @core.callback
+        def _async_measure_lag(expected: float) -> None:
+            nonlocal lag_handle
+            now = loop.time()
+            lags.append(now - expected)
+            lag_handle = loop.call_at(now + 0.01, _async_measure_lag, now + 0.01)
+
+        lag_handle = loop.call_soon(_async_measure_lag, loop.time())
+
+        start = timer()
+        _queue(discovery_messages)
+        await _async_wait_for_reads()
+        await hass.async_block_till_done()
+        discovery_time = timer() - start
+        assert len(hass.states.async_entity_ids("sensor")) == options.devices
+
+        unsub_state_written = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _async_state_written
+        )
+        batch_size = len(state_messages)
+        if options.rate:
+            # Spread the messages of each second over 100 batches
+            batch_size = max(1, options.rate // 100)
+        start = timer()
+        next_batch = loop.time()
+        for batch_start in range(0, len(state_messages), batch_size):
+            _queue(state_messages[batch_start : batch_start + batch_size])
+            if options.rate:
+                next_batch += batch_size / options.rate
+                await asyncio.sleep(max(0, next_batch - loop.time()))
+        await _async_wait_for_reads()
+        await hass.async_block_till_done()
+        runtime = timer() - start
+
+        lag_handle.cancel()
+        unsub_state_written()
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert len(write_latencies) == options.messages
+    assert wildcard_matches == options.messages * options.fan_out
+
+    print(f"Discovered {options.devices} devices in {discovery_time:.3f}s")
+    print(f"Replayed {options.messages / runtime:.0f} messages/s")
+    print(f"Loop lag: {_percentiles(lags)}")
+    print(f"State write latency: {_percentiles(write_latencies)}")
+    return runtime
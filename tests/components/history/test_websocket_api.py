@@ -2,7 +2,8 @@
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import ANY, patch
+from typing import Any
+from unittest.mock import ANY, Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -403,6 +404,68 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_with_sampling(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period samples the numeric states of each bucket."""
+    start = dt_util.parse_datetime("2024-01-01 00:00:00+00:00")
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start) as freezer:
+        for minutes, value in (
+            (10, "1"),
+            (20, "5"),
+            (30, "3"),
+            (40, "2"),
+            (70, "3"),
+            (80, "4"),
+        ):
+            freezer.move_to(start + timedelta(minutes=minutes))
+            hass.states.async_set("sensor.test", value, {"unit_of_measurement": "W"})
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "sampling": 3600,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_test_history = response["result"]["sensor.test"]
+    assert [state["s"] for state in sensor_test_history] == ["1", "5", "2", "3", "4"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_test_history = response["result"]["sensor.test"]
+    assert [state["s"] for state in sensor_test_history] == [
+        "1",
+        "5",
+        "3",
+        "2",
+        "3",
+        "4",
+    ]
+
+
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -543,6 +606,157 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_in_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends the historical states in partitions."""
+    now = dt_util.utcnow()
+    start_time = now - timedelta(days=3)
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start_time + timedelta(hours=1)) as freezer:
+        hass.states.async_set("sensor.one", "on")
+        await async_recorder_block_till_done(hass)
+        freezer.move_to(start_time + timedelta(days=2))
+        hass.states.async_set("sensor.one", "off")
+        hass.states.async_set("sensor.two", "on")
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_STREAM_ENTITY_CHUNK_SIZE", 1):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": start_time.isoformat(),
+                "end_time": dt_util.utcnow().isoformat(),
+                "include_start_time_state": False,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        received_states = []
+        for _ in range(3):
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            received_states.append(
+                {
+                    entity_id: [state["s"] for state in states]
+                    for entity_id, states in response["event"]["states"].items()
+                }
+            )
+
+    assert received_states == [
+        {"sensor.one": ["on"]},
+        {"sensor.one": ["off"]},
+        {"sensor.two": ["on"]},
+    ]
+
+
+async def test_history_stream_waits_for_drain() -> None:
+    """Test each partition waits until the client received the previous one."""
+    connection = Mock(subscriptions={1: None})
+    drained = asyncio.Event()
+
+    async def _async_wait_for_drain() -> None:
+        await drained.wait()
+
+    connection.async_wait_for_drain = _async_wait_for_drain
+    now = dt_util.utcnow()
+    with patch.object(websocket_api, "get_instance") as get_instance_mock:
+        task = asyncio.create_task(
+            websocket_api._async_send_historical_states(
+                Mock(),
+                connection,
+                1,
+                now - timedelta(days=1),
+                now,
+                ["sensor.one"],
+                True,
+                False,
+                True,
+                True,
+                True,
+            )
+        )
+        await asyncio.sleep(0)
+        assert not get_instance_mock.return_value.async_add_executor_job.called
+
+        # Unsubscribing while waiting stops the stream
+        connection.subscriptions.clear()
+        drained.set()
+        assert await task is None
+    assert not get_instance_mock.return_value.async_add_executor_job.called
+
+
+async def test_history_stream_does_not_overflow_while_sending_history(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test states queued while the history is sent do not overflow the stream."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    orig_send_historical_states = websocket_api._async_send_historical_states
+
+    async def _send_historical_states(*args: Any) -> float | None:
+        # The client is slow to receive the history
+        for val in range(10):
+            hass.states.async_set("sensor.one", str(val))
+        return await orig_send_historical_states(*args)
+
+    client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+    with (
+        patch.object(websocket_api, "MAX_PENDING_HISTORY_STATES", 5),
+        patch.object(
+            websocket_api,
+            "_async_send_historical_states",
+            _send_historical_states,
+        ),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one"],
+                "start_time": now.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        received_states: list[str] = []
+        while len(received_states) < 11:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            received_states.extend(
+                state["s"] for state in response["event"]["states"]["sensor.one"]
+            )
+
+    assert received_states[-10:] == [str(val) for val in range(10)]
+    # The stream is still subscribed
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) != listeners_without_writes(init_listeners)
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["success"]
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
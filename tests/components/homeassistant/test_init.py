@@ -33,7 +33,7 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import entity, entity_registry as er
+from homeassistant.helpers import entity, entity_registry as er, loop_monitor
 from homeassistant.setup import async_setup_component
 
 from tests.common import (
@@ -545,6 +545,14 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         assert mock_save.called
 
 
+async def test_loop_monitor_heartbeat_started(hass: HomeAssistant) -> None:
+    """Test the heartbeat of the event loop is monitored without sampling."""
+    await async_setup_component(hass, "homeassistant", {})
+    monitor = loop_monitor.async_get_loop_monitor(hass)
+    assert monitor.running
+    assert not monitor.sampling
+
+
 async def test_reload_custom_templates(hass: HomeAssistant) -> None:
     """Test we can call reload_custom_templates."""
     await async_setup_component(hass, "homeassistant", {})
@@ -430,6 +430,32 @@ async def test_if_not_fires_if_event_data_not_matches(
     assert len(service_calls) == 0
 
 
+async def test_if_fires_on_any_event_with_data(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test the firing of any event type matching event data."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "*",
+                    "event_data": {"some_attr": "some_value"},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"some_attr": "some_value"})
+    hass.bus.async_fire("other_event", {"some_attr": "some_value"})
+    hass.bus.async_fire("test_event", {"some_attr": "some_other_value"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 2
+
+
 async def test_if_not_fires_if_event_context_not_matches(
     hass: HomeAssistant, service_calls: list[ServiceCall], context_with_user: Context
 ) -> None:
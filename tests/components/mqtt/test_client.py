@@ -249,6 +249,28 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(recorded_calls) == 1
 
 
+async def test_subscriptions_share_decoded_payload_per_encoding(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscriptions to a topic receive the payload in their encoding."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+
+    await hass.async_block_till_done()
+    payloads = [msg.payload for msg in recorded_calls]
+    assert payloads.count("test-payload") == 2
+    assert payloads.count(b"test-payload") == 1
+    decoded_msgs = [msg for msg in recorded_calls if isinstance(msg.payload, str)]
+    assert decoded_msgs[0] is decoded_msgs[1]
+
+
 async def test_subscribe_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -6,6 +6,7 @@ import json
 import logging
 from pathlib import Path
 import re
+from typing import Any
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
@@ -35,6 +36,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
@@ -311,6 +313,70 @@ async def test_discover_fan(
     assert ("fan", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+async def test_discover_burst_sets_up_platform_once(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test a burst of discovery messages is set up together."""
+    await mqtt_mock_entry()
+    with patch(
+        "homeassistant.components.mqtt.discovery.async_forward_entry_setup_and_setup_discovery",
+        wraps=mqtt.discovery.async_forward_entry_setup_and_setup_discovery,
+    ) as mock_setup:
+        for fan_id in range(3):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/fan/bla{fan_id}/config",
+                f'{{ "name": "Beer {fan_id}", "command_topic": "test_topic" }}',
+            )
+        async_fire_mqtt_message(
+            hass, "homeassistant/fan/invalid/config", '{ "name": "Invalid" }'
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_setup.mock_calls) == 1
+    for fan_id in range(3):
+        assert hass.states.get(f"fan.beer_{fan_id}") is not None
+    assert hass.states.get("fan.invalid") is None
+    assert ("fan", "invalid") not in hass.data["mqtt"].discovery_already_discovered
+
+
+async def test_discover_burst_platform_setup_fails(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test the discovery of a burst finishes when its platform fails to set up."""
+    await mqtt_mock_entry()
+    entry = hass.config_entries.async_entries(mqtt.DOMAIN)[0]
+    create_task = entry.async_create_task
+    tasks: list[asyncio.Task] = []
+
+    def _async_create_task(*args: Any, **kwargs: Any) -> asyncio.Task:
+        tasks.append(task := create_task(*args, **kwargs))
+        return task
+
+    with (
+        patch.object(entry, "async_create_task", _async_create_task),
+        patch(
+            "homeassistant.components.mqtt.discovery.async_forward_entry_setup_and_setup_discovery",
+            side_effect=HomeAssistantError("Setup failed"),
+        ),
+    ):
+        for fan_id in range(2):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/fan/bla{fan_id}/config",
+                f'{{ "name": "Beer {fan_id}", "command_topic": "test_topic" }}',
+            )
+        await hass.async_block_till_done()
+
+    assert len(tasks) == 1
+    with pytest.raises(HomeAssistantError, match="Setup failed"):
+        await tasks[0]
+    pending_discovered = hass.data["mqtt"].discovery_pending_discovered
+    for fan_id in range(2):
+        assert hass.states.get(f"fan.beer_{fan_id}") is None
+        assert ("fan", f"bla{fan_id}") not in pending_discovered
+
+
 async def test_discover_climate(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -214,6 +214,30 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_reuses_render_of_unchanged_payload(
+    hass: HomeAssistant,
+) -> None:
+    """Test rendering an unchanged payload only renders templates reading state."""
+    entity = MockEntity(entity_id="sensor.test")
+    entity.hass = hass
+    tpl = template.Template("{{ value_json.id }}", hass=hass)
+    val_tpl = mqtt.MqttValueTemplate(tpl, entity=entity)
+    assert val_tpl.async_render_with_possible_json_value('{"id": 1}') == "1"
+    assert val_tpl.async_render_with_possible_json_value('{"id": 1}') == "1"
+    assert tpl._renders == 1
+    assert val_tpl.async_render_with_possible_json_value('{"id": 2}') == "2"
+    assert val_tpl.async_render_with_possible_json_value(b'{"id": 2}') == "2"
+    assert tpl._renders == 3
+
+    hass.states.async_set("sensor.other", "on")
+    tpl = template.Template("{{ states('sensor.other') }} {{ value }}", hass=hass)
+    val_tpl = mqtt.MqttValueTemplate(tpl, entity=entity)
+    assert val_tpl.async_render_with_possible_json_value("1") == "on 1"
+    hass.states.async_set("sensor.other", "off")
+    assert val_tpl.async_render_with_possible_json_value("1") == "off 1"
+    assert tpl._renders == 2
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
@@ -13,7 +13,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -102,6 +102,49 @@ async def test_canceling_debouncer_throws(
         await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize(
+    ("topic", "matches"),
+    [
+        ("a", {"#", "+", "+/#", "a", "a/#"}),
+        ("a/b", {"#", "+/#", "+/b", "a/#", "a/+", "a/b/#"}),
+        ("a/b/c", {"#", "+/#", "a/#", "a/b/#"}),
+        ("b/c", {"#", "+/#"}),
+        ("$SYS/broker", {"$SYS/#"}),
+        ("/a", {"#", "+/#"}),
+    ],
+)
+def test_topic_trie_match(topic: str, matches: set[str]) -> None:
+    """Test matching topics against topic filters with a topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in ("#", "+", "+/#", "+/b", "a", "a/#", "a/+", "a/b/#", "$SYS/#"):
+        trie.add(topic_filter, topic_filter)
+
+    found = trie.match(topic)
+    assert len(found) == len(matches)
+    assert set(found) == matches
+
+
+def test_topic_trie_remove() -> None:
+    """Test removing topic filters from a topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("a/+/c", "first")
+    trie.add("a/+/c", "second")
+    trie.add("a/#", "third")
+    assert trie.contains("a/+/c")
+    assert not trie.contains("a/+")
+
+    trie.remove("a/+/c", "first")
+    assert trie.match("a/b/c") == ["third", "second"]
+    trie.remove("a/+/c", "second")
+    assert not trie.contains("a/+/c")
+    assert trie.match("a/b/c") == ["third"]
+    trie.remove("a/#", "third")
+    assert trie.match("a/b/c") == []
+
+    with pytest.raises(KeyError):
+        trie.remove("a/#", "third")
+
+
 async def help_create_test_certificate_file(
     hass: HomeAssistant,
     mock_temp_dir: str,
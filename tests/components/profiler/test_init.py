@@ -20,10 +20,12 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_TEMPLATE_RENDER_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_SET_TEMPLATE_PROFILING,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
@@ -32,8 +34,10 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -244,6 +248,49 @@ async def test_log_current_tasks(
     await hass.async_block_till_done()
 
 
+async def test_template_profiling(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can profile tracked templates and log their render stats."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_SET_TEMPLATE_PROFILING)
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_TEMPLATE_RENDER_STATS)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.profiled') }}", hass), None)],
+        callback(lambda *_: None),
+    )
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_TEMPLATE_PROFILING, {}, blocking=True
+    )
+    hass.states.async_set("sensor.profiled", "on")
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_TEMPLATE_PROFILING, {"enabled": False}, blocking=True
+    )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_LOG_TEMPLATE_RENDER_STATS, {}, blocking=True
+    )
+
+    assert "{{ states('sensor.profiled') }}" in caplog.text
+    assert "'sensor.profiled': 1" in caplog.text
+    caplog.clear()
+
+    info.async_remove()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_scheduled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
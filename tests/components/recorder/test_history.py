@@ -962,6 +962,56 @@ async def test_get_full_significant_states_past_year_2038(
     assert sensor_one_states[0].last_updated == past_2038_time
 
 
+async def test_get_significant_states_sampling(hass: HomeAssistant) -> None:
+    """Test the minimum, maximum and last numeric state of each bucket are kept."""
+    start = dt_util.parse_datetime("2024-01-01 00:00:00+00:00")
+    attributes = {"unit_of_measurement": "°C"}
+    with freeze_time(start) as freezer:
+        for minutes, value in (
+            (10, "1"),
+            (20, "9"),
+            (30, "2"),
+            (40, "3"),
+            (70, "4"),
+            (80, "unavailable"),
+            (90, "5"),
+        ):
+            freezer.move_to(start + timedelta(minutes=minutes))
+            hass.states.async_set("sensor.one", value, attributes)
+            await async_wait_recording_done(hass)
+        for minutes, value in ((15, "on"), (16, "off")):
+            freezer.move_to(start + timedelta(minutes=minutes))
+            hass.states.async_set("binary_sensor.door", value)
+            await async_wait_recording_done(hass)
+
+    end = start + timedelta(hours=3)
+    entity_ids = ["sensor.one", "binary_sensor.door"]
+    all_states = ["1", "9", "2", "3", "4", "unavailable", "5"]
+    hist = history.get_significant_states(hass, start, end, entity_ids)
+    assert [state.state for state in hist["sensor.one"]] == all_states
+
+    # The spike survives next to the minimum and last state of the first hour,
+    # the on/off pair of an entity without numeric states is kept
+    hist = history.get_significant_states(
+        hass, start, end, entity_ids, sampling=timedelta(hours=1)
+    )
+    assert [state.state for state in hist["sensor.one"]] == [
+        "1",
+        "9",
+        "3",
+        "4",
+        "unavailable",
+        "5",
+    ]
+    assert [state.state for state in hist["binary_sensor.door"]] == ["on", "off"]
+
+    # An interval finer than the smallest bucket returns every state
+    hist = history.get_significant_states(
+        hass, start, end, entity_ids, sampling=timedelta(minutes=1)
+    )
+    assert [state.state for state in hist["sensor.one"]] == all_states
+
+
 async def test_get_significant_states_without_entity_ids_raises(
     hass: HomeAssistant,
 ) -> None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Generator
 from datetime import datetime, timedelta
+from pathlib import Path
 import sqlite3
 import sys
 import threading
@@ -58,6 +59,7 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.spool import RecorderSpool
 from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
@@ -69,6 +71,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
@@ -136,6 +139,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        spool_events=False,
     )
 
 
@@ -360,6 +364,44 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_from_backlog_in_bulk(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test a backed up queue is processed in batches with bulk id resolution."""
+    instance = recorder.get_instance(hass)
+
+    with (
+        patch.object(recorder.core, "BULK_PROCESS_MIN_BACKLOG", 0),
+        patch.object(
+            instance, "_pre_process_events", wraps=instance._pre_process_events
+        ) as pre_process_events,
+    ):
+        for value in range(3):
+            for entity_number in range(10):
+                hass.states.async_set(
+                    f"test.recorder_{entity_number}",
+                    str(value),
+                    {"test_attr": value, "entity_number": entity_number},
+                )
+        await async_wait_recording_done(hass)
+
+    assert pre_process_events.called
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 30
+        assert len(list(session.query(StatesMeta))) == 10
+        assert len(list(session.query(StateAttributes))) == 30
+        states_by_id = {db_state.state_id: db_state for db_state in db_states}
+        for db_state in db_states:
+            if db_state.state == "0":
+                assert db_state.old_state_id is None
+                continue
+            old_state = states_by_id[db_state.old_state_id]
+            assert old_state.metadata_id == db_state.metadata_id
+            assert int(old_state.state) == int(db_state.state) - 1
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
@@ -727,6 +769,32 @@ async def test_saving_state_exclude_domains(
     assert _state_with_context(hass, "test2.recorder").as_dict() == states[0].as_dict()
 
 
+async def test_saving_states_set_together_exclude_domains(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test saving states set together with some of them excluded."""
+    await async_setup_recorder_instance(hass, {"exclude": {"domains": "test"}})
+    attributes = {"test_attr": 5}
+    hass.states.async_set_many(
+        [
+            ("test.recorder", "on", attributes),
+            ("test2.recorder", "on", attributes),
+            ("test3.recorder", "off", attributes),
+        ]
+    )
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_ids = {
+            states_meta.entity_id
+            for _, states_meta in session.query(States, StatesMeta).join(
+                StatesMeta, States.metadata_id == StatesMeta.metadata_id
+            )
+        }
+    assert entity_ids == {"test2.recorder", "test3.recorder"}
+
+
 async def test_saving_state_exclude_domains_globs(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -2746,3 +2814,174 @@ async def test_empty_entity_id(
     hass.bus.async_fire("hello", {"entity_id": ""})
     await async_wait_recording_done(hass)
     assert "Invalid entity ID" not in caplog.text
+
+
+async def test_spool_roundtrip(
+    hass: HomeAssistant, setup_recorder: None, tmp_path: Path
+) -> None:
+    """Test events read back from the spool match the spooled events."""
+    instance = get_instance(hass)
+    spool = RecorderSpool(instance, str(tmp_path))
+    context = Context(user_id="user", parent_id="parent")
+    old_state = State("test.spool", "off", {"friendly_name": "Spool"})
+    new_state = State("test.spool", "on", {"friendly_name": "Spool"}, context=context)
+    events = [
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "test.spool", "old_state": old_state, "new_state": new_state},
+            context=context,
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "test.spool", "old_state": new_state, "new_state": None},
+            context=context,
+        ),
+        Event("spool_event", {"test_attr": 5}, context=context),
+        Event("spool_event_without_data"),
+    ]
+    await instance.async_add_executor_job(spool.write, events[:2])
+    await instance.async_add_executor_job(spool.write, events[2:])
+
+    segments = spool.segments()
+    assert len(segments) == 2
+    spooled_events = [
+        event
+        for segment in segments
+        for event in await instance.async_add_executor_job(spool.read, segment)
+    ]
+    assert [
+        (event.event_type, event.time_fired_timestamp, event.context.as_dict())
+        for event in spooled_events
+    ] == [
+        (event.event_type, event.time_fired_timestamp, event.context.as_dict())
+        for event in events
+    ]
+    assert spooled_events[0].data["new_state"].as_dict() == new_state.as_dict()
+    # Only the parts of the old state used by the recorder are spooled
+    spooled_old_state = spooled_events[0].data["old_state"]
+    assert spooled_old_state.state == "off"
+    assert spooled_old_state.last_reported == old_state.last_reported
+    assert spooled_events[1].data["new_state"] is None
+    assert spooled_events[2].data == {"test_attr": 5}
+    assert spooled_events[3].data == {}
+
+    for segment in segments:
+        spool.remove(segment)
+    assert spool.segments() == []
+
+
+async def test_events_are_spooled_when_backlog_is_exhausted(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+    tmp_path: Path,
+) -> None:
+    """Test events are spooled to disk and recorded once the recorder catches up."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_SPOOL_EVENTS: True}
+    )
+    await async_wait_recording_done(hass)
+    instance._spool.path = str(tmp_path)
+
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        instance._async_check_queue()
+    assert instance._spool_buffer == []
+
+    hass.states.async_set("test.spool", "on", {"test_attr": 5})
+    hass.bus.async_fire("spool_event", {"test_attr": 5})
+    await hass.async_block_till_done()
+    assert len(instance._spool_buffer) == 2
+
+    # The first check writes the buffer, the next one drains the spool
+    for _ in range(2):
+        freezer.tick(recorder.core.SPOOL_CHECK_INTERVAL)
+        async_fire_time_changed(hass)
+        await async_wait_recording_done(hass)
+    assert instance._spool_buffer is None
+    assert instance._spool.segments() == []
+
+    hass.states.async_set("test.spool", "off")
+    await async_wait_recording_done(hass)
+
+    def _get_recorded() -> tuple[list[str | None], int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            states = [
+                state.state
+                for state in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "test.spool")
+                .order_by(States.last_updated_ts)
+            ]
+            events = (
+                session.query(Events)
+                .filter(
+                    Events.event_type_id.in_(select_event_type_ids(("spool_event",)))
+                )
+                .count()
+            )
+            return states, events
+
+    states, events = await instance.async_add_executor_job(_get_recorded)
+    assert states == ["on", "off"]
+    assert events == 1
+
+
+async def test_failing_spool_segment_is_set_aside(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+) -> None:
+    """Test a spool segment which cannot be recorded is not drained again."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    spool = instance._spool
+    spool.path = str(tmp_path)
+    await instance.async_add_executor_job(
+        spool.write, [Event("spool_event", {"test_attr": 5})]
+    )
+    (segment,) = spool.segments()
+
+    with patch.object(spool, "read", side_effect=OSError("disk error")):
+        instance.queue_task(recorder.tasks.DrainSpoolTask())
+        await async_wait_recording_done(hass)
+    assert "Error recording spooled events" in caplog.text
+    assert spool.segments() == []
+    assert (tmp_path / f"{Path(segment).name}.failed").exists()
+
+    # New segments do not reuse the sequence of the failed segment
+    await instance.async_add_executor_job(
+        spool.write, [Event("spool_event", {"test_attr": 6})]
+    )
+    assert spool.segments() != [segment]
+    instance.queue_task(recorder.tasks.DrainSpoolTask())
+    await async_wait_recording_done(hass)
+    assert spool.segments() == []
+
+
+async def test_spooled_events_are_written_at_shutdown(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test buffered events are written to the spool at shutdown."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_SPOOL_EVENTS: True}
+    )
+    await async_wait_recording_done(hass)
+    instance._spool.path = str(tmp_path)
+
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        instance._async_check_queue()
+    hass.bus.async_fire("spool_event", {"test_attr": 5})
+    await hass.async_block_till_done()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    segments = instance._spool.segments()
+    assert len(segments) == 1
+    events = await hass.async_add_executor_job(instance._spool.read, segments[0])
+    assert [(event.event_type, event.data) for event in events] == [
+        ("spool_event", {"test_attr": 5})
+    ]
@@ -404,6 +404,121 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_short_term_statistics_in_time_windows(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test short term statistics are purged in time windows up to a row budget."""
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    oldest = purge_before - timedelta(hours=2)
+    starts = (
+        oldest,
+        oldest + timedelta(minutes=5),
+        oldest + timedelta(hours=1, minutes=30),
+        purge_before - timedelta(minutes=5),
+        purge_before,
+    )
+
+    def _add_statistics() -> None:
+        with session_scope(hass=hass) as session:
+            for start in starts:
+                session.add(StatisticsShortTerm(start_ts=start.timestamp(), state=0))
+
+    # All windows are purged in one cycle
+    _add_statistics()
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+    with session_scope(hass=hass) as session:
+        statistics = session.query(StatisticsShortTerm).all()
+        assert [row.start_ts for row in statistics] == [purge_before.timestamp()]
+        session.query(StatisticsShortTerm).delete()
+
+    # The purge cycle stops once the row budget is used up
+    _add_statistics()
+    with patch(
+        "homeassistant.components.recorder.purge.SHORT_TERM_STATISTICS_ROWS_PER_PURGE",
+        1,
+    ):
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert not finished
+        with session_scope(hass=hass) as session:
+            assert session.query(StatisticsShortTerm).count() == 3
+
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert not finished
+        with session_scope(hass=hass) as session:
+            assert session.query(StatisticsShortTerm).count() == 1
+
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert finished
+        with session_scope(hass=hass) as session:
+            statistics = session.query(StatisticsShortTerm).all()
+            assert [row.start_ts for row in statistics] == [purge_before.timestamp()]
+
+
+async def test_purge_states_by_time_range(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test states are purged by time range without splitting equal times."""
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    oldest = purge_before - timedelta(hours=3)
+    with session_scope(hass=hass) as session:
+        old_states = [
+            States(state=str(idx), last_updated_ts=last_updated.timestamp())
+            for idx, last_updated in enumerate(
+                (
+                    oldest,
+                    oldest + timedelta(hours=1),
+                    oldest + timedelta(hours=1),
+                    oldest + timedelta(hours=2),
+                )
+            )
+        ]
+        session.add_all(old_states)
+        session.flush()
+        session.add(
+            States(
+                state="new",
+                last_updated_ts=purge_before.timestamp(),
+                old_state_id=old_states[-1].state_id,
+            )
+        )
+
+    def _remaining_states() -> list[str]:
+        with session_scope(hass=hass) as session:
+            return sorted(state.state for state in session.query(States))
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 3),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 3),
+    ):
+        # The rows updated at the end of a full batch are left for the next one
+        finished = purge_old_data(
+            recorder_mock, purge_before, states_batch_size=1, repack=False
+        )
+        assert not finished
+        assert _remaining_states() == ["1", "2", "3", "new"]
+
+        finished = purge_old_data(
+            recorder_mock, purge_before, states_batch_size=1, repack=False
+        )
+        assert not finished
+        assert _remaining_states() == ["3", "new"]
+
+        finished = purge_old_data(
+            recorder_mock, purge_before, states_batch_size=1, repack=False
+        )
+        assert not finished
+        assert _remaining_states() == ["new"]
+
+        finished = purge_old_data(
+            recorder_mock, purge_before, states_batch_size=1, repack=False
+        )
+        assert finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).one().old_state_id is None
+
+
 @pytest.mark.parametrize("use_sqlite", [True, False], indirect=True)
 @pytest.mark.usefixtures("recorder_mock")
 async def test_purge_method(
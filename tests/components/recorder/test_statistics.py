@@ -1,6 +1,9 @@
 """The tests for sensor recorder platform."""
 
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import timedelta
+from itertools import chain
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -17,6 +20,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     PlatformCompiledStatistics,
+    StatisticsRow,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
@@ -1113,6 +1117,62 @@ async def test_import_statistics_errors(
     assert get_metadata(hass, statistic_ids={"sensor.total_energy_import"}) == {}
 
 
+async def test_statistics_during_period_cache(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test statistics_during_period results are cached until modified."""
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    period2 = period1 + timedelta(hours=1)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    cache = recorder.get_instance(hass).statistics_during_period_cache
+
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": period1, "last_reset": None, "state": 0, "sum": 2},),
+    )
+    await async_wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2.0]
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+    # Modifying the result must not modify the cached result
+    stats["test:total_energy_import"][0]["sum"] = 100
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2.0]
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    # Importing statistics evicts the cached result
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": period2, "last_reset": None, "state": 1, "sum": 3},),
+    )
+    await async_wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={"test:total_energy_import"}
+    )
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [2.0, 3.0]
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_daily_statistics_sum(
@@ -2647,3 +2707,127 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+def _reduce_statistics_per_row(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics one row at a time.
+
+    This is the reducer _reduce_statistics replaced, it is kept to check
+    the results have not changed.
+    """
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    for statistic_id, stat_list in stats.items():
+        max_values: list[float] = []
+        mean_values: list[float] = []
+        min_values: list[float] = []
+        prev_stat: StatisticsRow = stat_list[0]
+        fake_entry: StatisticsRow = {
+            "start": stat_list[-1]["start"] + period.total_seconds()
+        }
+        for statistic in chain(stat_list, (fake_entry,)):
+            if not same_period(prev_stat["start"], statistic["start"]):
+                start, end = period_start_end(prev_stat["start"])
+                result[statistic_id].append(
+                    {
+                        "start": start,
+                        "end": end,
+                        "mean": statistics.mean(mean_values) if mean_values else None,
+                        "min": min(min_values) if min_values else None,
+                        "max": max(max_values) if max_values else None,
+                        "last_reset": prev_stat.get("last_reset"),
+                        "state": prev_stat.get("state"),
+                        "sum": prev_stat["sum"],
+                    }
+                )
+                max_values.clear()
+                mean_values.clear()
+                min_values.clear()
+            if (_max := statistic.get("max")) is not None:
+                max_values.append(_max)
+            if (_mean := statistic.get("mean")) is not None:
+                mean_values.append(_mean)
+            if (_min := statistic.get("min")) is not None:
+                min_values.append(_min)
+            prev_stat = statistic
+    return result
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize(
+    ("factory", "reducer", "period"),
+    [
+        (
+            statistics.reduce_day_ts_factory,
+            statistics._reduce_statistics_per_day,
+            timedelta(days=1),
+        ),
+        (
+            statistics.reduce_week_ts_factory,
+            statistics._reduce_statistics_per_week,
+            timedelta(days=7),
+        ),
+        (
+            statistics.reduce_month_ts_factory,
+            statistics._reduce_statistics_per_month,
+            timedelta(days=31),
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "first_start",
+    # The rows span the start and the end of daylight saving time in Vienna
+    ["2022-03-10 00:00:00+00:00", "2022-10-10 00:00:00+00:00"],
+)
+@pytest.mark.parametrize(
+    "has_row",
+    [
+        lambda hour: True,
+        # Sparse rows
+        lambda hour: hour % 7 == 0,
+        # Whole days and weeks without rows
+        lambda hour: (hour // 24) % 3 != 1 and (hour // 168) % 3 != 1,
+    ],
+)
+async def test_reduce_statistics_matches_per_row_reducer(
+    hass: HomeAssistant,
+    timezone: str,
+    factory: Callable[[], tuple[Callable[..., bool], Callable[..., Any]]],
+    reducer: Callable[
+        [dict[str, list[StatisticsRow]], set[Any]], dict[str, list[StatisticsRow]]
+    ],
+    period: timedelta,
+    first_start: str,
+    has_row: Callable[[int], bool],
+) -> None:
+    """Test the bisecting reducer returns the same rows as the per row reducer."""
+    await hass.config.async_set_time_zone(timezone)
+    first_start_ts = dt_util.parse_datetime(first_start).timestamp()
+    stat_list: list[StatisticsRow] = []
+    for hour in range(60 * 24):
+        if not has_row(hour):
+            continue
+        # Some rows have no values so some periods have no mean, min or max
+        value = None if hour % 5 == 0 else float(hour % 17)
+        stat_list.append(
+            {
+                "start": first_start_ts + hour * 3600,
+                "end": first_start_ts + (hour + 1) * 3600,
+                "mean": value,
+                "min": value if value is None else value - 1,
+                "max": value if value is None else value + 1,
+                "last_reset": None,
+                "state": float(hour),
+                "sum": float(hour * 2),
+            }
+        )
+    stats = {"sensor.test": stat_list}
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    same_period, period_start_end = factory()
+    expected = _reduce_statistics_per_row(stats, same_period, period_start_end, period)
+    assert reducer(stats, types) == expected
@@ -35,6 +35,10 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "database_executor_jobs": ANY,
+        "database_executor_job_time": ANY,
+        "database_executor_job_wait_time": ANY,
+        "slowest_database_executor_job": ANY,
     }
 
 
@@ -64,6 +68,10 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "database_executor_jobs": ANY,
+        "database_executor_job_time": ANY,
+        "database_executor_job_wait_time": ANY,
+        "slowest_database_executor_job": ANY,
     }
 
 
@@ -99,6 +107,10 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "database_executor_jobs": ANY,
+        "database_executor_job_time": ANY,
+        "database_executor_job_wait_time": ANY,
+        "slowest_database_executor_job": ANY,
     }
 
 
@@ -127,4 +139,51 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "database_executor_jobs": ANY,
+        "database_executor_job_time": ANY,
+        "database_executor_job_wait_time": ANY,
+        "slowest_database_executor_job": ANY,
     }
+
+
+async def test_recorder_system_health_executor_job_timings(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the database executor job timings."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    instance.executor_job_timings.jobs.clear()
+
+    def _job(value: int) -> int:
+        return value
+
+    assert await instance.async_add_executor_job(_job, 5) == 5
+    jobs = instance.executor_job_timings.snapshot()
+    assert list(jobs) == [_job.__qualname__]
+    assert jobs[_job.__qualname__].count == 1
+
+    info = await get_system_health_info(hass, "recorder")
+    # The system health size query itself is also an executor job
+    assert info["database_executor_jobs"] == 2
+    assert info["database_executor_job_time"].endswith(" ms")
+    assert info["database_executor_job_wait_time"].endswith(" ms")
+    assert info["slowest_database_executor_job"].endswith(" ms)")
+
+
+async def test_recorder_system_health_statistics_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the statistics cache hits and misses."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    cache = get_instance(hass).statistics_during_period_cache
+
+    info = await get_system_health_info(hass, "recorder")
+    assert "statistics_cache_hits" not in info
+
+    cache.hits = 3
+    cache.misses = 1
+    info = await get_system_health_info(hass, "recorder")
+    assert info["statistics_cache_hits"] == 3
+    assert info["statistics_cache_misses"] == 1
@@ -22,9 +22,12 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, loop_monitor
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_set_template_profiling,
+    async_track_state_change_event,
+)
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -1359,6 +1362,81 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_template_render_stats(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test render stats of the tracked templates are returned."""
+    async_set_template_profiling(hass, True)
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "render_template",
+            "template": "State is: {{ states('light.test') }}",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    await websocket_client.send_json({"id": 6, "type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    stats = msg["result"][0]
+    assert stats["template"] == "State is: {{ states('light.test') }}"
+    assert stats["renders"] == 1
+    assert stats["rate_limited"] == 0
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_subscribe_loop_monitor(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test subscribing to the event loop monitor."""
+    monitor = loop_monitor.async_get_loop_monitor(hass)
+    assert not monitor.sampling
+
+    await websocket_client.send_json({"id": 6, "type": "subscribe_loop_monitor"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == "event"
+    assert msg["event"]["stall"] is None
+    assert msg["event"]["stats"]["stalls"] == 0
+
+    assert monitor.sampling
+    monitor._async_record_stall(0.5)
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["event"]["stall"]["duration"] == 0.5
+    assert msg["event"]["stats"]["stalls"] == 1
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "unsubscribe_events", "subscription": 6}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert not monitor.sampling
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "subscribe_loop_monitor"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2914,3 +2992,163 @@ async def test_subscribe_entities_chained_state_change(
 
     await websocket_client.close()
     await hass.async_block_till_done()
+
+
+async def test_subscribe_entities_batched_state_changes(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test state changes written together are sent in one message."""
+    hass.states.async_set("light.first", "off")
+    hass.states.async_set("light.second", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert set(msg["event"]["a"]) == {"light.first", "light.second"}
+
+    with hass.bus.async_batch():
+        hass.states.async_set("light.first", "on")
+        hass.states.async_set("light.second", "on")
+        hass.states.async_set("light.third", "on")
+        hass.states.async_set("light.first", "off")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.third": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.first": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+            "light.second": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+        },
+    }
+    # The second change of light.first is sent in its own message
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {"light.first": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
+async def test_subscribe_entities_attribute_projection(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribing to entities with a projection of their attributes."""
+    hass.states.async_set(
+        "light.permitted", "off", {"color": "red", "power": 5, "voltage": 230}
+    )
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "attributes": ["color", "power"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red", "power": 5},
+                "c": ANY,
+                "lc": ANY,
+                "s": "off",
+            }
+        }
+    }
+
+    # Changes of attributes outside of the projection are not sent
+    hass.states.async_set(
+        "light.permitted", "off", {"color": "red", "power": 5, "voltage": 231}
+    )
+    hass.states.async_set("light.permitted", "off", {"color": "blue", "voltage": 232})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "blue"}, "c": ANY, "lu": ANY},
+                "-": {"a": ["power"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.new", "on", {"color": "green", "voltage": 230})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.new": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+
+async def test_subscribe_entities_attribute_projection_context(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test a projection includes the context of skipped changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red", "voltage": 230})
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "attributes": ["color"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "off",
+            }
+        }
+    }
+
+    # The skipped change sets the context of the next change
+    context = Context()
+    hass.states.async_set(
+        "light.permitted", "off", {"color": "red", "voltage": 231}, context=context
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        "light.permitted", "off", {"color": "blue", "voltage": 231}, context=context
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "blue"}, "c": context.id, "lu": ANY},
+            }
+        }
+    }
@@ -345,6 +345,52 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_wait_for_drain(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting for the message queue to be written to the client."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    # Nothing is queued
+    await instance._async_wait_for_drain()
+    assert instance._drained_future is None
+
+    instance._send_message({"id": 1, "type": "result", "success": True})
+    waiters = [
+        hass.async_create_task(instance._async_wait_for_drain()) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    assert instance._drained_future is not None
+
+    # The writer releases the waiters once the queue is empty
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    await asyncio.gather(*waiters)
+    assert instance._drained_future is None
+
+    # Closing the connection releases the waiters
+    instance._message_queue.append(b"")
+    waiter = hass.async_create_task(instance._async_wait_for_drain())
+    await asyncio.sleep(0)
+    await websocket_client.close()
+    await waiter
+    assert instance._drained_future is None
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
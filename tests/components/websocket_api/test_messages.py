@@ -4,8 +4,10 @@ import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
+    _partial_cached_state_diff_message as lru_state_diff_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -83,6 +85,38 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_diff_message_shared_by_states(
+    hass: HomeAssistant,
+) -> None:
+    """Test state diff messages are cached by the states they are diffed between."""
+    hass.states.async_set("light.window", "on", {"color": "red", "voltage": 230})
+    old_state = hass.states.get("light.window")
+    hass.states.async_set("light.window", "on", {"color": "red", "voltage": 231})
+    hass.states.async_set("light.window", "on", {"color": "blue", "voltage": 231})
+    new_state = hass.states.get("light.window")
+    attributes = frozenset({"color"})
+
+    lru_state_diff_cache.cache_clear()
+    # Connections which skipped the same change build equal changes
+    msg0 = cached_state_diff_message(
+        b"2", ("light.window", old_state, new_state), attributes
+    )
+    msg1 = cached_state_diff_message(
+        b"3", ("light.window", old_state, new_state), attributes
+    )
+
+    assert msg0 == msg1.replace(b'"id":3', b'"id":2')
+    cache_info = lru_state_diff_cache.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+    # Another projection does not share the message
+    cached_state_diff_message(b"2", ("light.window", old_state, new_state))
+    cache_info = lru_state_diff_cache.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
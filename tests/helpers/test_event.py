@@ -22,16 +22,21 @@ from homeassistant.core import (
     HomeAssistant,
     callback,
 )
-from homeassistant.exceptions import TemplateError
+from homeassistant.exceptions import HomeAssistantError, TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _POINT_IN_TIME_TIMER_WHEEL,
+    TIMER_WHEEL_RESOLUTION,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
+    async_set_template_profiling,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
+    async_track_event_data,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -52,6 +57,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.template import Template, result_as_boolean
 from homeassistant.setup import async_setup_component
+from homeassistant.util.async_ import get_scheduled_timer_handles
 import homeassistant.util.dt as dt_util
 
 from tests.common import async_fire_time_changed, async_fire_time_changed_exact
@@ -1756,6 +1762,205 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_coalesces_state_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes fired together re-render a template once."""
+    async_set_template_profiling(hass, True)
+    runs = []
+    template = Template(
+        "{{ states('sensor.first') }} {{ states('sensor.second') }}", hass
+    )
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append((event and event.data["entity_id"], updates.pop().result))
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+    assert info.render_stats[template].renders == 1
+
+    hass.states.async_set("sensor.first", "1")
+    hass.states.async_set("sensor.second", "2")
+    hass.states.async_set("sensor.first", "3")
+    await hass.async_block_till_done()
+
+    assert runs == [("sensor.first", "3 2")]
+    assert info.render_stats[template].renders == 2
+    assert info.render_stats[template].total_time > 0
+
+    hass.states.async_set("sensor.second", "4")
+    await hass.async_block_till_done()
+
+    assert runs == [("sensor.first", "3 2"), ("sensor.second", "3 4")]
+    assert info.render_stats[template].renders == 3
+
+    info.async_remove()
+    async_set_template_profiling(hass, False)
+
+
+async def test_track_template_result_refreshes_for_states_set_together(
+    hass: HomeAssistant,
+) -> None:
+    """Test states set together refresh a template right after their dispatch."""
+    runs = []
+    template = Template(
+        "{{ states('sensor.first') }} {{ states('sensor.second') }}", hass
+    )
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append((event and event.data["entity_id"], updates.pop().result))
+
+    listeners = hass.bus.async_listeners()
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set_many(
+        [("sensor.first", "1", None), ("sensor.second", "2", None)]
+    )
+    # The states are dispatched in the next iteration and the
+    # template is refreshed right after them
+    await asyncio.sleep(0)
+
+    assert runs == [("sensor.second", "1 2")]
+
+    info.async_remove()
+    assert hass.bus.async_listeners() == listeners
+
+
+async def test_track_template_result_removed_during_coalesced_refresh(
+    hass: HomeAssistant,
+) -> None:
+    """Test a tracker removed by another tracker of the same batch is not refreshed."""
+    runs = []
+    template = Template("{{ states('sensor.first') }}", hass)
+
+    @ha.callback
+    def first_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append("first")
+        second_info.async_remove()
+
+    @ha.callback
+    def second_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append("second")
+
+    first_info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], first_listener
+    )
+    second_info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], second_listener
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.first", "1")
+    hass.states.async_set("sensor.first", "2")
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+    hass.states.async_set("sensor.first", "3")
+    await hass.async_block_till_done()
+    assert runs == ["first", "first"]
+
+    first_info.async_remove()
+
+
+async def test_track_template_result_profiling(hass: HomeAssistant) -> None:
+    """Test profiling records render times and triggers of tracked templates."""
+    template = Template(
+        "{{ states('sensor.first') }} {{ states('sensor.second') }}", hass
+    )
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], ha.callback(lambda *_: None)
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.first", "1")
+    await hass.async_block_till_done()
+
+    # Nothing is recorded unless profiling
+    assert info.render_stats == {}
+    assert async_get_template_render_stats(hass) == []
+
+    async_set_template_profiling(hass, True)
+    hass.states.async_set("sensor.first", "2")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.second", "3")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.second", "4")
+    await hass.async_block_till_done()
+    async_set_template_profiling(hass, False)
+
+    stats = async_get_template_render_stats(hass)
+    assert len(stats) == 1
+    assert stats[0]["template"] == template.template
+    assert stats[0]["renders"] == 3
+    assert stats[0]["total_time"] > 0
+    assert stats[0]["median_time"] > 0
+    assert stats[0]["rate_limited"] == 0
+    assert stats[0]["triggers"] == {"sensor.second": 2, "sensor.first": 1}
+
+    hass.states.async_set("sensor.first", "5")
+    await hass.async_block_till_done()
+    assert async_get_template_render_stats(hass)[0]["renders"] == 3
+
+    info.async_remove()
+    assert async_get_template_render_stats(hass) == []
+
+
+async def test_track_template_result_coalesced_event_is_relevant(
+    hass: HomeAssistant,
+) -> None:
+    """Test coalesced state changes pass the event of a changed template."""
+    runs = []
+    template_first = Template("{{ states('sensor.first') }}", hass)
+    template_second = Template("{{ states('sensor.second') | int(0) > 5 }}", hass)
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(
+            (
+                event and event.data["entity_id"],
+                [update.template for update in updates],
+            )
+        )
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_first, None), TrackTemplate(template_second, None)],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+
+    # The result of the second template does not change
+    hass.states.async_set("sensor.first", "1")
+    hass.states.async_set("sensor.second", "2")
+    await hass.async_block_till_done()
+
+    assert runs == [("sensor.first", [template_first])]
+
+    info.async_remove()
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -4884,6 +5089,55 @@ async def test_async_track_device_registry_updated_event_with_a_callback_that_th
     assert event_data[0] == {"action": "create", "device_id": device_id}
 
 
+async def test_async_track_event_data(hass: HomeAssistant) -> None:
+    """Test tracking events by the value of a data field."""
+    calls = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        calls.append(event.data)
+
+    @ha.callback
+    def other_listener(event: ha.Event) -> None:
+        calls.append("other")
+
+    unsub_first = async_track_event_data(hass, "test", "device_id", "first", listener)
+    unsub_other = hass.bus.async_listen("test", other_listener)
+    unsub_second = async_track_event_data(
+        hass, "test", "device_id", ["second", "third"], listener
+    )
+    # A single bus listener dispatches the tracked events
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"device_id": "first"})
+    hass.bus.async_fire("test", {"device_id": "third"})
+    hass.bus.async_fire("test", {"device_id": "fourth"})
+    hass.bus.async_fire("test", {"device_id": ["unhashable"]})
+    hass.bus.async_fire("test", {"other": "first"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    # The tracked events are dispatched before the listener added after them
+    assert calls == [
+        {"device_id": "first"},
+        "other",
+        {"device_id": "third"},
+        "other",
+        "other",
+        "other",
+        "other",
+        "other",
+    ]
+
+    unsub_first()
+    unsub_second()
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+
+    with pytest.raises(HomeAssistantError):
+        async_track_event_data(hass, MATCH_ALL, "device_id", "first", listener)
+
+
 async def test_track_state_change_deprecated(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -4899,6 +5153,55 @@ async def test_track_state_change_deprecated(
     ) in caplog.text
 
 
+async def test_track_point_in_utc_time_shares_loop_timer(
+    hass: HomeAssistant,
+) -> None:
+    """Test point in time timers due in the same slot share a loop timer."""
+    runs = []
+
+    @ha.callback
+    def _run(utc_now: datetime) -> None:
+        runs.append(utc_now)
+
+    def _wheel_handles() -> list[asyncio.TimerHandle]:
+        return [
+            handle
+            for handle in get_scheduled_timer_handles(hass.loop)
+            if not handle.cancelled() and "_PointInTimeTimerWheel" in repr(handle)
+        ]
+
+    slot = int(dt_util.utcnow().timestamp() // TIMER_WHEEL_RESOLUTION) + 100
+    slot_start = dt_util.utc_from_timestamp(slot * TIMER_WHEEL_RESOLUTION)
+    first = slot_start + timedelta(seconds=TIMER_WHEEL_RESOLUTION / 4)
+    second = slot_start + timedelta(seconds=TIMER_WHEEL_RESOLUTION / 2)
+    third = slot_start + timedelta(seconds=5 + TIMER_WHEEL_RESOLUTION / 4)
+    fourth = slot_start + timedelta(seconds=5 + TIMER_WHEEL_RESOLUTION / 2)
+    later = slot_start + timedelta(seconds=10)
+    unsub_later = async_track_point_in_utc_time(hass, _run, later)
+    for point_in_time in (fourth, third, second, first):
+        async_track_point_in_utc_time(hass, _run, point_in_time)
+
+    assert len(_wheel_handles()) == 1
+
+    # The loop timer fires for the earliest timer of the slot
+    async_fire_time_changed(hass, first)
+    assert runs == [first]
+    async_fire_time_changed(hass, second)
+    assert runs == [first, second]
+    assert len(_wheel_handles()) == 1
+
+    # Timers which are due together fire in order of their due time
+    async_fire_time_changed(hass, fourth)
+    assert runs == [first, second, third, fourth]
+
+    # Cancelling the last timer drops it and the loop timer
+    unsub_later()
+    assert _wheel_handles() == []
+    assert not hass.data[_POINT_IN_TIME_TIMER_WHEEL]._slots
+    async_fire_time_changed(hass, later)
+    assert runs == [first, second, third, fourth]
+
+
 async def test_track_point_in_time_repr(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -0,0 +1,101 @@
+"""Test the event loop monitor."""
+
+import asyncio
+import threading
+import time
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers import loop_monitor
+
+
+def _monitor_threads() -> list[threading.Thread]:
+    return [thread for thread in threading.enumerate() if thread.name == "LoopMonitor"]
+
+
+async def test_loop_monitor_attributes_stalls(hass: HomeAssistant) -> None:
+    """Test stalls of the event loop are attributed to the running job."""
+    monitor = loop_monitor.async_get_loop_monitor(hass)
+    assert not monitor.running
+    assert _monitor_threads() == []
+
+    stalls: list[loop_monitor.LoopStall] = []
+    unsub = monitor.async_subscribe(stalls.append)
+    assert monitor.running
+    assert monitor.sampling
+
+    @callback
+    def _stall() -> None:
+        time.sleep(0.4)
+
+    await asyncio.sleep(0.2)
+    assert stalls == []
+
+    hass.async_run_hass_job(HassJob(_stall, "stalling job"))
+    await asyncio.sleep(0.2)
+
+    job = _stall.__qualname__
+    assert len(stalls) == 1
+    stall = stalls[0]
+    assert stall.duration >= 0.3
+    assert stall.owners.most_common(1)[0][0] == (None, job)
+    assert stall.as_dict()["owners"][0]["job"] == job
+
+    stats = monitor.stats.as_dict()
+    assert stats["stalls"] == 1
+    assert stats["max_lag"] >= 0.3
+    assert stats["owners"][0]["integration"] is None
+    assert stats["owners"][0]["job"] == job
+    assert stats["owners"][0]["blocked_time"] > 0
+    assert sum(bucket["count"] for bucket in stats["lag_histogram"]) > 2
+    assert stats["lag_histogram"][-1] == {"le": None, "count": 0}
+
+    # Sampling stops once the last subscriber is gone
+    unsub()
+    assert monitor.running
+    assert not monitor.sampling
+    await asyncio.sleep(0.1)
+    assert _monitor_threads() == []
+
+    monitor.async_stop()
+    assert not monitor.running
+
+
+async def test_loop_monitor_heartbeat_only(hass: HomeAssistant) -> None:
+    """Test the heartbeat counts stalls without sampling the event loop."""
+    monitor = loop_monitor.async_get_loop_monitor(hass)
+    monitor.async_start()
+    assert monitor.running
+    assert not monitor.sampling
+    assert _monitor_threads() == []
+
+    @callback
+    def _stall() -> None:
+        time.sleep(0.2)
+
+    await asyncio.sleep(0.1)
+    hass.async_run_hass_job(HassJob(_stall, "stalling job"))
+    await asyncio.sleep(0.1)
+
+    stats = monitor.stats.as_dict()
+    assert stats["stalls"] == 1
+    assert stats["max_lag"] >= 0.1
+    assert stats["owners"] == []
+    assert sum(bucket["count"] for bucket in stats["lag_histogram"]) > 1
+
+    monitor.async_stop()
+    assert not monitor.running
+
+
+async def test_loop_monitor_stops_at_close(hass: HomeAssistant) -> None:
+    """Test the event loop monitor stops when Home Assistant closes."""
+    monitor = loop_monitor.async_get_loop_monitor(hass)
+    monitor.async_subscribe(lambda stall: None)
+    assert monitor.running
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert not monitor.running
+    assert not monitor.sampling
+    await asyncio.sleep(0.1)
+    assert _monitor_threads() == []
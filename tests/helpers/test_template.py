@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -13,6 +15,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -1888,6 +1891,35 @@ def test_render_with_possible_json_value_and_dont_parse_result(
     assert isinstance(result, str)
 
 
+@pytest.mark.parametrize(
+    ("template_str", "expected"),
+    [
+        ("static", True),
+        ("{{ value }}", True),
+        ("{{ value_json.temperature | float(0) | round(1) }}", True),
+        ("{{ 'on' if value_json.state is defined else 'off' }}", True),
+        ("{% set total = value_json.values() | sum %}{{ total }}", True),
+        ("{% for item in value_json %}{{ loop.index }}{% endfor %}", True),
+        ("{{ value.split(',') | first | upper }}", True),
+        ("{{ states('sensor.test') }}", False),
+        ("{{ 'sensor.test' | states }}", False),
+        ("{{ value if 'sensor.test' is is_state('on') else 0 }}", False),
+        ("{{ now() }}", False),
+        ("{{ this.state }}", False),
+        ("{{ value | map('states') | list }}", False),
+        ("{% set now = now() %}{{ now }}", False),
+        ("{% from 'macros.jinja' import test %}{{ test(value) }}", False),
+        ("{{ value", False),
+    ],
+)
+def test_depends_only_on(
+    hass: HomeAssistant, template_str: str, expected: bool
+) -> None:
+    """Test detecting templates which only depend on their variables."""
+    tpl = template.Template(template_str, hass)
+    assert tpl.depends_only_on(("value", "value_json")) is expected
+
+
 def test_if_state_exists(hass: HomeAssistant) -> None:
     """Test if state exists works."""
     hass.states.async_set("test.object", "available")
@@ -6582,3 +6614,188 @@ async def test_merge_response_not_mutate_original_object(
 
     tpl = template.Template(_template, hass)
     assert tpl.async_render()
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test compiled templates are reused after a restart."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["stamp"] == template.BYTECODE_CACHE_STAMP
+    assert list(data["templates"]) == [
+        template.TemplateBytecodeCache.key("normal", "{{ 1 + 1 }}")
+    ]
+
+    # Simulate a restart, the template is not compiled again
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch("jinja2.Environment.compile", side_effect=AssertionError):
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    # Code compiled by another version is discarded
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]["stamp"] = "old"
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch("jinja2.Environment.compile", side_effect=AssertionError):
+        with pytest.raises(AssertionError):
+            template.Template("{{ 1 + 1 }}", hass).async_render()
+
+
+async def test_bytecode_cache_size(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the bytecode cache is limited by the size of the stored code."""
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    code = compile("1 + 1", "<template>", "eval")
+    entry_size = len(base64.b64encode(marshal.dumps(code)))
+
+    with patch.object(template, "BYTECODE_CACHE_MAX_BYTES", entry_size * 2):
+        bytecode_cache.set("one", code)
+        bytecode_cache.set("two", code)
+        # Reading an entry marks it as recently used
+        assert bytecode_cache.get("one") == code
+        bytecode_cache.set("three", code)
+
+    assert bytecode_cache.get("two") is None
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert list(data["templates"]) == ["one", "three"]
+    # The file is about the size of the stored code
+    assert len(json.dumps(data)) < entry_size * 2 + 200
+
+
+async def test_bytecode_cache_saved_only_when_entries_are_added(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the bytecode cache is not saved again for known templates."""
+    source = "{% for i in range(1, 3) %}{{ i }}{% endfor %}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == 12
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    # Simulate a restart, rendering the known template adds nothing
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    assert hass_storage.pop(template.BYTECODE_CACHE_STORAGE_KEY)
+    assert template.Template(source, hass).async_render() == 12
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert template.BYTECODE_CACHE_STORAGE_KEY not in hass_storage
+
+
+async def test_bytecode_cache_remembers_sources_without_fast_path(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test sources without a fast path are not analyzed again after a restart."""
+    source = "{% for i in range(1, 3) %}{{ i }}{% endfor %}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == 12
+
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["without_fast_path"] == [
+        template.TemplateBytecodeCache.key("normal", source)
+    ]
+
+    # Simulate a restart, the source is neither compiled nor parsed again
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with (
+        patch("jinja2.Environment.compile", side_effect=AssertionError),
+        patch.object(template._FastPathCompiler, "compile", side_effect=AssertionError),
+    ):
+        assert template.Template(source, hass).async_render() == 12
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') | float(0) * 2 }}",
+        "{{ is_state('binary_sensor.door', 'on') }}",
+        "{{ is_state('binary_sensor.door', ['on', 'open']) }}",
+        "{{ state_attr('sensor.power', 'unit') }}",
+        "{{ is_state_attr('sensor.power', 'unit', 'W') and has_value('sensor.x') }}",
+        "{{ 'on' if states('sensor.power') | int(0) > 2 else 'off' }}",
+        "{{ 0 < states('sensor.power') | float < 3 }}",
+        "Power: {{ -(states('sensor.power') | float) | round(1) }} W",
+        "{{ not is_state('sensor.missing', 'unknown') or float(1, default=0) }}",
+        "{{ states('sensor.missing') | float }}",
+    ],
+)
+async def test_fast_path_renders_like_jinja(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test simple templates are rendered by a fast path like by Jinja."""
+    hass.states.async_set("sensor.power", "2.54", {"unit": "W"})
+    hass.states.async_set("binary_sensor.door", "on")
+
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    assert tmp._fast_path is not None
+
+    jinja_tmp = template.Template(template_str, hass)
+    jinja_tmp._ensure_compiled()
+    jinja_tmp._fast_path = None
+    jinja_info = jinja_tmp.async_render_to_info()
+
+    assert repr(info.exception) == repr(jinja_info.exception)
+    if info.exception is None:
+        assert info.result() == jinja_info.result()
+    assert info.entities == jinja_info.entities
+    assert info.domains == jinja_info.domains
+    assert info.all_states == jinja_info.all_states
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{% if is_state('sensor.power', 'on') %}on{% endif %}",
+        "{{ states.sensor.power.state }}",
+        "{{ states('sensor.power') | float | multiply(2) }}",
+        "{{ states('sensor.power') ~ 'W' }}",
+        "{{ now() }}",
+        "{{ power }}",
+    ],
+)
+async def test_fast_path_not_used(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates outside of the fast path subset are rendered by Jinja."""
+    tmp = template.Template(template_str, hass)
+    tmp.async_render({"power": 1})
+    assert tmp._fast_path is None
+
+    limited = template.Template("{{ 1 + 1 }}", hass)
+    assert limited.async_render(limited=True) == 2
+    assert limited._fast_path is None
+
+
+async def test_fast_path_shadowed_by_variables(hass: HomeAssistant) -> None:
+    """Test variables shadowing the functions of a fast path are respected."""
+    hass.states.async_set("sensor.power", "2")
+    tmp = template.Template("{{ states('sensor.power') | int * 2 }}", hass)
+
+    assert tmp.async_render() == 4
+    assert tmp._fast_path is not None
+    assert tmp.async_render({"states": lambda entity_id: "3"}) == 6
+    assert tmp.async_render({"power": 1}) == 4
@@ -1100,6 +1100,29 @@ def test_state_as_compressed_state_unique_last_updated() -> None:
     assert state.as_compressed_state == expected
 
 
+async def test_state_attributes_json_fragment_shared(hass: HomeAssistant) -> None:
+    """Test unchanged attributes are only serialized once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    fragment = state.attributes_json_fragment
+    assert state.as_dict_json.startswith(
+        b'{"entity_id":"light.bowl","state":"on","attributes":{"brightness":100},'
+    )
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes is state.attributes
+    assert new_state.attributes_json_fragment is fragment
+    assert new_state.as_compressed_state_json.startswith(
+        b'"light.bowl":{"s":"off","a":{"brightness":100},'
+    )
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    newer_state = hass.states.get("light.bowl")
+    assert newer_state.attributes_json_fragment is not fragment
+    assert b'"attributes":{"brightness":50}' in newer_state.as_dict_json
+
+
 def test_state_as_compressed_state_json() -> None:
     """Test a State as a JSON compressed state."""
     last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
@@ -1169,6 +1192,104 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_batch_listener(hass: HomeAssistant) -> None:
+    """Test batch listeners receive the events fired in a batch together."""
+    batches = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        batches.append([event.data["value"] for event in events])
+
+    unsub = hass.bus.async_listen_batch("test", listener)
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"value": 1})
+    assert batches == [[1]]
+
+    with hass.bus.async_batch():
+        hass.bus.async_fire("test", {"value": 2})
+        with hass.bus.async_batch():
+            hass.bus.async_fire("test", {"value": 3})
+        hass.bus.async_fire("other", {"value": 4})
+        assert batches == [[1]]
+    assert batches == [[1], [2, 3]]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+    hass.bus.async_fire("test", {"value": 5})
+    assert batches == [[1], [2, 3]]
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch(MATCH_ALL, listener)
+
+
+async def test_statemachine_set_in_batch(hass: HomeAssistant) -> None:
+    """Test states set in a batch are delivered to batch listeners together."""
+    batches = []
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED,
+        ha.callback(
+            lambda batch: batches.append([event.data["entity_id"] for event in batch])
+        ),
+    )
+    hass.states.async_set("light.bowl", "off")
+
+    with hass.bus.async_batch():
+        hass.states.async_set("light.bowl", "on", {"brightness": 100})
+        hass.states.async_set("light.kitchen", "off")
+        assert batches == [["light.bowl"]]
+
+    assert batches == [["light.bowl"], ["light.bowl", "light.kitchen"]]
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.bowl",
+        "light.kitchen",
+    ]
+    state = hass.states.get("light.bowl")
+    assert state.state == "on"
+    assert state.attributes == {"brightness": 100}
+
+
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states delivers them to batch listeners together."""
+    batches = []
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED,
+        ha.callback(
+            lambda batch: batches.append([event.data["entity_id"] for event in batch])
+        ),
+    )
+    hass.states.async_set_many(
+        [
+            ("Light.Bowl", "on", {"brightness": 100}),
+            ("light.kitchen", "off", None),
+        ],
+        timestamp=1000.0,
+    )
+
+    assert batches == [["light.bowl", "light.kitchen"]]
+    state = hass.states.get("light.bowl")
+    assert state.state == "on"
+    assert state.attributes == {"brightness": 100}
+    assert state.last_updated_timestamp == 1000.0
+    assert hass.states.get("light.kitchen").last_updated_timestamp == 1000.0
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("invalid_entity", "off", None)]
+        )
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("light.kitchen", "x" * 256, None)]
+        )
+
+    # Nothing is set when an update is invalid
+    assert len(batches) == 1
+    assert hass.states.get("light.bowl").state == "on"
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1470,6 +1591,48 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_snapshots(hass: HomeAssistant) -> None:
+    """Test snapshots are shared until the entities or states change."""
+    states = hass.states
+    assert states.async_all_snapshot() == ()
+    assert states.async_entity_ids_snapshot("light") == ()
+
+    states.async_set("light.bowl", "on")
+    states.async_set("switch.ac", "off")
+    all_states = states.async_all_snapshot()
+    lights = states.async_all_snapshot("LIGHT")
+    switch_ids = states.async_entity_ids_snapshot("switch")
+    entity_ids = states.async_entity_ids_snapshot()
+    assert lights == (states.get("light.bowl"),)
+    assert switch_ids == ("switch.ac",)
+    assert entity_ids == ("light.bowl", "switch.ac")
+    assert states.async_all_snapshot() is all_states
+    assert states.async_all_snapshot("light") is lights
+
+    # Changing a state only replaces the state snapshots of its domain
+    states.async_set("light.bowl", "off")
+    assert states.async_all_snapshot("light") == (states.get("light.bowl"),)
+    assert states.async_all_snapshot() is not all_states
+    assert states.async_entity_ids_snapshot("switch") is switch_ids
+    assert states.async_entity_ids_snapshot() is entity_ids
+
+    # Adding and removing entities replaces the entity id snapshots
+    states.async_set("light.kitchen", "on")
+    assert states.async_entity_ids_snapshot("switch") is switch_ids
+    assert states.async_entity_ids_snapshot() == (
+        "light.bowl",
+        "switch.ac",
+        "light.kitchen",
+    )
+    states.async_remove("switch.ac")
+    assert states.async_entity_ids_snapshot("switch") == ()
+    assert states.async_entity_ids_snapshot() == ("light.bowl", "light.kitchen")
+    assert [state.entity_id for state in states.async_all_snapshot()] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})